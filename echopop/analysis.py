@@ -22,8 +22,21 @@ from .biology import (
     reallocate_kriged_age1,
     weight_proportions,
 )
-from .spatial.krige import kriging
-from .spatial.mesh import crop_mesh, mesh_to_transects, stratify_mesh
+from .spatial.krige import (
+    kriging,
+    kriging_cross_validation,
+    multiresolution_kriging,
+    validate_resolution_level,
+)
+from .spatial.mesh import (
+    coarsen_mesh,
+    crop_mesh,
+    load_cached_mesh,
+    mesh_cache_key,
+    mesh_to_transects,
+    save_cached_mesh,
+    stratify_mesh,
+)
 from .spatial.projection import transform_geometry
 from .spatial.transect import (
     edit_transect_columns,
@@ -32,10 +45,13 @@ from .spatial.transect import (
     transect_spatial_features,
 )
 from .spatial.variogram import (
+    compare_variogram_models,
     empirical_variogram,
+    get_variogram_models,
     initialize_initial_optimization_values,
     initialize_optimization_config,
     initialize_variogram_parameters,
+    multistart_optimize_variogram,
     optimize_variogram,
 )
 from .statistics import stratified_transect_statistic
@@ -267,31 +283,43 @@ def stratified_summary(
     return stratified_results, analysis_dict
 
 
-def variogram_analysis(
+def compute_empirical_variogram(
     variogram_parameters: dict,
-    default_variogram_parameters: dict,
-    optimization_parameters: dict,
-    initialize_variogram: dict,
     transect_dict: dict,
     settings_dict: dict,
     isobath_df: pd.DataFrame,
 ):
+    """
+    Prepare the transect data and compute the empirical variogram
 
-    # Validate the relevant empirical variogram parameters
-    empirical_variogram_params = VariogramEmpirical.create(**settings_dict)
-
-    # Initialize and validate the variogram model parameters
-    valid_variogram_params = initialize_variogram_parameters(
-        variogram_parameters, default_variogram_parameters
-    )
-
-    # Initialize and validate the optimization parameters
-    valid_optimization_params = initialize_optimization_config(optimization_parameters)
+    Parameters
+    ----------
+    variogram_parameters: dict
+        Dictionary containing the validated variogram model parameters and empirical variogram
+        settings (e.g. `n_lags`, `lag_resolution`, `azimuth_range`, and `force_lag_zero`).
+    transect_dict: dict
+        A dictionary containing the processed transect data.
+    settings_dict: dict
+        Dictionary that contains all of the analysis settings that detail specific algorithm
+        arguments and user-defined inputs.
+    isobath_df: pd.DataFrame
+        Reference grid (200 m isobath) used for standardizing the transect coordinates.
 
-    # Initialize and validate the initial values/boundary inputs
-    valid_initial_values = initialize_initial_optimization_values(
-        initialize_variogram, valid_variogram_params
-    )
+    Returns
+    ----------
+    lags: np.ndarray[float]
+        Lag distance array.
+    gamma_h: np.ndarray[float]
+        Semivariance array.
+    lag_counts: np.ndarray[float]
+        An array containing the number of point pairs per lag bin.
+    lag_covariance: float
+        The summed covariance between the head and tail points computed for all transect data.
+
+    Notes
+    ----------
+    See :func:`echopop.spatial.variogram.empirical_variogram` for more details.
+    """
 
     # Prepare the transect data
     # ---- Create a copy of the transect dictionary
@@ -317,8 +345,53 @@ def variogram_analysis(
         transect_data["y"] = "latitude"
 
     # Compute the empirical variogram
-    lags, gamma_h, lag_counts, _ = empirical_variogram(
-        transect_data, {**valid_variogram_params, **empirical_variogram_params}, settings_dict
+    return empirical_variogram(transect_data, variogram_parameters, settings_dict)
+
+
+def variogram_analysis(
+    variogram_parameters: dict,
+    default_variogram_parameters: dict,
+    optimization_parameters: dict,
+    initialize_variogram: dict,
+    transect_dict: dict,
+    settings_dict: dict,
+    isobath_df: pd.DataFrame,
+):
+
+    # Validate the relevant empirical variogram parameters
+    empirical_variogram_params = VariogramEmpirical.create(**settings_dict)
+
+    # Initialize and validate the variogram model parameters
+    valid_variogram_params = initialize_variogram_parameters(
+        variogram_parameters, default_variogram_parameters
+    )
+
+    # Initialize and validate the optimization parameters
+    valid_optimization_params = initialize_optimization_config(optimization_parameters)
+
+    # Initialize and validate the initial values/boundary inputs
+    valid_initial_values = initialize_initial_optimization_values(
+        initialize_variogram, valid_variogram_params
+    )
+
+    # Determine whether the parameters are optimized from multiple starting points
+    multistart = settings_dict.get("n_starts", 1) != 1 or settings_dict.get("global_search", False)
+    # ---- Warn when the multistart arguments have no effect
+    ignored_arguments = [
+        name for name in ["n_workers", "random_state"] if settings_dict.get(name) is not None
+    ]
+    if not multistart and ignored_arguments:
+        warnings.warn(
+            f"The argument(s) {', '.join(f'`{name}`' for name in ignored_arguments)} only apply "
+            f"when `n_starts > 1` or `global_search=True` and are ignored."
+        )
+
+    # Compute the empirical variogram
+    lags, gamma_h, lag_counts, _ = compute_empirical_variogram(
+        {**valid_variogram_params, **empirical_variogram_params},
+        transect_dict,
+        settings_dict,
+        isobath_df,
     )
 
     # Least-squares fitting
@@ -327,10 +400,26 @@ def variogram_analysis(
         "parameters": valid_initial_values,
         "config": valid_optimization_params,
     }
+    # ---- Optimize parameters from multiple starting points, if requested
+    if multistart:
+        best_fit_variogram, initial_fit, optimized_fit, solutions = multistart_optimize_variogram(
+            lag_counts,
+            lags,
+            gamma_h,
+            optimization_settings,
+            n_starts=settings_dict.get("n_starts", 1),
+            n_workers=settings_dict.get("n_workers"),
+            global_search=settings_dict.get("global_search", False),
+            random_state=settings_dict.get("random_state"),
+            **valid_variogram_params,
+        )
     # ---- Optimize parameters
-    best_fit_variogram, initial_fit, optimized_fit = optimize_variogram(
-        lag_counts, lags, gamma_h, optimization_settings, **valid_variogram_params
-    )
+    else:
+        best_fit_variogram, initial_fit, optimized_fit = optimize_variogram(
+            lag_counts, lags, gamma_h, optimization_settings, **valid_variogram_params
+        )
+        # ---- No additional starting points
+        solutions = None
 
     # Return a dictionary of results
     return {
@@ -343,9 +432,88 @@ def variogram_analysis(
             "parameters": dict(zip(optimized_fit[0], optimized_fit[1])),
             "MAD": optimized_fit[2],
         },
+        "multistart": solutions,
     }
 
 
+def variogram_model_comparison(
+    variogram_parameters: dict,
+    default_variogram_parameters: dict,
+    optimization_parameters: dict,
+    initialize_variogram: dict,
+    transect_dict: dict,
+    settings_dict: dict,
+    isobath_df: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Compute the empirical variogram once and fit and rank multiple variogram models
+
+    Parameters
+    ----------
+    variogram_parameters: dict
+        User-defined variogram model parameters that override the defaults.
+    default_variogram_parameters: dict
+        Default variogram model parameters imported from the configuration files.
+    optimization_parameters: dict
+        User-defined arguments for optimizing the variogram fits via non-linear least squares.
+    initialize_variogram: dict
+        A dictionary or list of the variogram parameters that are optimized along with their
+        initial values and bounds.
+    transect_dict: dict
+        A dictionary containing the processed transect data.
+    settings_dict: dict
+        Dictionary that contains all of the analysis settings that detail specific algorithm
+        arguments and user-defined inputs, including the 'models' to compare, the number of worker
+        processes ('n_workers'), and the ranking metric ('rank_by').
+    isobath_df: pd.DataFrame
+        Reference grid (200 m isobath) used for standardizing the transect coordinates.
+
+    Returns
+    ----------
+    comparison: pd.DataFrame
+        A dataframe with one row per model that includes its rank, the weighted mean absolute
+        deviation (MAD), the Akaike (AIC) and Bayesian (BIC) information criteria, and the
+        optimized parameter values (see :func:`echopop.spatial.variogram.compare_variogram_models`).
+    """
+
+    # Validate the relevant empirical variogram parameters
+    empirical_variogram_params = VariogramEmpirical.create(**settings_dict)
+
+    # Get and validate the models
+    models = get_variogram_models(settings_dict["models"])
+
+    # Initialize and validate the variogram model parameters
+    # ---- The empirical variogram does not depend on the model, so the first one is used
+    valid_variogram_params = initialize_variogram_parameters(
+        {**variogram_parameters, "model": models[0]}, default_variogram_parameters
+    )
+
+    # Initialize and validate the optimization parameters
+    valid_optimization_params = initialize_optimization_config(optimization_parameters)
+
+    # Compute the empirical variogram
+    lags, gamma_h, lag_counts, _ = compute_empirical_variogram(
+        {**valid_variogram_params, **empirical_variogram_params},
+        transect_dict,
+        settings_dict,
+        isobath_df,
+    )
+
+    # Fit and rank the models
+    return compare_variogram_models(
+        lag_counts,
+        lags,
+        gamma_h,
+        variogram_parameters,
+        default_variogram_parameters,
+        initialize_variogram,
+        valid_optimization_params,
+        models=models,
+        n_workers=settings_dict.get("n_workers"),
+        rank_by=settings_dict.get("rank_by", "AIC"),
+    )
+
+
 def krige(input_dict: dict, analysis_dict: dict, settings_dict: dict) -> tuple[pd.DataFrame, dict]:
     """
     Interpolate spatial data using ordinary kriging.
@@ -404,8 +572,25 @@ def krige(input_dict: dict, analysis_dict: dict, settings_dict: dict) -> tuple[p
         },
     )
 
+    # Load the cropped and standardized mesh from the cache, if available
+    # ---- Get the cache settings
+    mesh_cache = settings_dict.get("mesh_cache") or {}
+    # ---- Compute the cache key
+    cache_key = (
+        mesh_cache_key(mesh_data, transect_data, isobath_data, settings_dict)
+        if mesh_cache.get("directory") is not None
+        else None
+    )
+    # ---- Load
+    mesh_full = load_cached_mesh(mesh_cache["directory"], cache_key) if cache_key else None
+    # ---- Flag whether the mesh has to be computed
+    compute_mesh = mesh_full is None
+    if settings_dict["verbose"] and cache_key and not compute_mesh:
+        # ---- Print alert
+        print("Cropped and standardized kriging mesh loaded from the cache.")
+
     # Crop the mesh grid if the kriged data will not be extrapolated
-    if settings_dict["extrapolate"]:
+    if compute_mesh and settings_dict["extrapolate"]:
         # ---- Else, extract original mesh dataframe
         mesh_df = mesh_data.copy()
         # ---- Extract longitude column name
@@ -416,7 +601,7 @@ def krige(input_dict: dict, analysis_dict: dict, settings_dict: dict) -> tuple[p
         mesh_full = mesh_df.copy().rename(
             columns={f"{mesh_longitude}": "longitude", f"{mesh_latitude}": "latitude"}
         )
-    else:
+    elif compute_mesh:
         # ---- Compute the cropped mesh
         mesh_full = crop_mesh(transect_data, mesh_data, validated_cropping_methods)
         if (settings_dict["verbose"]) and (
@@ -433,7 +618,8 @@ def krige(input_dict: dict, analysis_dict: dict, settings_dict: dict) -> tuple[p
         # ---- Transform transect data geometry (generate standardized x- and y-coordinates)
         transect_data, d_x, d_y = transform_geometry(transect_data, isobath_data, settings_dict)
         # ---- Transform mesh grid geometry (generate standardized x- and y-coordinates)
-        mesh_full, _, _ = transform_geometry(mesh_full, isobath_data, settings_dict, d_x, d_y)
+        if compute_mesh:
+            mesh_full, _, _ = transform_geometry(mesh_full, isobath_data, settings_dict, d_x, d_y)
         if settings_dict["verbose"]:
             # ---- Print alert
             print(
@@ -447,17 +633,88 @@ def krige(input_dict: dict, analysis_dict: dict, settings_dict: dict) -> tuple[p
         # -------- y
         transect_data["y"] = transect_data["latitude"]
         # ---- Duplicate the mesh grid longitude and latitude coordinates as 'x' and 'y'
-        # -------- x
-        mesh_full["x"] = mesh_full["longitude"]
-        # -------- y
-        mesh_full["y"] = mesh_full["latitude"]
+        if compute_mesh:
+            # -------- x
+            mesh_full["x"] = mesh_full["longitude"]
+            # -------- y
+            mesh_full["y"] = mesh_full["latitude"]
+
+    # Write the cropped and standardized mesh to the cache
+    if cache_key and compute_mesh:
+        save_cached_mesh(mesh_cache["directory"], cache_key, mesh_full, mesh_cache.get("max_size"))
+
+    # Select the resolution level of the kriging mesh
+    # ---- Get the level
+    resolution_level = settings_dict.get("resolution_level", 0)
+    validate_resolution_level(resolution_level)
+    # ---- Check whether the coarse level is refined at full resolution
+    refine_mesh = resolution_level > 0 and bool(settings_dict.get("refinement"))
+    # ---- Aggregate the mesh to the coarse level (the full-resolution mesh is kept for refinement)
+    if resolution_level > 0 and not refine_mesh:
+        coarse_mesh = coarsen_mesh(mesh_full, 2**resolution_level, settings_dict["projection"])
+        mesh_full = coarse_mesh["mesh_df"]
+        if settings_dict["verbose"]:
+            # ---- Print alert
+            print(
+                f"Kriging mesh aggregated to resolution level {resolution_level} "
+                f"({coarse_mesh['factor']}x coarser; {len(mesh_full)} mesh nodes)."
+            )
+
+    # Get the kriging weight operator of the previous run for incremental updates
+    previous_weight_operator = analysis_dict.get("kriging", {}).get("weight_operator")
+    # ---- Only reuse weights computed at the same resolution level
+    if not settings_dict.get("incremental", False) or (
+        previous_weight_operator is not None
+        and previous_weight_operator.get("resolution_level", 0) != resolution_level
+    ):
+        previous_weight_operator = None
+
     # --- Append to the analysis attribute
     analysis_dict.update({"kriging": {"mesh_df": mesh_full, "transect_df": transect_data}})
 
     # Kriged results
-    kriged_results = kriging(
-        analysis_dict["kriging"]["transect_df"], analysis_dict["kriging"]["mesh_df"], settings_dict
+    # ---- Interpolate all of the requested variables with the same kriging weights
+    kriging_settings = (
+        {**settings_dict, "variable": settings_dict["variables"]}
+        if len(settings_dict.get("variables", [])) > 1
+        else settings_dict
     )
+    # ---- Reuse the previous kriging weights, and store the updated weights for the next run
+    if settings_dict.get("incremental", False):
+        kriging_settings = {
+            **kriging_settings,
+            "previous_weight_operator": previous_weight_operator,
+            "return_weights": True,
+        }
+    # ---- Scale the mesh cell area to the coarse cells
+    if resolution_level > 0 and not refine_mesh:
+        kriging_settings = {
+            **kriging_settings,
+            "kriging_parameters": {
+                **kriging_settings["kriging_parameters"],
+                "A0": kriging_settings["kriging_parameters"]["A0"] * coarse_mesh["factor"] ** 2,
+            },
+        }
+    # ---- Run kriging
+    if refine_mesh:
+        # ---- Krige the coarse level and refine it at full resolution
+        kriged_results = multiresolution_kriging(
+            analysis_dict["kriging"]["transect_df"],
+            analysis_dict["kriging"]["mesh_df"],
+            kriging_settings,
+        )
+    else:
+        kriged_results = kriging(
+            analysis_dict["kriging"]["transect_df"],
+            analysis_dict["kriging"]["mesh_df"],
+            kriging_settings,
+        )
+
+    # Store the reusable kriging weight operator, if requested
+    if "weight_operator" in kriged_results:
+        analysis_dict["kriging"].update({"weight_operator": kriged_results.pop("weight_operator")})
+        # ---- Tag the resolution level of the weights
+        analysis_dict["kriging"]["weight_operator"]["resolution_level"] = resolution_level
 
     # Stratified the kriging mesh
     kriged_results["mesh_results_df"] = stratify_mesh(
@@ -468,6 +725,65 @@ def krige(input_dict: dict, analysis_dict: dict, settings_dict: dict) -> tuple[p
     return kriged_results, analysis_dict
 
 
+def cross_validate_kriging(input_dict: dict, analysis_dict: dict, settings_dict: dict) -> dict:
+    """
+    Compute the leave-one-out cross-validation errors of ordinary kriging along each transect.
+
+    Parameters
+    ----------
+    input_dict: dict
+        A dictionary containing the loaded survey data.
+    analysis_dict: dict
+        A dictionary containing processed biological and transect data.
+    settings_dict: dict
+        Dictionary that contains all of the analysis settings that detail specific algorithm
+        arguments and user-defined inputs.
+    """
+
+    # Validate the variogram parameters
+    valid_variogram_parameters = VariogramBase.create(**settings_dict["variogram_parameters"])
+    # ---- Update the dictionary
+    settings_dict["variogram_parameters"].update({**valid_variogram_parameters})
+
+    # Validate kriging parameters
+    valid_kriging_parameters = KrigingParameterInputs.create(
+        **{**settings_dict["kriging_parameters"], **settings_dict["variogram_parameters"]}
+    )
+
+    # Validate the additional kriging arguments
+    _ = KrigingAnalysis(**settings_dict["variogram_parameters"])
+
+    # Extract the reference grid (200 m isobath)
+    isobath_data = input_dict["statistics"]["kriging"]["isobath_200m_df"]
+
+    # Define the and prepare the processed and georeferenced transect data
+    transect_data = edit_transect_columns(analysis_dict["transect"], settings_dict)
+
+    # Add kriging parameters to the settings config
+    settings_dict.update(
+        {
+            "kriging_parameters": {
+                **input_dict["statistics"]["kriging"]["model_config"],
+                **valid_kriging_parameters,
+            },
+        },
+    )
+
+    # Standardize the x- and y-coordinates, if necessary
+    if settings_dict["standardize_coordinates"]:
+        # ---- Transform transect data geometry (generate standardized x- and y-coordinates)
+        transect_data, _, _ = transform_geometry(transect_data, isobath_data, settings_dict)
+    else:
+        # ---- Else, duplicate the transect longitude and latitude coordinates as 'x' and 'y'
+        # -------- x
+        transect_data["x"] = transect_data["longitude"]
+        # -------- y
+        transect_data["y"] = transect_data["latitude"]
+
+    # Compute the leave-one-out errors and return the results
+    return kriging_cross_validation(transect_data, settings_dict)
+
+
 def apportion_kriged_values(
     analysis_dict: dict, kriged_mesh: pd.DataFrame, settings_dict: dict
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
@@ -10,12 +10,12 @@ from IPython.display import clear_output, display
 from matplotlib.patches import Patch
 
 from ..spatial.variogram import (
+    compile_variogram,
     empirical_variogram,
     get_variogram_arguments,
     initialize_initial_optimization_values,
     initialize_optimization_config,
     optimize_variogram,
-    variogram,
 )
 from ..utils.validate_dict import (
     VariogramBase,
@@ -378,7 +378,7 @@ def compute_theoretical_variogram(lags: np.ndarray, parameters: dict):
     }
 
     # Compute variogram
-    return variogram(lags, arg_dict)
+    return compile_variogram(arg_dict)(lags)
 
 
 def plot_theoretical_variogram(fig, ax, empirical_params: dict, parameters: dict):
@@ -663,7 +663,7 @@ def optimize_variogram_widgets(
         best_fit_parameters_copy.update({"model": model_def})
 
         # Compute variogram
-        return variogram(lags, best_fit_parameters_copy)
+        return compile_variogram(best_fit_parameters_copy)(lags)
 
     def plot_optimal_variogram(fig, ax, best_fit_variogram, empirical_params, model):
 
@@ -1,148 +1,1597 @@
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Callable, Literal, Optional
+
 import numpy as np
 import pandas as pd
-
-from ..spatial.mesh import griddify_lag_distances
+from scipy import sparse
+from scipy.spatial import cKDTree
+
+from ..spatial.mesh import (
+    block_neighbor_gradient,
+    coarsen_mesh,
+    griddify_lag_distances,
+    mesh_resolution,
+)
 from ..spatial.transect import define_western_extent
-from ..spatial.variogram import variogram
+from ..spatial.variogram import compile_variogram
 
 
 def kriging(transect_data: pd.DataFrame, mesh_data: pd.DataFrame, settings_dict: dict):
     """
-    Use kriging to interoplate data
+    Use kriging to interoplate data
+
+    Parameters
+    ----------
+    transect_data: pd.DataFrame
+        Dataframe including georeferenced data
+    mesh_data: pd.DataFrame
+        Grid data that has been transformed
+    settings_dict: dict
+        Kriging and variogram model parameters, which include the optional entries:
+
+        - 'variable': a single column name or a list of column names. When a list is provided,
+          every variable is interpolated with the same kriging weights.
+        - 'solver': the linear solver used to compute the kriging weights ('svd', 'lu', or 'auto';
+          see :func:`batch_kriging_lambda`).
+        - 'precision': the working precision of the kriging weights ('float64' or 'float32'; see
+          :func:`krige_mesh_nodes`).
+        - 'chunk_size': the maximum number of mesh nodes kriged at once (see
+          :func:`kriging_iter`).
+        - 'previous_weight_operator': the weight operator of a previous run (see
+          :func:`update_kriging_weights`).
+        - 'block_points': the number of points (e.g. 4, 9, or 16) used to discretize each mesh
+          cell for block kriging (see :func:`block_discretization`).
+        - 'return_weights': when `True`, the weight operator is added to the results.
+
+    Notes
+    ----------
+    When multiple variables are interpolated, the first variable populates the default result
+    columns (e.g. 'kriged_mean') and each variable adds its own '{variable}_kriged_mean',
+    '{variable}_sample_variance', and '{variable}_sample_cv' columns.
+
+    In single precision, a 'precision_report' (see :func:`kriging_precision_report`) that compares
+    the survey estimate and CV against a float64 reference is added to the results.
+
+    When a previous weight operator is supplied, only the mesh nodes affected by the transect
+    intervals appended since that run are re-solved. Every mesh node is re-solved when the weights
+    were computed with different settings (see :func:`kriging_weight_settings`), and the operator
+    is discarded when it was computed with a different block kriging support.
+
+    When 'block_points' is defined, each mesh cell is block-kriged over a regular discretization
+    instead of being point-kriged at its centroid.
+    """
+
+    # Validate the working precision
+    precision = settings_dict.get("precision", "float64")
+    validate_kriging_precision(precision)
+
+    # Extract biological variable values
+    variable_names, variable_data, multiple_variables = kriging_variables(
+        transect_data, settings_dict
+    )
+
+    # Calculate the western extent of the transect data
+    western_extent = define_western_extent(transect_data)
+
+    # Discretize the mesh cells once for block kriging (shared by all tiles and re-solved nodes)
+    settings_dict = prepare_block_discretization(mesh_data, settings_dict)
+    block_points = settings_dict.get("block_points")
+
+    # Get the weight operator of the previous run (only reused for the same kriging support)
+    previous_weight_operator = settings_dict.get("previous_weight_operator")
+    if (
+        previous_weight_operator is not None
+        and previous_weight_operator.get("block_points") != block_points
+    ):
+        previous_weight_operator = None
+
+    # Ordinary kriging
+    if previous_weight_operator is not None:
+        # ---- Only re-solve the mesh nodes affected by appended transect intervals
+        weight_operator = update_kriging_weights(
+            transect_data,
+            mesh_data,
+            western_extent,
+            settings_dict,
+            previous_weight_operator,
+        )
+        # ---- Alert message (if verbose = True)
+        if settings_dict.get("verbose", False):
+            print(
+                f"Incremental kriging update: {len(weight_operator['updated_nodes'])} of "
+                f"{len(mesh_data)} mesh nodes re-solved."
+            )
+    elif settings_dict.get("n_workers") is not None:
+        # ---- Distribute spatial tiles of the mesh across a pool of worker processes
+        weight_operator = parallel_kriging(transect_data, mesh_data, western_extent, settings_dict)
+    else:
+        # ---- The mesh is streamed in chunks below
+        weight_operator = None
+
+    # Interpolate every variable at the mesh nodes
+    if weight_operator is None:
+        # ---- Keep the weights of each chunk only when they are returned or re-used
+        retain_weights = settings_dict.get("return_weights", False) or precision == "float32"
+        # ---- Initialize the lists of mesh node results and weight operators for each chunk
+        mesh_frames, chunk_operators = [], []
+        # ---- Krige each chunk
+        for mesh_frame in kriging_iter(
+            transect_data,
+            mesh_data,
+            settings_dict,
+            settings_dict.get("chunk_size"),
+            chunk_operators,
+        ):
+            mesh_frames.append(mesh_frame)
+            # ---- Release the chunk weights
+            if not retain_weights:
+                chunk_operators[-1] = {"solver_counts": chunk_operators[-1]["solver_counts"]}
+        # ---- Combine the chunks
+        mesh_results = pd.concat(mesh_frames)
+        weight_operator = (
+            concatenate_weight_operators(chunk_operators)
+            if retain_weights
+            else {
+                "solver_counts": {
+                    path: sum([op["solver_counts"][path] for op in chunk_operators])
+                    for path in ["lu", "svd"]
+                }
+            }
+        )
+    else:
+        # ---- Apply the weights to every variable (n_mesh, 3, n_variables)
+        mesh_results = kriged_mesh_frame(
+            mesh_data,
+            apply_kriging_weights(weight_operator, variable_data),
+            variable_names,
+            settings_dict["kriging_parameters"]["A0"] * mesh_data["fraction_cell_in_polygon"],
+            multiple_variables,
+        )
+    # ---- Alert message (if verbose = True)
+    if settings_dict.get("verbose", False) and settings_dict.get("solver", "svd") == "auto":
+        print(
+            f"Kriging systems solved via LU decomposition: "
+            f"{weight_operator['solver_counts']['lu']}; via truncated SVD (near-singular): "
+            f"{weight_operator['solver_counts']['svd']}."
+        )
+    # ---- Store the kriging support, mesh node labels, transect coordinates, western extent, and
+    # ---- the settings that determine the weights for incremental updates
+    weight_operator.update(
+        {
+            "block_points": block_points,
+            "mesh_index": mesh_data.index.to_numpy(),
+            "transect_coordinates": transect_data[["x", "y"]].to_numpy(dtype=float),
+            "western_extent": western_extent,
+            "weight_settings": kriging_weight_settings(settings_dict),
+        }
+    )
+
+    # Compile the survey-wide results
+    survey_results = kriged_mesh_results(
+        mesh_results, variable_data, variable_names, multiple_variables
+    )
+    # ---- Add the reduced-precision accuracy report, if relevant
+    if precision == "float32":
+        survey_results["precision_report"] = kriging_precision_report(
+            transect_data,
+            mesh_data,
+            western_extent,
+            settings_dict,
+            weight_operator,
+            variable_data[:, 0],
+            mesh_results["area"].to_numpy(),
+        )
+        # ---- Alert message (if verbose = True)
+        if settings_dict.get("verbose", False):
+            print(
+                f"Float32 kriging accuracy ({survey_results['precision_report']['n_nodes']} "
+                f"sampled mesh nodes): survey estimate relative error = "
+                f"{survey_results['precision_report']['survey_estimate']['relative_error']:.2e}; "
+                f"survey CV relative error = "
+                f"{survey_results['precision_report']['survey_cv']['relative_error']:.2e}."
+            )
+    # ---- Add the kriging weight operator, if requested
+    if settings_dict.get("return_weights", False):
+        survey_results["weight_operator"] = weight_operator
+    # ---- Return output
+    return survey_results
+
+
+def kriging_iter(
+    transect_data: pd.DataFrame,
+    mesh_data: pd.DataFrame,
+    settings_dict: dict,
+    chunk_size: Optional[int] = None,
+    weight_operators: Optional[list] = None,
+):
+    """
+    Krige the mesh in consecutive chunks and yield the mesh node results of each chunk
+
+    Parameters
+    ----------
+    transect_data: pd.DataFrame
+        Dataframe including georeferenced data
+    mesh_data: pd.DataFrame
+        Grid data that has been transformed
+    settings_dict: dict
+        Kriging and variogram model parameters (see :func:`kriging`).
+    chunk_size: Optional[int]
+        The maximum number of mesh nodes kriged at once. Defaults to `None`, where the entire
+        mesh is kriged as a single chunk.
+    weight_operators: Optional[list]
+        An optional list that the kriging weight operator (see :func:`batch_kriging_weights`) of
+        each chunk is appended to.
+
+    Yields
+    ----------
+    mesh_results: pd.DataFrame
+        The mesh node results of each chunk (see :func:`kriged_mesh_frame`) in the original mesh
+        order. The 'sample_cv' columns depend on the survey-wide estimate and are therefore only
+        added once every chunk has been kriged (see :func:`kriged_mesh_results`).
+
+    Notes
+    ----------
+    The neighbor distances and indices, the adaptive search radius arrays, the lagged
+    semivariograms, and the stacked kriging matrices are only computed for the current chunk, so
+    their memory is bounded by `chunk_size * k_max` rather than by the size of the mesh. The
+    KD-tree over the transect coordinates is built once and queried for each chunk.
+    """
+
+    # Extract biological variable values
+    variable_names, variable_data, multiple_variables = kriging_variables(
+        transect_data, settings_dict
+    )
+
+    # Calculate the western extent of the transect data
+    western_extent = define_western_extent(transect_data)
+
+    # Discretize the mesh cells once for block kriging
+    settings_dict = prepare_block_discretization(mesh_data, settings_dict)
+
+    # Get the chunk size
+    chunk_size = max(len(mesh_data), 1) if chunk_size is None else chunk_size
+    # ---- Validate
+    if (
+        not isinstance(chunk_size, (int, np.integer))
+        or isinstance(chunk_size, bool)
+        or chunk_size < 1
+    ):
+        raise ValueError(f"Argument `chunk_size` must be a positive integer. Got: {chunk_size}.")
+    # ---- Only print the extrapolation alerts when the mesh is kriged as a single chunk
+    chunk_settings = (
+        settings_dict if chunk_size >= len(mesh_data) else {**settings_dict, "verbose": False}
+    )
+
+    # Build the spatial index over the transect coordinates once
+    neighbor_search = settings_dict.get("neighbor_search", "kdtree")
+    transect_tree = (
+        cKDTree(transect_data[["x", "y"]].to_numpy()) if neighbor_search == "kdtree" else None
+    )
+    # ---- Extract the transect coordinates
+    x_coordinates = transect_data["x"].to_numpy()
+    y_coordinates = transect_data["y"].to_numpy()
+
+    # Iterate through the chunks
+    for start in range(0, len(mesh_data), chunk_size):
+        # ---- Index the chunk
+        mesh_chunk = mesh_data.iloc[start : start + chunk_size]
+        # ---- Find the k-nearest transect intervals for each mesh point
+        local_points, local_indices = search_nearest_neighbors(
+            transect_data,
+            mesh_chunk,
+            settings_dict["kriging_parameters"]["kmax"],
+            neighbor_search,
+            transect_tree,
+        )
+        # ---- Compute the kriging weights of each mesh node
+        weight_operator = krige_mesh_nodes(
+            local_points,
+            local_indices,
+            mesh_chunk,
+            western_extent,
+            chunk_settings,
+            x_coordinates,
+            y_coordinates,
+        )
+        # ---- Store the weight operator, if requested
+        if weight_operators is not None:
+            weight_operators.append(weight_operator)
+        # ---- Interpolate every variable at the mesh nodes (n_chunk, 3, n_variables)
+        kriged_values = apply_kriging_weights(weight_operator, variable_data)
+        # ---- Yield the mesh node results
+        yield kriged_mesh_frame(
+            mesh_chunk,
+            kriged_values,
+            variable_names,
+            settings_dict["kriging_parameters"]["A0"] * mesh_chunk["fraction_cell_in_polygon"],
+            multiple_variables,
+        )
+
+
+def kriging_variables(transect_data: pd.DataFrame, settings_dict: dict):
+    """
+    Extract the transect values of the kriged variable(s)
+
+    Parameters
+    ----------
+    transect_data: pd.DataFrame
+        Dataframe including georeferenced data
+    settings_dict: dict
+        Kriging and variogram model parameters, where the 'variable' entry can either be a single
+        column name or a list of column names.
+
+    Returns
+    ----------
+    variable_names: list
+        The name of each interpolated variable.
+    variable_data: np.ndarray
+        The transect values (n_transect, n_variables) of each interpolated variable.
+    multiple_variables: bool
+        Whether a list of variables was requested.
+    """
+
+    # Define the variable name(s)
+    variable_names = settings_dict["variable"]
+    # ---- Check whether multiple variables are interpolated
+    multiple_variables = not isinstance(variable_names, str)
+    # ---- Format as a list
+    variable_names = list(variable_names) if multiple_variables else [variable_names]
+
+    # Return output with the extracted array (n_transect, n_variables)
+    return (
+        variable_names,
+        transect_data[variable_names].to_numpy(dtype=float),
+        multiple_variables,
+    )
+
+
+def prepare_block_discretization(mesh_data: pd.DataFrame, settings_dict: dict):
+    """
+    Add the mesh cell discretization to the settings when block kriging is requested
+
+    Parameters
+    ----------
+    mesh_data: pd.DataFrame
+        Grid data that has been transformed
+    settings_dict: dict
+        Kriging and variogram model parameters, where the 'block_points' entry defines the number
+        of discretization points per mesh cell.
+
+    Returns
+    ----------
+    settings_dict: dict
+        The settings with a 'block_discretization' entry (see :func:`block_discretization`), or
+        the input settings when point kriging is used or the discretization is already defined.
+    """
+
+    # Point kriging or precomputed discretization
+    if (
+        settings_dict.get("block_points") is None
+        or settings_dict.get("block_discretization") is not None
+    ):
+        return settings_dict
+
+    # Return a copy of the settings with the discretization
+    return {
+        **settings_dict,
+        "block_discretization": block_discretization(
+            mesh_data, settings_dict["block_points"], settings_dict["variogram_parameters"]
+        ),
+    }
+
+
+def kriged_mesh_frame(
+    mesh_data: pd.DataFrame,
+    kriged_values: np.ndarray,
+    variable_names: list,
+    area: pd.Series,
+    multiple_variables: bool = False,
+):
+    """
+    Compile the mesh node results of kriged values
+
+    Parameters
+    ----------
+    mesh_data: pd.DataFrame
+        Grid data that has been transformed
+    kriged_values: np.ndarray
+        An array (n_mesh, 3, n_variables) of kriged values (see :func:`apply_kriging_weights`).
+    variable_names: list
+        The name of each interpolated variable. The first variable populates the default result
+        columns (e.g. 'kriged_mean').
+    area: pd.Series
+        The area of each mesh node.
+    multiple_variables: bool
+        When True, the results for each variable are added to the mesh node results.
+
+    Returns
+    ----------
+    mesh_results: pd.DataFrame
+        The mesh node results without the 'sample_cv' columns, which require the survey-wide
+        estimate (see :func:`kriged_mesh_results`).
+    """
+
+    # Initialize without the mesh cell fractions and coordinates
+    mesh_results = mesh_data.drop(columns=mesh_data.filter(regex="^(fraction|x|y)").columns)
+    # ---- Add area
+    mesh_results["area"] = area
+    # ---- Add the kriged variable
+    mesh_results["kriged_mean"] = kriged_values[:, 0, 0]
+    # ---- Add the kriged variance
+    mesh_results["kriged_variance"] = kriged_values[:, 1, 0]
+    # ---- Add the sample variance
+    mesh_results["sample_variance"] = kriged_values[:, 2, 0]
+    # ---- Add the absolute kriged value (i.e. not normalized by area)
+    mesh_results["biomass"] = kriged_values[:, 0, 0] * area
+    # ---- Add the results for each variable
+    if multiple_variables:
+        for i, name in enumerate(variable_names):
+            mesh_results[f"{name}_kriged_mean"] = kriged_values[:, 0, i]
+            mesh_results[f"{name}_sample_variance"] = kriged_values[:, 2, i]
+
+    # Return output
+    return mesh_results
+
+
+def kriged_mesh_results(
+    mesh_results: pd.DataFrame,
+    variable_data: np.ndarray,
+    variable_names: list,
+    multiple_variables: bool = False,
+):
+    """
+    Compile the survey-wide results of the kriged mesh nodes
+
+    Parameters
+    ----------
+    mesh_results: pd.DataFrame
+        The mesh node results (see :func:`kriged_mesh_frame`), which are updated in-place with the
+        'sample_cv' columns.
+    variable_data: np.ndarray
+        The transect values (n_transect, n_variables) of each interpolated variable.
+    variable_names: list
+        The name of each interpolated variable. The first variable populates the default result
+        columns (e.g. 'kriged_mean').
+    multiple_variables: bool
+        When True, the results for each variable are added to the mesh node results and the
+        'variables' entry of the survey-wide results.
+    """
+
+    # Gather the kriged values (n_mesh, 3, n_variables)
+    column_prefixes = [f"{name}_" for name in variable_names] if multiple_variables else [""]
+    kriged_values = np.stack(
+        [
+            np.column_stack(
+                [
+                    mesh_results[f"{prefix}kriged_mean"].to_numpy(dtype=float),
+                    mesh_results["kriged_variance"].to_numpy(dtype=float),
+                    mesh_results[f"{prefix}sample_variance"].to_numpy(dtype=float),
+                ]
+            )
+            for prefix in column_prefixes
+        ],
+        axis=2,
+    )
+
+    # Compute the coefficients of variation (CV)
+    # ---- Compute the global/survey variance
+    survey_variance = np.var(variable_data, axis=0)
+    # ---- Compute the survey estimate and CVs
+    survey_estimate, survey_CV, mesh_CV = kriged_survey_statistics(
+        kriged_values, mesh_results["area"].to_numpy(), survey_variance
+    )
+
+    # Compile the results
+    # ---- Add the sample CV
+    mesh_results.insert(
+        mesh_results.columns.get_loc("sample_variance") + 1, "sample_cv", mesh_CV[:, 0]
+    )
+    # ---- Add the sample CV of each variable
+    if multiple_variables:
+        for i, name in enumerate(variable_names):
+            mesh_results.insert(
+                mesh_results.columns.get_loc(f"{name}_sample_variance") + 1,
+                f"{name}_sample_cv",
+                mesh_CV[:, i],
+            )
+    # ---- Create dictionary with survey-wide kriged results
+    survey_results = {
+        "variable": variable_names[0],
+        "survey_mean": kriged_values[:, 0, 0].mean(),
+        "survey_estimate": survey_estimate[0],
+        "survey_cv": survey_CV[0],
+        "mesh_results_df": mesh_results,
+    }
+    # ---- Add the survey-wide results for each variable
+    if multiple_variables:
+        survey_results["variables"] = {
+            name: {
+                "survey_mean": kriged_values[:, 0, i].mean(),
+                "survey_estimate": survey_estimate[i],
+                "survey_cv": survey_CV[i],
+            }
+            for i, name in enumerate(variable_names)
+        }
+
+    # Return output
+    return survey_results
+
+
+def concatenate_weight_operators(weight_operators: list, mesh_order: Optional[np.ndarray] = None):
+    """
+    Combine the kriging weight operators of consecutive mesh chunks or tiles
+
+    Parameters
+    ----------
+    weight_operators: list
+        The kriging weight operators (see :func:`batch_kriging_weights`) of each chunk.
+    mesh_order: Optional[np.ndarray]
+        An optional array that reorders the concatenated mesh nodes (e.g. to restore the original
+        mesh order of spatial tiles).
+
+    Returns
+    ----------
+    weight_operator: dict
+        The kriging weight operator of every mesh node.
+    """
+
+    # Concatenate the operators
+    weight_operator = {
+        "weights": sparse.vstack([op["weights"] for op in weight_operators], format="csr"),
+        "kriged_variance": np.concatenate([op["kriged_variance"] for op in weight_operators]),
+        "neighbor_counts": np.concatenate([op["neighbor_counts"] for op in weight_operators]),
+        "solver_counts": {
+            path: sum([op["solver_counts"][path] for op in weight_operators])
+            for path in ["lu", "svd"]
+        },
+    }
+
+    # Reorder the mesh nodes, if requested
+    if mesh_order is not None:
+        for key in ["weights", "kriged_variance", "neighbor_counts"]:
+            weight_operator[key] = weight_operator[key][mesh_order]
+
+    # Return output
+    return weight_operator
+
+
+def multiresolution_kriging(
+    transect_data: pd.DataFrame, mesh_data: pd.DataFrame, settings_dict: dict
+):
+    """
+    Krige a coarsened level of the mesh and re-krige at full resolution only where the coarse
+    kriged variance or gradient exceeds a threshold
+
+    Parameters
+    ----------
+    transect_data: pd.DataFrame
+        Dataframe including georeferenced data
+    mesh_data: pd.DataFrame
+        Grid data that has been transformed
+    settings_dict: dict
+        Kriging and variogram model parameters (see :func:`kriging`). The 'resolution_level' entry
+        defines the coarse level (see :func:`echopop.spatial.mesh.coarsen_mesh`) and the
+        'refinement' entry contains the 'kriged_variance' and/or 'gradient' thresholds. A coarse
+        cell is refined when its kriged variance or the largest absolute difference between its
+        kriged mean and those of its adjacent cells exceeds the respective threshold.
+
+    Returns
+    ----------
+    survey_results: dict
+        The kriged results at full resolution (see :func:`kriging`) with an additional
+        'refinement' summary. The mesh nodes within cells that were not refined inherit the kriged
+        values of their coarse cell.
+    """
+
+    # Extract the refinement settings
+    # ---- Resolution level
+    resolution_level = settings_dict["resolution_level"]
+    validate_resolution_level(resolution_level)
+    # ---- Thresholds
+    thresholds = settings_dict.get("refinement") or {}
+
+    # Extract biological variable values
+    variable_names, variable_data, multiple_variables = kriging_variables(
+        transect_data, settings_dict
+    )
+
+    # Aggregate the coarse mesh
+    coarse_mesh = coarsen_mesh(
+        mesh_data, 2**resolution_level, settings_dict.get("projection", "epsg:4326")
+    )
+
+    # Settings shared by the coarse and full-resolution passes
+    pass_settings = {
+        **settings_dict,
+        "block_discretization": None,
+        "previous_weight_operator": None,
+        "return_weights": True,
+        "verbose": False,
+    }
+
+    # Krige the coarse mesh
+    # ---- Scale the mesh cell area to the coarse cells
+    coarse_settings = {
+        **pass_settings,
+        "kriging_parameters": {
+            **settings_dict["kriging_parameters"],
+            "A0": settings_dict["kriging_parameters"]["A0"] * coarse_mesh["factor"] ** 2,
+        },
+    }
+    # ---- Run kriging
+    coarse_results = kriging(transect_data, coarse_mesh["mesh_df"], coarse_settings)
+    # ---- Interpolate every variable at the coarse mesh nodes (n_coarse, 3, n_variables)
+    coarse_values = apply_kriging_weights(coarse_results["weight_operator"], variable_data)
+
+    # Flag the coarse cells that are refined
+    refined_cells = np.zeros(len(coarse_values), dtype=bool)
+    # ---- Kriged variance
+    if thresholds.get("kriged_variance") is not None:
+        refined_cells |= coarse_values[:, 1, 0] > thresholds["kriged_variance"]
+    # ---- Gradient
+    if thresholds.get("gradient") is not None:
+        refined_cells |= (
+            block_neighbor_gradient(coarse_values[:, 0, 0], coarse_mesh["block_index"])
+            > thresholds["gradient"]
+        )
+    # ---- Map to the full-resolution mesh nodes
+    refined_nodes = refined_cells[coarse_mesh["parent_index"]]
+
+    # Populate the full-resolution mesh with the kriged values of each coarse cell
+    kriged_values = coarse_values[coarse_mesh["parent_index"]]
+    # ---- Re-krige the refined mesh nodes at full resolution
+    if refined_nodes.any():
+        # ---- Discretize the cells of the entire mesh for block kriging, if requested
+        if settings_dict.get("block_points") is not None:
+            pass_settings["block_discretization"] = block_discretization(
+                mesh_data, settings_dict["block_points"], settings_dict["variogram_parameters"]
+            )
+        # ---- Run kriging
+        refined_results = kriging(transect_data, mesh_data[refined_nodes], pass_settings)
+        kriged_values[refined_nodes] = apply_kriging_weights(
+            refined_results["weight_operator"], variable_data
+        )
+    else:
+        refined_results = coarse_results
+
+    # Compute the area of each mesh node
+    area = settings_dict["kriging_parameters"]["A0"] * mesh_data["fraction_cell_in_polygon"]
+
+    # Compile the mesh node and survey-wide results
+    survey_results = kriged_mesh_results(
+        kriged_mesh_frame(mesh_data, kriged_values, variable_names, area, multiple_variables),
+        variable_data,
+        variable_names,
+        multiple_variables,
+    )
+    # ---- Flag the refined mesh nodes
+    survey_results["mesh_results_df"]["refined"] = refined_nodes
+    # ---- Summarize the refinement
+    survey_results["refinement"] = {
+        "resolution_level": resolution_level,
+        "n_coarse_nodes": len(refined_cells),
+        "n_refined_coarse_nodes": int(refined_cells.sum()),
+        "n_refined_nodes": int(refined_nodes.sum()),
+        "n_nodes": len(refined_nodes),
+    }
+    # ---- Add the reduced-precision accuracy report, if relevant
+    if "precision_report" in refined_results:
+        survey_results["precision_report"] = refined_results["precision_report"]
+    # ---- Alert message (if verbose = True)
+    if settings_dict.get("verbose", False):
+        print(
+            f"Multi-resolution kriging: {survey_results['refinement']['n_refined_coarse_nodes']} "
+            f"of {len(refined_cells)} coarse mesh nodes (level {resolution_level}) refined "
+            f"({survey_results['refinement']['n_refined_nodes']} of {len(refined_nodes)} mesh "
+            f"nodes re-kriged at full resolution)."
+        )
+
+    # Return output
+    return survey_results
+
+
+def kriging_weight_settings(settings_dict: dict) -> dict:
+    """
+    Extract the settings that determine the kriging weights
+
+    Parameters
+    ----------
+    settings_dict: dict
+        Kriging and variogram model parameters (see :func:`kriging`).
+
+    Returns
+    ----------
+    weight_settings: dict
+        A dictionary with the variogram model parameters ('variogram_parameters'), the neighbor
+        search and anisotropy parameters ('kriging_parameters'), the linear solver ('solver'), and
+        the working precision ('precision').
+    """
+
+    return {
+        "variogram_parameters": {**settings_dict["variogram_parameters"]},
+        "kriging_parameters": {
+            key: settings_dict["kriging_parameters"].get(key)
+            for key in ["kmin", "kmax", "search_radius", "anisotropy"]
+        },
+        "solver": settings_dict.get("solver", "svd"),
+        "precision": settings_dict.get("precision", "float64"),
+    }
+
+
+def matching_weight_settings(previous_settings: Optional[dict], settings: dict) -> bool:
+    """
+    Check whether two sets of kriging weight settings (see :func:`kriging_weight_settings`) are
+    identical
+
+    Parameters
+    ----------
+    previous_settings: Optional[dict]
+        The weight settings of a previous run.
+    settings: dict
+        The weight settings of the current run.
+    """
+
+    # Settings are unknown
+    if previous_settings is None:
+        return False
+
+    # Serialize the settings so that array-like and scalar values are compared by value
+    return json.dumps(
+        previous_settings, sort_keys=True, default=lambda value: np.asarray(value).tolist()
+    ) == json.dumps(settings, sort_keys=True, default=lambda value: np.asarray(value).tolist())
+
+
+def update_kriging_weights(
+    transect_data: pd.DataFrame,
+    mesh_data: pd.DataFrame,
+    western_extent: pd.DataFrame,
+    settings_dict: dict,
+    previous_operator: dict,
+):
+    """
+    Update the kriging weights of a previous run after transect intervals have been appended
+
+    Parameters
+    ----------
+    transect_data: pd.DataFrame
+        Dataframe including georeferenced data. The transect intervals of the previous run must
+        comprise the leading rows in their original order, followed by the appended intervals.
+    mesh_data: pd.DataFrame
+        Kriging mesh.
+    western_extent: pd.DataFrame
+        Coordinates of the western extent of transect lines.
+    settings_dict: dict
+        Kriging and variogram model parameters
+    previous_operator: dict
+        The kriging weight operator of the previous run (see :func:`kriging`), which includes the
+        mesh node labels ('mesh_index'), transect coordinates ('transect_coordinates'), western
+        extent ('western_extent'), and the settings that determine the weights
+        ('weight_settings', see :func:`kriging_weight_settings`).
+
+    Returns
+    ----------
+    weight_operator: dict
+        The updated kriging weight operator (see :func:`batch_kriging_weights`) with the positional
+        indices of the re-solved mesh nodes ('updated_nodes'). The 'solver_counts' only include
+        the re-solved kriging systems.
+
+    Notes
+    ----------
+    A mesh node is re-solved when:
+
+    - it was not part of the previous mesh (e.g. the mesh was cropped differently),
+    - an appended transect interval is among its `k_max` nearest neighbors, which is the only way
+      its neighborhood can change since intervals are only added,
+    - an appended transect interval falls within the search radius, or
+    - it requires extrapolation (fewer than `k_min` neighbors within the search radius) and the
+      western extent of the transects has changed.
+
+    The weights of all other mesh nodes are reused from the previous run. Every mesh node is
+    re-solved when the variogram model parameters, the `kmin`, `kmax`, `search_radius`, or
+    `anisotropy` kriging parameters, the linear solver, or the working precision differ from
+    those of the previous run, or when the coordinates of the previous transect intervals have
+    changed.
+
+    When the coordinates are standardized (e.g. `coordinate_transform=True` in
+    :func:`echopop.survey.Survey.kriging_analysis`), appended intervals that widen the transect
+    extent change the reference used to standardize every coordinate (see
+    :func:`echopop.spatial.projection.transform_geometry`). This forces a full recompute, so the
+    incremental update only saves work when the appended intervals fall within the existing
+    extent.
+    """
+
+    # Extract key search radius parameters
+    # ---- k_min
+    k_min = settings_dict["kriging_parameters"]["kmin"]
+    # ---- search radius
+    search_radius = settings_dict["kriging_parameters"]["search_radius"]
+
+    # Get the previous number of transect intervals
+    n_previous = previous_operator["weights"].shape[1]
+
+    # Check whether the previous weights can be reused
+    # ---- The previous transect intervals must be retained as the leading rows
+    transect_coordinates = transect_data[["x", "y"]].to_numpy(dtype=float)
+    previous_coordinates = previous_operator.get("transect_coordinates")
+    reusable = (
+        previous_coordinates is not None
+        and n_previous <= len(transect_coordinates)
+        and np.array_equal(previous_coordinates, transect_coordinates[:n_previous])
+    )
+    # ---- The weights must have been computed with the same settings
+    reusable &= matching_weight_settings(
+        previous_operator.get("weight_settings"), kriging_weight_settings(settings_dict)
+    )
+
+    # Map the mesh nodes to the previous mesh
+    previous_position = pd.Index(previous_operator["mesh_index"]).get_indexer(mesh_data.index)
+
+    # Find the k-nearest transect intervals for each mesh point
+    local_points, local_indices = search_nearest_neighbors(
+        transect_data,
+        mesh_data,
+        settings_dict["kriging_parameters"]["kmax"],
+        settings_dict.get("neighbor_search", "kdtree"),
+    )
+
+    # Re-solve every mesh node if the previous weights cannot be reused
+    if not reusable:
+        # ---- Compute the kriging weights
+        weight_operator = krige_mesh_nodes(
+            local_points,
+            local_indices,
+            mesh_data,
+            western_extent,
+            settings_dict,
+            transect_coordinates[:, 0],
+            transect_coordinates[:, 1],
+        )
+        # ---- Return output
+        return {**weight_operator, "updated_nodes": np.arange(len(mesh_data))}
+
+    # Identify the mesh nodes that have to be re-solved
+    # ---- New mesh nodes
+    changed = previous_position < 0
+    # ---- Mesh nodes whose k-nearest neighbors include appended intervals
+    changed |= np.any(local_indices >= n_previous, axis=1)
+    # ---- Mesh nodes within the search radius of appended intervals
+    if len(transect_data) > n_previous:
+        appended_tree = cKDTree(transect_coordinates[n_previous:])
+        appended_distance, _ = appended_tree.query(mesh_data[["x", "y"]].to_numpy(), k=1)
+        changed |= appended_distance <= search_radius
+    # ---- Extrapolated mesh nodes when the western extent has changed
+    previous_western_extent = previous_operator.get("western_extent")
+    if previous_western_extent is None or not previous_western_extent.equals(western_extent):
+        changed |= np.count_nonzero(local_points <= search_radius, axis=1) < k_min
+    # ---- Get the positional indices
+    updated_nodes = np.flatnonzero(changed)
+
+    # Compute the kriging weights of the affected mesh nodes
+    updated_operator = krige_mesh_nodes(
+        local_points[updated_nodes],
+        local_indices[updated_nodes],
+        mesh_data.iloc[updated_nodes],
+        western_extent,
+        settings_dict,
+        transect_coordinates[:, 0],
+        transect_coordinates[:, 1],
+    )
+
+    # Merge the previous and updated weights
+    # ---- Expand the previous weights to include the appended transect intervals
+    previous_weights = previous_operator["weights"]
+    previous_weights = sparse.csr_matrix(
+        (previous_weights.data, previous_weights.indices, previous_weights.indptr),
+        shape=(previous_weights.shape[0], len(transect_data)),
+    )
+    # ---- Map each mesh node to a row of the stacked previous and updated weights
+    row_map = previous_position.copy()
+    row_map[updated_nodes] = previous_weights.shape[0] + np.arange(len(updated_nodes))
+
+    # Return output
+    return {
+        "weights": sparse.vstack([previous_weights, updated_operator["weights"]], format="csr")[
+            row_map
+        ],
+        "kriged_variance": np.concatenate(
+            [previous_operator["kriged_variance"], updated_operator["kriged_variance"]]
+        )[row_map],
+        "neighbor_counts": np.concatenate(
+            [previous_operator["neighbor_counts"], updated_operator["neighbor_counts"]]
+        )[row_map],
+        "solver_counts": updated_operator["solver_counts"],
+        "updated_nodes": updated_nodes,
+    }
+
+
+def kriged_survey_statistics(
+    kriged_values: np.ndarray, area: np.ndarray, survey_variance: np.ndarray
+):
+    """
+    Compute the survey-wide estimate and coefficients of variation (CV) of kriged values
+
+    Parameters
+    ----------
+    kriged_values: np.ndarray
+        An array (n_mesh, 3, n_variables) of kriged values (see :func:`apply_kriging_weights`).
+    area: np.ndarray
+        The area (n_mesh,) of each mesh node.
+    survey_variance: np.ndarray
+        The global/survey variance (n_variables,) of each variable.
+
+    Returns
+    ----------
+    survey_estimate: np.ndarray
+        The integrated variable (n_variables,) when distributed over area.
+    survey_CV: np.ndarray
+        The global/survey CV (n_variables,).
+    mesh_CV: np.ndarray
+        The georeferenced CV (n_mesh, n_variables) at each mesh node.
+    """
+
+    # Distribute biological variable over area
+    survey_estimate = np.nansum(kriged_values[:, 0] * area[:, np.newaxis], axis=0)
+
+    # Compute the georeferenced CV at each mesh node
+    mesh_CV = (
+        area.mean()
+        * np.sqrt(kriged_values[:, 1] * survey_variance)
+        / survey_estimate
+        * np.sqrt(len(kriged_values))
+    )
+
+    # Compute the global/survey CV
+    survey_CV = (
+        np.sqrt(np.nansum(kriged_values[:, 1] * area[:, np.newaxis] ** 2, axis=0) * survey_variance)
+        / survey_estimate
+    )
+
+    # Return output
+    return survey_estimate, survey_CV, mesh_CV
+
+
+def kriging_precision_report(
+    transect_data: pd.DataFrame,
+    mesh_data: pd.DataFrame,
+    western_extent: pd.DataFrame,
+    settings_dict: dict,
+    weight_operator: dict,
+    variable_data: np.ndarray,
+    area: np.ndarray,
+):
+    """
+    Compare reduced-precision kriging results against a float64 reference computed over a random
+    subset of mesh nodes
+
+    Parameters
+    ----------
+    transect_data: pd.DataFrame
+        Dataframe including georeferenced data
+    mesh_data: pd.DataFrame
+        Kriging mesh.
+    western_extent: pd.DataFrame
+        Coordinates of the western extent of transect lines.
+    settings_dict: dict
+        Kriging and variogram model parameters. The 'precision_sample_size' entry sets the maximum
+        number of sampled mesh nodes (default: 1000).
+    weight_operator: dict
+        The reduced-precision kriging weight operator (see :func:`batch_kriging_weights`).
+    variable_data: np.ndarray
+        The transect data (n_transect,) that is interpolated.
+    area: np.ndarray
+        The area (n_mesh,) of each mesh node.
+
+    Returns
+    ----------
+    precision_report: dict
+        A dictionary with the number of sampled mesh nodes ('n_nodes'), the maximum absolute
+        difference between the kriging weights ('max_weight_error'), and the 'survey_estimate' and
+        'survey_cv' of the sampled mesh nodes. The latter two are dictionaries with the reduced-
+        precision value ('float32'), the float64 reference ('float64'), and the relative error
+        ('relative_error').
+    """
+
+    # Sample the mesh nodes
+    # ---- Get the sample size
+    sample_size = min(settings_dict.get("precision_sample_size", 1000), len(mesh_data))
+    # ---- Draw the sample
+    sample = np.sort(np.random.default_rng(0).choice(len(mesh_data), sample_size, replace=False))
+    # ---- Index the sampled mesh nodes
+    mesh_sample = mesh_data.iloc[sample]
+
+    # Compute the float64 reference weights of the sampled mesh nodes
+    # ---- Find the k-nearest transect intervals for each sampled mesh point
+    local_points, local_indices = search_nearest_neighbors(
+        transect_data,
+        mesh_sample,
+        settings_dict["kriging_parameters"]["kmax"],
+        settings_dict.get("neighbor_search", "kdtree"),
+    )
+    # ---- Compute the kriging weights
+    reference_operator = krige_mesh_nodes(
+        local_points,
+        local_indices,
+        mesh_sample,
+        western_extent,
+        {**settings_dict, "precision": "float64", "verbose": False},
+        transect_data["x"].to_numpy(),
+        transect_data["y"].to_numpy(),
+    )
+
+    # Subset the reduced-precision weights
+    sample_operator = {
+        "weights": weight_operator["weights"][sample],
+        "kriged_variance": weight_operator["kriged_variance"][sample],
+        "neighbor_counts": weight_operator["neighbor_counts"][sample],
+    }
+
+    # Compute the survey statistics of the sampled mesh nodes
+    # ---- Compute the global/survey variance
+    survey_variance = np.var(variable_data, keepdims=True)
+    # ---- Reduced precision
+    estimate, cv, _ = kriged_survey_statistics(
+        apply_kriging_weights(sample_operator, variable_data)[..., np.newaxis],
+        area[sample],
+        survey_variance,
+    )
+    # ---- Reference
+    reference_estimate, reference_cv, _ = kriged_survey_statistics(
+        apply_kriging_weights(reference_operator, variable_data)[..., np.newaxis],
+        area[sample],
+        survey_variance,
+    )
+
+    # Return output
+    return {
+        "n_nodes": sample_size,
+        "max_weight_error": (
+            np.abs(sample_operator["weights"] - reference_operator["weights"]).max()
+            if sample_size > 0
+            else 0.0
+        ),
+        "survey_estimate": {
+            "float32": estimate[0],
+            "float64": reference_estimate[0],
+            "relative_error": np.abs(estimate[0] / reference_estimate[0] - 1.0),
+        },
+        "survey_cv": {
+            "float32": cv[0],
+            "float64": reference_cv[0],
+            "relative_error": np.abs(cv[0] / reference_cv[0] - 1.0),
+        },
+    }
+
+
+def krige_mesh_nodes(
+    local_points: np.ndarray,
+    local_indices: np.ndarray,
+    mesh_data: pd.DataFrame,
+    western_extent: pd.DataFrame,
+    settings_dict: dict,
+    x_coordinates: np.ndarray,
+    y_coordinates: np.ndarray,
+):
+    """
+    Compute the ordinary kriging weights for a set of mesh nodes
+
+    Parameters
+    ----------
+    local_points: np.ndarray
+        The sorted distances (n_mesh, k_max) between each mesh node and its nearest transect
+        intervals.
+    local_indices: np.ndarray
+        The transect interval indices that correspond to `local_points`.
+    mesh_data: pd.DataFrame
+        Kriging mesh.
+    western_extent: pd.DataFrame
+        Coordinates of the western extent of transect lines.
+    settings_dict: dict
+        Kriging and variogram model parameters
+    x_coordinates: np.array
+        The transect x-axis coordinates
+    y_coordinates: np.array
+        The transect y-axis coordinates
+
+    Returns
+    ----------
+    weight_operator: dict
+        The kriging weight operator (see :func:`batch_kriging_weights`).
+
+    Notes
+    ----------
+    When the 'precision' entry of `settings_dict` is 'float32', the neighbor distances, transect
+    coordinates, lagged semivariograms, and kriging matrices are all computed and solved in single
+    precision. The kriging weights and kriged variance are then stored as float64 so that the
+    interpolated values are accumulated in double precision.
+
+    When `settings_dict` contains a 'block_discretization' entry (see
+    :func:`block_discretization`), the mesh nodes are block-kriged: the lagged semivariogram is
+    averaged over the discretization points of each mesh cell (see
+    :func:`block_average_variogram`) and the mean within-cell semivariogram is subtracted from the
+    kriged variance, which is clipped at 0.0. The kriging matrices and batched solver are the same
+    as for point kriging.
+    """
+
+    # Cast the neighbor distances and transect coordinates to the working precision
+    dtype = np.dtype(settings_dict.get("precision", "float64"))
+    # ---- Distances
+    local_points = local_points.astype(dtype, copy=False)
+    # ---- x-coordinates
+    x_coordinates = np.asarray(x_coordinates, dtype=dtype)
+    # ---- y-coordinates
+    y_coordinates = np.asarray(y_coordinates, dtype=dtype)
+
+    # Get the mesh cell discretization (block kriging)
+    discretization = settings_dict.get("block_discretization")
+
+    # Run the adaptive search window to identify which points have to be re-weighted to account
+    # for extrapolation
+    range_grid, inside_indices, outside_indices, outside_weights = adaptive_search_radius(
+        local_points, local_indices, mesh_data, western_extent, settings_dict
+    )
+
+    # Initialize the lagged semivariogram buffer
+    local_variogram_M2 = np.empty((range_grid.shape[0], range_grid.shape[1] + 1), dtype=dtype)
+
+    # Calculate the lagged semivariogram (M20) over all mesh nodes at once
+    # ---- NaN-padded ranges propagate as NaN
+    if discretization is not None:
+        # ---- Average the semivariogram over the discretized mesh cells (block kriging)
+        local_variogram_M2[:, :-1] = block_average_variogram(
+            mesh_data["x"].to_numpy(dtype=dtype),
+            mesh_data["y"].to_numpy(dtype=dtype),
+            x_coordinates[local_indices[:, : range_grid.shape[1]]],
+            y_coordinates[local_indices[:, : range_grid.shape[1]]],
+            range_grid,
+            discretization["offsets"].astype(dtype, copy=False),
+            compile_variogram(settings_dict["variogram_parameters"]),
+        )
+    else:
+        local_variogram_M2[:, :-1] = compile_variogram(settings_dict["variogram_parameters"])(
+            range_grid
+        )
+
+    # Append 1.0 for the ordinary kriging assumptions (M2)
+    local_variogram_M2[:, -1] = 1.0
+    # ---- Sort in-place (NaN values are sorted last)
+    local_variogram_M2.sort(axis=1)
+
+    # Ordinary kriging
+    # ---- Mesh nodes are grouped by their number of neighbors and solved as a batch
+    weight_operator = batch_kriging_weights(
+        inside_indices,
+        outside_indices,
+        outside_weights,
+        local_variogram_M2,
+        range_grid,
+        settings_dict["kriging_parameters"],
+        settings_dict["variogram_parameters"],
+        x_coordinates,
+        y_coordinates,
+        settings_dict.get("solver", "svd"),
+    )
+    # ---- Subtract the within-cell semivariogram from the block kriging variance
+    if discretization is not None:
+        # ---- Round-off and truncated solves can push the difference below 0.0, so it is clipped
+        # ---- (mesh nodes without neighbors remain NaN)
+        weight_operator["kriged_variance"] = np.maximum(
+            weight_operator["kriged_variance"] - discretization["block_variance"], 0.0
+        )
+
+    # Return output
+    return weight_operator
+
+
+def block_discretization(mesh_data: pd.DataFrame, block_points: int, variogram_parameters: dict):
+    """
+    Discretize the kriging mesh cells for block kriging
+
+    Parameters
+    ----------
+    mesh_data: pd.DataFrame
+        Kriging mesh with x- and y-coordinates.
+    block_points: int
+        The number of discretization points within each cell. This must be a square number
+        (e.g. 4, 9, or 16) so that each cell is discretized by a regular grid.
+    variogram_parameters: dict
+        Variogram model parameters.
+
+    Returns
+    ----------
+    discretization: dict
+        A dictionary with the keys:
+
+        - 'offsets': the offsets (block_points, 2) of the discretization points relative to the
+          cell centroid.
+        - 'block_variance': the mean semivariogram between all pairs of discretization points
+          within a cell.
+        - 'cell_size': the width and height of each cell.
+
+    Notes
+    ----------
+    All cells share the same shape, which is estimated from the spacing between adjacent mesh
+    nodes (see :func:`echopop.spatial.mesh.mesh_resolution`). The discretization and the
+    within-cell semivariogram are therefore computed once per mesh.
+    """
+
+    # Validate the number of discretization points
+    validate_block_points(block_points)
+
+    # Estimate the cell size
+    cell_width, cell_height = mesh_resolution(mesh_data, ("x", "y"))
+
+    # Place the discretization points at the centers of a regular sub-grid
+    # ---- Points along each axis
+    n_axis = int(round(np.sqrt(block_points)))
+    # ---- Relative positions
+    positions = (np.arange(n_axis) + 0.5) / n_axis - 0.5
+    # ---- Offsets
+    offsets = np.column_stack(
+        [
+            np.tile(positions * cell_width, n_axis),
+            np.repeat(positions * cell_height, n_axis),
+        ]
+    )
+
+    # Compute the mean semivariogram within a cell
+    # ---- Pairwise distances
+    point_distances = np.sqrt(((offsets[:, np.newaxis, :] - offsets[np.newaxis, :, :]) ** 2).sum(2))
+    # ---- Semivariogram (the semivariogram of each point with itself is 0.0)
+    point_variogram = compile_variogram(variogram_parameters)(point_distances)
+    point_variogram[np.arange(block_points), np.arange(block_points)] = 0.0
+
+    # Return output
+    return {
+        "offsets": offsets,
+        "block_variance": float(point_variogram.mean()),
+        "cell_size": (cell_width, cell_height),
+    }
+
+
+def block_average_variogram(
+    mesh_x: np.ndarray,
+    mesh_y: np.ndarray,
+    neighbor_x: np.ndarray,
+    neighbor_y: np.ndarray,
+    range_grid: np.ndarray,
+    offsets: np.ndarray,
+    variogram_model: Callable,
+    chunk_size: int = 4096,
+):
+    """
+    Compute the point-to-block average semivariogram between transect intervals and mesh cells
+
+    Parameters
+    ----------
+    mesh_x: np.ndarray
+        The x-axis coordinates (n_mesh,) of the mesh cell centroids.
+    mesh_y: np.ndarray
+        The y-axis coordinates (n_mesh,) of the mesh cell centroids.
+    neighbor_x: np.ndarray
+        The x-axis coordinates (n_mesh, k) of the neighboring transect intervals.
+    neighbor_y: np.ndarray
+        The y-axis coordinates (n_mesh, k) of the neighboring transect intervals.
+    range_grid: np.ndarray
+        The distances (n_mesh, k) between each mesh node and its neighbors. NaN values mark the
+        neighbors that are not used and are propagated to the output.
+    offsets: np.ndarray
+        The offsets (n_points, 2) of the discretization points relative to the cell centroids
+        (see :func:`block_discretization`).
+    variogram_model: Callable
+        The compiled variogram model (see :func:`echopop.spatial.variogram.compile_variogram`).
+    chunk_size: int
+        The number of mesh nodes evaluated at once, which bounds the memory of the intermediate
+        (chunk_size, k, n_points) distance array.
+
+    Returns
+    ----------
+    block_variogram: np.ndarray
+        The semivariogram (n_mesh, k) averaged over the discretization points of each cell.
+    """
+
+    # Initialize the output
+    block_variogram = np.empty(range_grid.shape, dtype=range_grid.dtype)
+
+    # Compute the offsets from each neighbor to each cell centroid
+    # ---- x-axis
+    delta_x = neighbor_x - mesh_x[:, np.newaxis]
+    # ---- y-axis
+    delta_y = neighbor_y - mesh_y[:, np.newaxis]
+
+    # Iterate through chunks of mesh nodes
+    for start in range(0, range_grid.shape[0], chunk_size):
+        chunk = slice(start, start + chunk_size)
+        # ---- Compute the distances to the discretization points (chunk, k, n_points)
+        point_distances = np.sqrt(
+            (delta_x[chunk, :, np.newaxis] - offsets[:, 0]) ** 2
+            + (delta_y[chunk, :, np.newaxis] - offsets[:, 1]) ** 2
+        )
+        # ---- Average the semivariogram over each cell
+        block_variogram[chunk] = variogram_model(point_distances).mean(axis=2)
+
+    # Propagate the NaN-padding
+    block_variogram[np.isnan(range_grid)] = np.nan
+
+    # Return output
+    return block_variogram
+
+
+def partition_mesh_tiles(mesh_data: pd.DataFrame, tile_size: int):
+    """
+    Partition the kriging mesh into spatially contiguous tiles
+
+    Parameters
+    ----------
+    mesh_data: pd.DataFrame
+        Kriging mesh.
+    tile_size: int
+        The maximum number of mesh nodes within each tile.
+
+    Returns
+    ----------
+    tiles: List[np.ndarray]
+        A list of positional mesh indices for each tile.
+
+    Notes
+    ----------
+    The mesh is first split into bands of equal counts along the y-axis and each band is then split
+    into tiles of at most `tile_size` nodes along the x-axis.
+    """
+
+    # Extract the mesh coordinates
+    # ---- x
+    mesh_x = mesh_data["x"].to_numpy()
+    # ---- y
+    mesh_y = mesh_data["y"].to_numpy()
+
+    # Compute the number of bands along the y-axis
+    n_bands = int(np.ceil(np.sqrt(np.ceil(len(mesh_data) / tile_size))))
+
+    # Split the mesh into bands and tiles
+    tiles = []
+    for band in np.array_split(np.argsort(mesh_y, kind="stable"), n_bands):
+        # ---- Sort along the x-axis
+        band_sorted = band[np.argsort(mesh_x[band], kind="stable")]
+        # ---- Split into tiles
+        tiles.extend(np.array_split(band_sorted, max(1, int(np.ceil(len(band) / tile_size)))))
+
+    # Return the non-empty tiles
+    return [tile for tile in tiles if len(tile) > 0]
+
+
+# Process-level state for kriging worker processes
+KRIGING_WORKER_STATE = {}
+
+
+def initialize_kriging_worker(
+    shared_memory_name: str,
+    shape: tuple,
+    western_extent: pd.DataFrame,
+    settings_dict: dict,
+):
+    """
+    Attach a kriging worker process to the shared transect array
+
+    Parameters
+    ----------
+    shared_memory_name: str
+        Name of the shared memory block that contains the transect x- and y-coordinates.
+    shape: tuple
+        Shape of the shared transect array.
+    western_extent: pd.DataFrame
+        Coordinates of the western extent of transect lines.
+    settings_dict: dict
+        Kriging and variogram model parameters
+    """
+
+    # Attach to the shared memory block
+    shared_transect = shared_memory.SharedMemory(name=shared_memory_name)
+    # ---- Create a read-only view of the transect array
+    transect_array = np.ndarray(shape, dtype=np.float64, buffer=shared_transect.buf)
+    transect_array.flags.writeable = False
+
+    # Store the worker state
+    KRIGING_WORKER_STATE.update(
+        {
+            "shared_memory": shared_transect,
+            "transect_array": transect_array,
+            "transect_tree": (
+                cKDTree(transect_array)
+                if settings_dict.get("neighbor_search", "kdtree") == "kdtree"
+                else None
+            ),
+            "western_extent": western_extent,
+            "settings_dict": settings_dict,
+        }
+    )
+
+
+def krige_tile(mesh_tile: pd.DataFrame):
+    """
+    Compute the kriging weights of the mesh nodes of a single tile within a kriging worker process
+
+    Parameters
+    ----------
+    mesh_tile: pd.DataFrame
+        The x- and y-coordinates of the mesh nodes within the tile.
+    """
+
+    # Get the worker state
+    transect_array = KRIGING_WORKER_STATE["transect_array"]
+    settings_dict = KRIGING_WORKER_STATE["settings_dict"]
+
+    # Find the k-nearest transect intervals for each mesh point within the tile
+    local_points, local_indices = search_nearest_neighbors(
+        pd.DataFrame(transect_array, columns=["x", "y"], copy=False),
+        mesh_tile,
+        settings_dict["kriging_parameters"]["kmax"],
+        settings_dict.get("neighbor_search", "kdtree"),
+        KRIGING_WORKER_STATE["transect_tree"],
+    )
+
+    # Compute the kriging weights
+    return krige_mesh_nodes(
+        local_points,
+        local_indices,
+        mesh_tile,
+        KRIGING_WORKER_STATE["western_extent"],
+        settings_dict,
+        transect_array[:, 0],
+        transect_array[:, 1],
+    )
+
+
+def parallel_kriging(
+    transect_data: pd.DataFrame,
+    mesh_data: pd.DataFrame,
+    western_extent: pd.DataFrame,
+    settings_dict: dict,
+):
+    """
+    Compute the kriging weights of the mesh in spatial tiles distributed across a pool of worker
+    processes
 
     Parameters
     ----------
     transect_data: pd.DataFrame
         Dataframe including georeferenced data
     mesh_data: pd.DataFrame
-        Grid data that has been transformed
+        Kriging mesh.
+    western_extent: pd.DataFrame
+        Coordinates of the western extent of transect lines.
     settings_dict: dict
-        Kriging and variogram model parameters
-    """
-
-    # Extract biological variable values
-    # ---- Define the variable name
-    variable_name = settings_dict["variable"]
-    # ---- Extract array
-    variable_data = transect_data[variable_name].to_numpy()
-
-    # Generate the distance matrix for each mesh point relative to all transect coordinates
-    distance_matrix = griddify_lag_distances(mesh_data, transect_data)
-
-    # Calculate the western extent of the transect data
-    western_extent = define_western_extent(transect_data)
+        Kriging and variogram model parameters, including the number of worker processes
+        (`n_workers`) and the maximum number of mesh nodes per tile (`tile_size`).
 
-    # Run the adaptive search window to identify which points have to be re-weighted to account
-    # for extrapolation
-    range_grid, inside_indices, outside_indices, outside_weights = adaptive_search_radius(
-        distance_matrix, mesh_data, western_extent, settings_dict
-    )
+    Returns
+    ----------
+    weight_operator: dict
+        The kriging weight operator (see :func:`batch_kriging_weights`) of every mesh node in the
+        original mesh order.
 
-    # Calculate the lagged semivariogram (M20)
-    local_variogram = np.apply_along_axis(
-        variogram, 1, range_grid, settings_dict["variogram_parameters"]
-    )
+    Notes
+    ----------
+    The transect coordinates are written once to a shared memory block that each worker attaches
+    to (read-only) when it is initialized, which avoids pickling the transect data for every tile.
+    The transect values are not shared since the workers only compute the kriging weights. The
+    neighbor search within each worker uses the 'neighbor_search' backend (see
+    :func:`search_nearest_neighbors`), where the KD-tree is built once per worker. Memory per
+    worker is bounded by `tile_size`.
+    """
 
-    # Append 1.0 for the ordinary kriging assumptions (M2)
-    local_variogram_M2 = np.sort(
-        np.hstack((local_variogram, np.ones((local_variogram.shape[0], 1))))
-    )
+    # Extract and validate the parallelization settings
+    n_workers = settings_dict["n_workers"]
+    tile_size = settings_dict.get("tile_size", 10000)
+    # ---- Validate
+    for name, value in {"n_workers": n_workers, "tile_size": tile_size}.items():
+        if not isinstance(value, (int, np.integer)) or isinstance(value, bool) or value < 1:
+            raise ValueError(f"Argument `{name}` must be a positive integer. Got: {value}.")
+
+    # Partition the mesh into tiles
+    tiles = partition_mesh_tiles(mesh_data, tile_size)
+
+    # Write the transect coordinates to shared memory
+    transect_array = transect_data[["x", "y"]].to_numpy(dtype=np.float64)
+    # ---- Create the shared memory block
+    shared_transect = shared_memory.SharedMemory(create=True, size=transect_array.nbytes)
+
+    # Initialize the list of tile weight operators
+    tile_operators = [None] * len(tiles)
+
+    try:
+        # ---- Copy the transect array into the shared memory block
+        np.ndarray(transect_array.shape, dtype=np.float64, buffer=shared_transect.buf)[:] = (
+            transect_array
+        )
+        # ---- Suppress console messages within the workers
+        worker_settings = {**settings_dict, "verbose": False}
+        # ---- Extract the mesh coordinates
+        mesh_coordinates = mesh_data[["x", "y"]].reset_index(drop=True)
+        # ---- Distribute the tiles
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=initialize_kriging_worker,
+            initargs=(
+                shared_transect.name,
+                transect_array.shape,
+                western_extent,
+                worker_settings,
+            ),
+        ) as executor:
+            # ---- Submit each tile
+            futures = {
+                executor.submit(krige_tile, mesh_coordinates.iloc[tile]): i
+                for i, tile in enumerate(tiles)
+            }
+            # ---- Collect the results
+            for future in as_completed(futures):
+                tile_operators[futures[future]] = future.result()
+    finally:
+        # ---- Release the shared memory block
+        shared_transect.close()
+        shared_transect.unlink()
+
+    # Reassemble the tiles in the original mesh order
+    return concatenate_weight_operators(tile_operators, np.argsort(np.concatenate(tiles)))
+
+
+def left_justify(array: np.ndarray):
+    """
+    Shift the finite values of each row to the left-hand side of an array while preserving their
+    order, which leaves any NaN-padding on the right-hand side
 
-    # Extract x- and y-coordinates, and variable_data
-    # ---- x
-    x_coordinates = transect_data["x"].to_numpy()
-    # ---- y
-    y_coordinates = transect_data["y"].to_numpy()
+    Parameters
+    ----------
+    array: np.ndarray
+        A 2D array with NaN-padded rows.
 
-    # Stack all of the kriging parameters
-    full_stack = np.hstack(
-        (
-            outside_weights.reshape(-1, 1).tolist(),
-            inside_indices.tolist(),
-            outside_indices.tolist(),
-            local_variogram_M2.tolist(),
-            range_grid.tolist(),
-        )
-    )
+    Returns
+    ----------
+    justified: np.ndarray
+        The left-justified array.
+    counts: np.ndarray
+        The number of finite values in each row.
+    """
 
-    # Ordinary kriging
-    kriged_values = np.apply_along_axis(
-        kriging_interpolation,
-        1,
-        full_stack,
-        settings_dict["kriging_parameters"],
-        settings_dict["variogram_parameters"],
-        x_coordinates,
-        y_coordinates,
-        variable_data,
-    )
+    # Create boolean mask of NaN values
+    nan_mask = np.isnan(array)
 
-    # Compute the coefficients of variation (CV)
-    # ---- Compute the global/survey variance
-    survey_variance = np.var(variable_data)
-    # ---- Calculate the integrated variable when distributed over area
-    # --------- Compute area
-    area = settings_dict["kriging_parameters"]["A0"] * mesh_data["fraction_cell_in_polygon"]
-    # -------- Distribute biological variable over area
-    survey_estimate = np.nansum(kriged_values[:, 0] * area)
-    # ---- Compute the georeferenced CV at each mesh node
-    mesh_CV = (
-        area.mean()
-        * np.sqrt(kriged_values[:, 1].dot(survey_variance))
-        / survey_estimate
-        * np.sqrt(len(kriged_values[:, 1]))
-    )
-    # ---- Compute the global/survey CV
-    survey_CV = (
-        np.sqrt(np.nansum(kriged_values[:, 1] * area**2) * survey_variance) / survey_estimate
-    )
+    # Stable sort to keep the relative order of the finite values
+    order = np.argsort(nan_mask, axis=1, kind="stable")
 
-    # Return a Tuple with the results
-    # ---- Create DataFrame with the mesh node results
-    # -------- Initialize
-    mesh_results = mesh_data.copy()
-    # -------- Add area
-    mesh_results["area"] = area
-    # -------- Add the kriged variable
-    mesh_results["kriged_mean"] = kriged_values[:, 0]
-    # -------- Add the kriged variance
-    mesh_results["kriged_variance"] = kriged_values[:, 1]
-    # -------- Add the sample variance
-    mesh_results["sample_variance"] = kriged_values[:, 2]
-    # -------- Add the sample CV
-    mesh_results["sample_cv"] = mesh_CV
-    # -------- Add the absolute kriged value (i.e. not normalized by area)
-    mesh_results["biomass"] = kriged_values[:, 0] * area
-    # -------- Extract only the necessary dataframe columns
-    mesh_results = mesh_results.filter(regex="^(?!(fraction|x|y))")
-    # ---- Create dictionary with survey-wide kriged results
-    survey_results = {
-        "variable": variable_name,
-        "survey_mean": kriged_values[:, 0].mean(),
-        "survey_estimate": survey_estimate,
-        "survey_cv": survey_CV,
-        "mesh_results_df": mesh_results,
-    }
-    # ---- Return output
-    return survey_results
+    # Return the reordered array and the number of finite values per row
+    return np.take_along_axis(array, order, axis=1), np.sum(~nan_mask, axis=1)
 
 
-def kriging_interpolation(
-    stacked_array: np.ndarray,
+def batch_kriging_weights(
+    inside_indices: np.ndarray,
+    outside_indices: np.ndarray,
+    outside_weights: np.ndarray,
+    local_variogram_M2: np.ndarray,
+    range_grid: np.ndarray,
     kriging_parameters: dict,
     variogram_parameters: dict,
     x_coordinates: np.ndarray,
     y_coordinates: np.ndarray,
-    variable_data: np.ndarray,
+    solver: Literal["svd", "lu", "auto"] = "svd",
 ):
     """
-    Interpolate data at georeferenced coordinates using ordinary kriging.
+    Compute the ordinary kriging weights of all mesh nodes as a sparse linear operator
 
     Parameters
     ----------
-    stacked_array: np.ndarray
-        Horizontally stacked array that includes inside and outside weight indices, extrapolation
-        weights, the local semivariogram (M2), and local range estimates.
+    inside_indices: np.ndarray
+        Within-radius (WR) transect indices (n_mesh, k_max) with NaN-padding.
+    outside_indices: np.ndarray
+        Out-of-sample (OOS) transect indices (n_mesh, k_min) with NaN-padding.
+    outside_weights: np.ndarray
+        Extrapolation/out-of-sample weights for each mesh node.
+    local_variogram_M2: np.ndarray
+        The local semivariogram (M2) for each mesh node (n_mesh, k_max + 1).
+    range_grid: np.ndarray
+        Local range estimates (n_mesh, k_max).
     kriging_parameters: dict
         Kriging parameters.
     variogram_parameters: dict
@@ -151,162 +1600,661 @@ def kriging_interpolation(
         The x-axis coordinates
     y_coordinates: np.array
         The y-axis coordinates
-    variable_data: np.ndarray
-        An array of data that will be interpolated.
+    solver: Literal["svd", "lu", "auto"]
+        The linear solver used to compute the kriging weights (see :func:`batch_kriging_lambda`).
+
+    Returns
+    ----------
+    weight_operator: dict
+        A dictionary with the keys:
+
+        - 'weights': a sparse CSR matrix (n_mesh, n_transect) of the kriging weights (lambda)
+          with the extrapolation/out-of-sample weights folded in. The sparsity pattern of each row
+          marks the transect intervals whose values contribute to that mesh node.
+        - 'kriged_variance': the kriged variance (n_mesh,) of each mesh node.
+        - 'neighbor_counts': the number of neighbors (n_mesh,) used to krige each mesh node,
+          including those beyond the search radius whose values are set to 0.0.
+        - 'solver_counts': the number of kriging systems solved by each linear solver path ('lu'
+          and 'svd').
+
+    Notes
+    ----------
+    Mesh nodes are grouped by the number of neighbors used for the interpolation so that the
+    covariance matrices of each group can be stacked into a single (B, k + 1, k + 1) array and
+    solved with a single batched singular value decomposition. The kriging weights only depend on
+    the transect and mesh coordinates, so the operator can be reused to interpolate any other
+    variable defined along the same transect intervals via :func:`apply_kriging_weights`.
     """
 
     # Extract kriging parameter values
     # ---- Anisotropy
     anisotropy = kriging_parameters["anisotropy"]
-    # ---- k_max
-    k_max = kriging_parameters["kmax"]
-    # ---- k_min
-    k_min = kriging_parameters["kmin"]
     # ---- search radius
     search_radius = kriging_parameters["search_radius"]
 
-    # Break up the stacked index
-    # ---- Extrapolation/out-of-sample (OOS) weight
-    outside_weight = stacked_array[0]
-    # ---- Within-sample (IS) indices
-    interp_indices = stacked_array[1 : k_max + 1]
-    # -------- Drop NaN
-    interp_indices = interp_indices[~np.isnan(interp_indices)].astype(int)
-    # ---- OOS indices
-    extrap_indices = stacked_array[k_max + 1 : (k_max + 1 + k_min)]
-    # -------- Drop NaN
-    extrap_indices = extrap_indices[~np.isnan(extrap_indices)].astype(int)
-    # ---- Combine the IS and OOS indices
-    composite = np.concatenate([interp_indices, extrap_indices])
+    # Combine the IS and OOS indices and drop the NaN-padding
+    composite_indices, composite_counts = left_justify(np.hstack((inside_indices, outside_indices)))
     # ---- M2 lagged variogram
-    M2_vario = stacked_array[-(k_max * 2) - 1 : -k_max]
-    # -------- Drop NaN
-    M2_vario = M2_vario[~np.isnan(M2_vario)]
+    M2_vario, _ = left_justify(local_variogram_M2)
     # ---- Range grid
-    range_vals = stacked_array[-k_max:]
-    # -------- Drop NaN
-    range_vals = range_vals[~np.isnan(range_vals)]
+    range_vals, _ = left_justify(range_grid)
+
+    # Compile the variogram model
+    variogram_model = compile_variogram(variogram_parameters)
+
+    # Initialize the outputs
+    # ---- Kriged variance
+    kriged_variance = np.full(composite_indices.shape[0], np.nan)
+    # ---- Sparse matrix entries (row, column, weight)
+    weight_rows, weight_columns, weight_values = [], [], []
+    # ---- Linear solver path counts
+    solver_counts = {"lu": 0, "svd": 0}
+
+    # Iterate through each group of mesh nodes that share the same number of neighbors
+    for k in np.unique(composite_counts[composite_counts > 0]):
+        # ---- Index the mesh nodes within the group
+        group = np.flatnonzero(composite_counts == k)
+        # ---- Get the composite indices
+        composite = composite_indices[group, :k].astype(int)
+        # ---- Index the lagged semivariogram
+        M2_group = M2_vario[group, : k + 1]
+        # ---- Compute the stacked kriging covariance matrices
+        kriging_covariance = batch_kriging_matrix(
+            x_coordinates[composite], y_coordinates[composite], variogram_model
+        )
+        # ---- Compute the kriging weights (lambda)
+        kriging_weights = batch_kriging_lambda(
+            anisotropy, M2_group, kriging_covariance, solver, solver_counts
+        )
+        # ---- Calculate the kriged variance (accumulated in float64)
+        kriged_variance[group] = (kriging_weights * M2_group).sum(axis=1, dtype=np.float64)
+        # ---- Drop the extrapolated neighbors since their variable values are set to 0.0
+        within_range = range_vals[group, :k] <= search_radius
+        # ---- Store the sparse matrix entries
+        weight_rows.append(np.broadcast_to(group[:, np.newaxis], composite.shape)[within_range])
+        weight_columns.append(composite[within_range])
+        weight_values.append(
+            (kriging_weights[:, :k] * outside_weights[group, np.newaxis])[within_range]
+        )
 
-    # Index the coordinates and variable data
-    # ---- x
-    x_indexed = x_coordinates[composite]
-    # ---- y
-    y_indexed = y_coordinates[composite]
-    # ---- variable
-    variable_indexed = variable_data[composite]
+    # Assemble the sparse weight matrix
+    # ---- Concatenate the entries
+    weight_rows = np.concatenate(weight_rows) if weight_rows else np.array([], dtype=int)
+    weight_columns = np.concatenate(weight_columns) if weight_columns else np.array([], dtype=int)
+    weight_values = (
+        np.concatenate(weight_values).astype(np.float64, copy=False)
+        if weight_values
+        else np.array([])
+    )
+    # ---- Sort by row
+    row_order = np.argsort(weight_rows, kind="stable")
+    # ---- Compute the row pointers
+    row_pointers = np.concatenate(
+        [[0], np.cumsum(np.bincount(weight_rows, minlength=composite_indices.shape[0]))]
+    )
+    # ---- Construct directly from the CSR components so that zero-valued weights are retained
+    weights = sparse.csr_matrix(
+        (weight_values[row_order], weight_columns[row_order], row_pointers),
+        shape=(composite_indices.shape[0], len(x_coordinates)),
+    )
 
-    # Set extrapolated variable values to 0.0
-    variable_indexed[range_vals > search_radius] = 0.0
+    # Return output
+    return {
+        "weights": weights,
+        "kriged_variance": kriged_variance,
+        "neighbor_counts": composite_counts,
+        "solver_counts": solver_counts,
+    }
 
-    # Compute the kriging covariance matrix
-    kriging_covariance = kriging_matrix(x_indexed, y_indexed, variogram_parameters)
 
-    # Compute the kriging weights (lambda)
-    kriging_weights = kriging_lambda(anisotropy, M2_vario, kriging_covariance)
+def apply_kriging_weights(weight_operator: dict, variable_data: np.ndarray):
+    """
+    Interpolate transect data onto the mesh using a precomputed kriging weight operator
 
-    # Calculate the point estimate
-    point_estimate = (kriging_weights[: len(composite)] * variable_indexed).sum() * outside_weight
+    Parameters
+    ----------
+    weight_operator: dict
+        The kriging weight operator (see :func:`batch_kriging_weights`).
+    variable_data: np.ndarray
+        An array of transect data (n_transect,) that will be interpolated, or a 2D array
+        (n_transect, n_variables) of several variables that are interpolated at once.
+
+    Returns
+    ----------
+    kriged_values: np.ndarray
+        An array (n_mesh, 3) comprising the point estimate, kriged variance, and sample variance
+        of each mesh node. When `variable_data` is 2D, the array has the shape
+        (n_mesh, 3, n_variables).
+
+    Notes
+    ----------
+    The point estimates are computed with a single sparse matrix-vector (or matrix-matrix)
+    product, so no kriging systems are re-solved.
+    """
 
-    # Calculate the kriged variance
-    kriged_variance = kriging_weights.dot(M2_vario)
+    # Extract the operator components
+    weights = weight_operator["weights"]
+    neighbor_counts = weight_operator["neighbor_counts"]
+
+    # Broadcast the variable to 2D
+    variable_matrix = np.asarray(variable_data, dtype=float)
+    variable_matrix = variable_matrix.reshape(variable_matrix.shape[0], -1)
+
+    # Calculate the point estimate
+    point_estimate = np.asarray(weights @ variable_matrix)
+    # ---- Mesh nodes without neighbors are undefined
+    point_estimate[neighbor_counts == 0] = np.nan
+
+    # Calculate the variance of the neighboring values
+    # ---- Map each stored weight to its mesh node
+    entry_rows = np.repeat(np.arange(weights.shape[0]), np.diff(weights.indptr))
+    # ---- Sparse operator that sums the stored entries of each row
+    row_sum = sparse.csr_matrix(
+        (np.ones(weights.nnz), np.arange(weights.nnz), weights.indptr),
+        shape=(weights.shape[0], weights.nnz),
+    )
+    # ---- Index the neighboring values (those beyond the search radius are 0.0 and omitted)
+    neighbor_values = variable_matrix[weights.indices]
+    # ---- Compute the mean of the neighboring values
+    with np.errstate(divide="ignore", invalid="ignore"):
+        neighbor_mean = np.asarray(row_sum @ neighbor_values) / neighbor_counts[:, np.newaxis]
+    # ---- Sum the squared deviations from the mean
+    squared_deviations = np.asarray(row_sum @ (neighbor_values - neighbor_mean[entry_rows]) ** 2)
+    # ---- Add the deviations of the neighbors beyond the search radius
+    squared_deviations += (neighbor_counts - np.diff(weights.indptr))[
+        :, np.newaxis
+    ] * neighbor_mean**2
+    # ---- Compute the unbiased variance
+    with np.errstate(divide="ignore", invalid="ignore"):
+        neighbor_variance = squared_deviations / (neighbor_counts[:, np.newaxis] - 1)
 
     # Calculate the sample variance and CV
-    if abs(point_estimate) < np.finfo(float).eps:
-        sample_variance = np.nan
-    else:
-        sample_variance = np.sqrt(kriged_variance * np.var(variable_indexed, ddof=1)) / np.abs(
-            point_estimate
+    kriged_variance = np.broadcast_to(
+        weight_operator["kriged_variance"][:, np.newaxis], point_estimate.shape
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sample_variance = np.where(
+            np.abs(point_estimate) < np.finfo(float).eps,
+            np.nan,
+            np.sqrt(kriged_variance * neighbor_variance) / np.abs(point_estimate),
         )
 
-    # Return output
-    return np.array([point_estimate, kriged_variance, sample_variance])
+    # Stack the estimates
+    kriged_values = np.stack([point_estimate, kriged_variance, sample_variance], axis=1)
+
+    # Return output with the same dimensionality as the input
+    return kriged_values[:, :, 0] if np.ndim(variable_data) == 1 else kriged_values
+
+
+def kriging_cross_validation(transect_data: pd.DataFrame, settings_dict: dict):
+    """
+    Compute the leave-one-out (LOO) ordinary kriging prediction errors at every transect interval
+
+    Parameters
+    ----------
+    transect_data: pd.DataFrame
+        Dataframe including georeferenced data
+    settings_dict: dict
+        Kriging and variogram model parameters. The 'variable' entry defines the column that is
+        cross-validated, and the optional 'solver', 'precision', and 'neighbor_search' entries are
+        used as in :func:`kriging`.
+
+    Returns
+    ----------
+    cross_validation_results: dict
+        A dictionary with the keys:
+
+        - 'variable': the cross-validated variable.
+        - 'rmse': the root-mean-square LOO prediction error.
+        - 'mean_error': the mean LOO prediction error (bias).
+        - 'mean_standardized_error': the mean standardized LOO prediction error, which should be
+          close to 0.0.
+        - 'standardized_rmse': the root-mean-square standardized LOO prediction error, which
+          should be close to 1.0 when the kriged variance is consistent with the errors.
+        - 'cross_validation_df': the transect data with the LOO 'predicted' values, 'residual'
+          (observed - predicted), 'kriged_variance', 'standardized_error', and the
+          'neighbor_count' of each transect interval.
+
+    Notes
+    ----------
+    Each transect interval is predicted from its `k_max` nearest neighbors, excluding itself, with
+    the same predictor as :func:`kriging`: the kriging weights are computed with
+    :func:`krige_mesh_nodes`, so neighbors beyond the search radius are set to 0.0 and the
+    tapered extrapolation beyond the western extent of the transects (see
+    :func:`adaptive_search_radius`) is applied. Intervals that define the western extent are
+    re-solved relative to the western extent of the remaining intervals. The prediction of each
+    interval is therefore identical to kriging that interval at a point from the remaining
+    transect intervals.
+    """
+
+    # Get the maximum number of neighbors
+    k_max = settings_dict["kriging_parameters"]["kmax"]
+
+    # Extract the variable and coordinates
+    # ---- Variable name
+    variable_name = settings_dict["variable"]
+    # ---- Variable values
+    variable_data = transect_data[variable_name].to_numpy(dtype=float)
+    # ---- x-coordinates
+    x_coordinates = transect_data["x"].to_numpy()
+    # ---- y-coordinates
+    y_coordinates = transect_data["y"].to_numpy()
+    # ---- Number of transect intervals
+    n_transect = len(variable_data)
+
+    # Find the nearest transect intervals of each transect interval (including itself)
+    local_points, local_indices = search_nearest_neighbors(
+        transect_data,
+        transect_data,
+        min(k_max + 1, n_transect),
+        settings_dict.get("neighbor_search", "kdtree"),
+    )
+
+    # Remove each transect interval from its own set of neighbors
+    self_mask = local_indices == np.arange(n_transect)[:, np.newaxis]
+    # ---- Intervals that are outranked by coincident intervals drop their farthest neighbor
+    self_mask[~self_mask.any(axis=1), -1] = True
+    # ---- Only the first match is removed from each row
+    self_mask &= np.cumsum(self_mask, axis=1) == 1
+    # ---- Drop the masked values (the remaining neighbors stay sorted by distance)
+    local_points = local_points[~self_mask].reshape(n_transect, -1)
+    local_indices = local_indices[~self_mask].reshape(n_transect, -1)
+
+    # Predict each transect interval at a point (i.e. without the block kriging support) with the
+    # same neighbor selection, search radius, and extrapolation as :func:`kriging`
+    point_settings = {**settings_dict, "block_discretization": None, "verbose": False}
+    # ---- Calculate the western extent of the transect data
+    western_extent = define_western_extent(transect_data)
+    # ---- Compute the kriging weights of each left-out transect interval
+    weight_operator = krige_mesh_nodes(
+        local_points,
+        local_indices,
+        transect_data,
+        western_extent,
+        point_settings,
+        x_coordinates,
+        y_coordinates,
+    )
+    # ---- Interpolate the left-out transect intervals
+    kriged_values = apply_kriging_weights(weight_operator, variable_data)
+    # ---- Get the neighbor counts
+    neighbor_counts = weight_operator["neighbor_counts"]
+
+    # Re-solve the intervals that define the western extent, which shifts when they are removed
+    western_positions = np.flatnonzero(transect_data.index.isin(western_extent.index))
+    for i in western_positions:
+        # ---- Compute the kriging weights relative to the western extent without the interval
+        interval_operator = krige_mesh_nodes(
+            local_points[[i]],
+            local_indices[[i]],
+            transect_data.iloc[[i]],
+            define_western_extent(transect_data.iloc[np.arange(n_transect) != i]),
+            point_settings,
+            x_coordinates,
+            y_coordinates,
+        )
+        # ---- Interpolate the left-out transect interval
+        kriged_values[i] = apply_kriging_weights(interval_operator, variable_data)[0]
+        # ---- Update the neighbor count
+        neighbor_counts[i] = interval_operator["neighbor_counts"][0]
+
+    # Compute the LOO residuals
+    residuals = variable_data - kriged_values[:, 0]
+    # ---- Get the LOO kriged variance
+    kriged_variance = kriged_values[:, 1]
+
+    # Compute the standardized errors
+    # ---- Compute the global/survey variance
+    survey_variance = np.var(variable_data)
+    # ---- Standardize the residuals
+    with np.errstate(divide="ignore", invalid="ignore"):
+        standardized_error = residuals / np.sqrt(kriged_variance * survey_variance)
+
+    # Return a dictionary with the results
+    # ---- Create DataFrame with the transect interval results
+    cross_validation_df = transect_data.copy()
+    # -------- Add the LOO predictions
+    cross_validation_df["predicted"] = variable_data - residuals
+    # -------- Add the LOO residuals
+    cross_validation_df["residual"] = residuals
+    # -------- Add the LOO kriged variance
+    cross_validation_df["kriged_variance"] = kriged_variance
+    # -------- Add the standardized errors
+    cross_validation_df["standardized_error"] = standardized_error
+    # -------- Add the number of neighbors
+    cross_validation_df["neighbor_count"] = neighbor_counts
+    # ---- Return output
+    return {
+        "variable": variable_name,
+        "rmse": np.sqrt(np.nanmean(residuals**2)),
+        "mean_error": np.nanmean(residuals),
+        "mean_standardized_error": np.nanmean(standardized_error),
+        "standardized_rmse": np.sqrt(np.nanmean(standardized_error**2)),
+        "cross_validation_df": cross_validation_df,
+    }
 
 
-def kriging_matrix(x_coordinates, y_coordinates, variogram_parameters):
+def batch_kriging_matrix(
+    x_coordinates: np.ndarray, y_coordinates: np.ndarray, variogram_model: Callable
+):
     """
-    Calculate the kriging covariance matrix
+    Calculate stacked kriging covariance matrices
 
     Parameters
     ----------
     x_coordinates: np.array
-        The x-axis coordinates
+        The x-axis coordinates (B, k) of each set of local points
     y_coordinates: np.array
-        The y-axis coordinates
-    variogram_parameters: dict
-        Dictionary containing variogram model parameters
+        The y-axis coordinates (B, k) of each set of local points
+    variogram_model: Callable
+        The compiled variogram model (see :func:`echopop.spatial.variogram.compile_variogram`).
+
+    Returns
+    ----------
+    kriging_matrix: np.ndarray
+        An array of stacked kriging matrices with shape (B, k + 1, k + 1).
     """
 
-    # Calculate local distance matrix of within-range samples
-    local_distance_matrix = griddify_lag_distances(x_coordinates, y_coordinates)
+    # Get the dimensions
+    n_batch, n_points = x_coordinates.shape
 
-    # Calculate the covariance/kriging matrix (without the constant term)
-    kriging_matrix_initial = variogram(
-        distance_lags=local_distance_matrix, variogram_parameters=variogram_parameters
+    # Calculate local distance matrices of within-range samples
+    local_distance_matrix = np.sqrt(
+        (x_coordinates[:, :, np.newaxis] - x_coordinates[:, np.newaxis, :]) ** 2
+        + (y_coordinates[:, :, np.newaxis] - y_coordinates[:, np.newaxis, :]) ** 2
     )
 
-    # Expand the covariance/kriging matrix with a constant
+    # Initialize the expanded covariance/kriging matrix with a constant
     # ---- In Ordinary Kriging, this should be '1'
-    # Columns
-    kriging_matrix = np.concatenate(
-        [kriging_matrix_initial, np.ones((x_coordinates.size, 1))], axis=1
-    )
+    kriging_matrix = np.ones((n_batch, n_points + 1, n_points + 1), dtype=x_coordinates.dtype)
 
-    # Add column and row of ones for Ordinary Kriging
-    kriging_matrix = np.concatenate([kriging_matrix, np.ones((1, x_coordinates.size + 1))], axis=0)
+    # Calculate the covariance/kriging matrix (without the constant term)
+    kriging_matrix[:, :n_points, :n_points] = variogram_model(local_distance_matrix)
 
     # Diagonal fill (0.0)
-    # ---- TODO: Should we put in statements for Objective mapping and Universal Kriging w/ Linear drift?  # noqa
-    np.fill_diagonal(kriging_matrix, 0.0)
+    kriging_matrix[:, np.arange(n_points + 1), np.arange(n_points + 1)] = 0.0
 
     return kriging_matrix
 
 
-def search_radius_mask(distance_matrix: np.ndarray, search_radius: float):
+def batch_kriging_lambda(
+    anisotropy: float,
+    lagged_semivariogram: np.ndarray,
+    kriging_matrix: np.ndarray,
+    solver: Literal["svd", "lu", "auto"] = "svd",
+    solver_counts: Optional[dict] = None,
+):
     """
-    Creates a NaN mask of values that fall beyond the search radius
+    Compute kriging (lambda) weights for stacked kriging matrices
 
     Parameters
     ----------
-    distance_matrix: np.ndarray
-        An array of lag distances between mesh points and every transect coordinate.
-    search_radius: float
-        The maximum lag distance allowed from each mesh point.
+    anisotropy: np.float64
+        Anisotropy ratio.
+    lagged_semivariogram: np.array
+        Stacked lagged semivariograms with shape (B, k + 1).
+    kriging_matrix: np.array
+        Stacked kriging matrices with shape (B, k + 1, k + 1).
+    solver: Literal["svd", "lu", "auto"]
+        The linear solver. This can either be 'svd' (default), which applies a singular value
+        decomposition (SVD) where singular values are truncated using the `anisotropy` ratio, 'lu',
+        which directly solves the systems via LU decomposition, or 'auto', which uses the LU
+        decomposition unless a kriging matrix is near-singular, in which case the truncated SVD is
+        used instead.
+    solver_counts: Optional[dict]
+        A dictionary that, when supplied, is incremented with the number of kriging systems solved
+        by each path ('lu' and 'svd').
+
+    Notes
+    ----------
+    Exactly singular matrices are solved with the truncated SVD for every solver.
+
+    For the 'auto' solver, a kriging matrix is considered near-singular when its reciprocal
+    condition number (1-norm) is less than or equal to `anisotropy` times the matrix dimension.
+    Above this threshold, the truncated SVD would retain every singular value and therefore yields
+    the same weights as the direct solve. The 1-norm of each inverse kriging matrix is estimated
+    with the Hager-Higham estimator used by LAPACK's `gecon`. Its right-hand sides are solved in
+    the same batched LU solve as the kriging weights, plus one batched solve of the transposed
+    systems, so no matrix is inverted. Since the estimate is a lower bound, matrices that are
+    close to the truncation threshold may still be solved directly.
     """
-    # Create copy of matrix
-    matrix_copy = distance_matrix.copy()
 
-    # Find values beyond the maximum search radius and mask (assign NaN) to those beyond
-    # ---- Generate mask
-    mask = matrix_copy > search_radius
-    # ---- Set values outside the radius to NaN
-    matrix_copy[mask] = np.nan
+    # Validate the solver
+    validate_kriging_solver(solver)
+
+    # Direct solve
+    if solver == "lu":
+        # ---- Batched LU decomposition
+        kriging_weights, singular_mask = batch_lu_solve(kriging_matrix, lagged_semivariogram)
+        # ---- Singular matrices
+        if np.any(singular_mask):
+            kriging_weights[singular_mask] = batch_svd_kriging_lambda(
+                anisotropy, lagged_semivariogram[singular_mask], kriging_matrix[singular_mask]
+            )
+        # ---- Update the counts
+        update_solver_counts(solver_counts, np.sum(~singular_mask), np.sum(singular_mask))
+        # ---- Return output
+        return kriging_weights
+    elif solver == "svd":
+        # ---- Update the counts
+        update_solver_counts(solver_counts, 0, len(kriging_matrix))
+        # ---- Return output
+        return batch_svd_kriging_lambda(anisotropy, lagged_semivariogram, kriging_matrix)
+
+    # Get the matrix dimension
+    n_points = kriging_matrix.shape[1]
+
+    # Solve each kriging system alongside the right-hand sides of the 1-norm condition estimator
+    # ---- Hager's starting vector (e / n) and Higham's alternating test vector
+    estimator_vectors = np.column_stack(
+        [
+            np.full(n_points, 1.0 / n_points),
+            (-1.0) ** np.arange(n_points) * (1.0 + np.arange(n_points) / (n_points - 1)),
+        ]
+    ).astype(kriging_matrix.dtype)
+    # ---- Stack the right-hand sides (B, k + 1, 3)
+    right_hand_sides = np.concatenate(
+        [
+            lagged_semivariogram[..., np.newaxis],
+            np.broadcast_to(estimator_vectors, (len(kriging_matrix), n_points, 2)),
+        ],
+        axis=2,
+    )
+    # ---- Batched LU decomposition
+    solutions, singular_mask = batch_lu_solve(kriging_matrix, right_hand_sides)
+    # ---- Solve the transposed systems with the signs of the first estimator solution
+    transposed_solutions, transposed_singular_mask = batch_lu_solve(
+        kriging_matrix.transpose(0, 2, 1),
+        np.where(solutions[..., 1] >= 0.0, 1.0, -1.0).astype(kriging_matrix.dtype),
+    )
+    singular_mask |= transposed_singular_mask
+
+    # Estimate the 1-norm of each inverse kriging matrix (a lower bound as in LAPACK's `gecon`)
+    inverse_norm = np.maximum.reduce(
+        [
+            np.abs(solutions[..., 1]).sum(axis=1),
+            np.abs(transposed_solutions).max(axis=1),
+            2.0 * np.abs(solutions[..., 2]).sum(axis=1) / (3.0 * n_points),
+        ]
+    )
+    # ---- Compute the reciprocal condition number (1-norm)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        reciprocal_condition = 1.0 / (np.abs(kriging_matrix).sum(axis=1).max(axis=1) * inverse_norm)
+    # ---- The 2-norm condition number is at most `n` times the 1-norm condition number, so the
+    # ---- truncated SVD would retain every singular value for these matrices (up to the accuracy of
+    # ---- the estimate)
+    direct_mask = ~singular_mask & (reciprocal_condition > n_points * anisotropy)
+
+    # Calculate kriging weights (lambda)
+    # ---- Well-conditioned matrices
+    kriging_weights = solutions[..., 0]
+    # ---- Near-singular matrices
+    if np.any(~direct_mask):
+        kriging_weights[~direct_mask] = batch_svd_kriging_lambda(
+            anisotropy, lagged_semivariogram[~direct_mask], kriging_matrix[~direct_mask]
+        )
+
+    # Update the counts
+    update_solver_counts(solver_counts, np.sum(direct_mask), np.sum(~direct_mask))
 
     # Return output
-    return matrix_copy
+    return kriging_weights
+
+
+def batch_lu_solve(kriging_matrix: np.ndarray, right_hand_side: np.ndarray):
+    """
+    Solve stacked linear systems via batched LU decomposition
+
+    Parameters
+    ----------
+    kriging_matrix: np.array
+        Stacked matrices with shape (B, k + 1, k + 1).
+    right_hand_side: np.array
+        Stacked right-hand sides with shape (B, k + 1) or (B, k + 1, m).
+
+    Returns
+    ----------
+    solution: np.ndarray
+        The solutions with the same shape as `right_hand_side`. Exactly singular systems are NaN.
+    singular_mask: np.ndarray
+        A boolean array (B,) that flags the exactly singular matrices.
+    """
+
+    # Broadcast the right-hand side to stacked matrices
+    rhs = right_hand_side[..., np.newaxis] if right_hand_side.ndim == 2 else right_hand_side
+
+    # Solve all systems at once
+    singular_mask = np.zeros(len(kriging_matrix), dtype=bool)
+    try:
+        solution = np.linalg.solve(kriging_matrix, rhs)
+    except np.linalg.LinAlgError:
+        # ---- Solve each matrix separately when at least one is exactly singular
+        solution = np.full(rhs.shape, np.nan, dtype=np.result_type(kriging_matrix, rhs))
+        for i, matrix in enumerate(kriging_matrix):
+            try:
+                solution[i] = np.linalg.solve(matrix, rhs[i])
+            except np.linalg.LinAlgError:
+                singular_mask[i] = True
+
+    # Return output with the same dimensionality as the input
+    return (solution[..., 0] if right_hand_side.ndim == 2 else solution), singular_mask
+
+
+def batch_svd_kriging_lambda(
+    anisotropy: float,
+    lagged_semivariogram: np.ndarray,
+    kriging_matrix: np.ndarray,
+):
+    """
+    Apply batched singular value decomposition (SVD) to compute kriging (lambda) weights for
+    stacked kriging matrices
+
+    Parameters
+    ----------
+    anisotropy: np.float64
+        Anisotropy ratio.
+    lagged_semivariogram: np.array
+        Stacked lagged semivariograms with shape (B, k + 1).
+    kriging_matrix: np.array
+        Stacked kriging matrices with shape (B, k + 1, k + 1).
+    """
+
+    # Singular value decomposition (SVD) of each matrix
+    U, Sigma, VH = np.linalg.svd(kriging_matrix, full_matrices=True)
+
+    # Create Sigma mask informed by the ratio-threshold
+    # ---- The ratio between all singular values and their respective maximum is used to apply a
+    # ---- mask, where masked singular values are dropped from the pseudo-inverse
+    Sigma_mask = np.abs(Sigma / Sigma[:, :1]) > anisotropy
+    # ---- Invert the retained singular values
+    Sigma_inv = np.where(Sigma_mask, 1.0 / np.where(Sigma_mask, Sigma, 1.0), 0.0)
+
+    # Project the lagged semivariogram onto the left singular vectors
+    projection = np.einsum("bji,bj->bi", U, lagged_semivariogram) * Sigma_inv
+
+    # Calculate kriging weights (lambda)
+    return np.einsum("bji,bj->bi", VH, projection)
 
 
-def count_within_radius(distance_matrirx_masked: np.ndarray):
+def search_nearest_neighbors(
+    transect_data: pd.DataFrame,
+    mesh_data: pd.DataFrame,
+    k_max: int,
+    neighbor_search: str = "kdtree",
+    transect_tree: Optional[cKDTree] = None,
+):
     """
-    Counts the number of NaN-masked distance matrix values to determine points where extrapolation
-    is required.
+    Find the distances and indices of the k-th nearest transect intervals relative to each mesh
+    point
 
     Parameters
     ----------
-    distance_matrix_masked: np.ndarray
-        A NaN-masked array of lagged distances.
+    transect_data: pd.DataFrame
+        Dataframe including georeferenced data
+    mesh_data: pd.DataFrame
+        Kriging mesh.
+    k_max: int
+        The maximum number of nearest transect intervals that are returned for each mesh point.
+    neighbor_search: str
+        The neighbor search backend. This can either be 'kdtree' (default), which queries a
+        spatial index (:class:`scipy.spatial.cKDTree`) built over the transect coordinates, or
+        'dense', which computes the full mesh-by-transect distance matrix.
+    transect_tree: Optional[cKDTree]
+        A prebuilt spatial index over the transect coordinates (e.g. shared across chunks of the
+        mesh) for the 'kdtree' backend. When `None`, the index is built from `transect_data`.
+
+    Returns
+    ----------
+    local_points: np.ndarray
+        An array of lag distances (n_mesh, k_max) between each mesh point and its nearest transect
+        intervals sorted in ascending order.
+    local_indices: np.ndarray
+        The transect interval indices (n_mesh, k_max) that correspond to `local_points`.
+
+    Notes
+    ----------
+    The 'kdtree' backend requires O((n_mesh + n_transect) log(n_transect)) time and
+    O(n_mesh * k_max) memory, whereas the 'dense' backend requires O(n_mesh * n_transect) for both.
+    The query is not bounded by the search radius since the k-th nearest intervals beyond the
+    search radius are still required for extrapolation.
     """
-    # Create copy of matrix
-    matrix_copy = distance_matrirx_masked.copy()
 
-    # Create boolean matrix of values outside search radius
-    nan_mask = np.isnan(matrix_copy)
+    # Query the nearest transect intervals
+    if neighbor_search == "kdtree":
+        # ---- Build the spatial index over the transect coordinates
+        if transect_tree is None:
+            transect_tree = cKDTree(transect_data[["x", "y"]].to_numpy())
+        # ---- Query the `k_max` nearest neighbors of each mesh point
+        local_points, local_indices = transect_tree.query(mesh_data[["x", "y"]].to_numpy(), k=k_max)
+    elif neighbor_search == "dense":
+        # ---- Generate the distance matrix for each mesh point relative to all transect coordinates
+        distance_matrix = griddify_lag_distances(mesh_data, transect_data)
+        # ---- Partition the `k_max` closest indices from the remaining columns
+        if k_max < distance_matrix.shape[1]:
+            local_indices = np.argpartition(distance_matrix, kth=k_max - 1, axis=1)[:, :k_max]
+        else:
+            local_indices = np.broadcast_to(
+                np.arange(distance_matrix.shape[1]), distance_matrix.shape
+            )
+        # ---- Map the distance matrix to the local indices
+        local_points = np.take_along_axis(distance_matrix, local_indices, axis=1)
+        # ---- Sort only the selected columns
+        local_order = local_points.argsort(axis=1, kind="stable")
+        local_indices = np.take_along_axis(local_indices, local_order, axis=1)
+        local_points = np.take_along_axis(local_points, local_order, axis=1)
+    else:
+        raise ValueError(
+            f"The neighbor search method ('{neighbor_search}') is invalid. Only 'kdtree' and "
+            f"'dense' are valid inputs."
+        )
 
-    # Count the number of values within the search radius and return output
-    return np.sum(~nan_mask, axis=1)
+    # Return output
+    return local_points, local_indices
 
 
 def adaptive_search_radius(
-    distance_matrix: np.ndarray,
+    local_points: np.ndarray,
+    local_indices: np.ndarray,
     mesh_data: pd.DataFrame,
     western_extent: pd.DataFrame,
     settings_dict: dict,
@@ -317,9 +2265,11 @@ def adaptive_search_radius(
 
     Parameters
     ----------
-    distance_matrix: np.ndarray
-        An array/matrix that includes the distances of each mesh points from every
-        georeferenced along-transect interval
+    local_points: np.ndarray
+        An array/matrix that includes the sorted distances of each mesh point from its `k_max`
+        nearest georeferenced along-transect intervals (see :func:`search_nearest_neighbors`).
+    local_indices: np.ndarray
+        An array/matrix of the transect interval indices that correspond to `local_points`.
     mesh_data: pd.DataFrame
         Kriging mesh.
     western_extent: pd.DataFrame
@@ -337,26 +2287,26 @@ def adaptive_search_radius(
     # ---- Search radius (distance)
     search_radius = settings_dict["kriging_parameters"]["search_radius"]
 
+    # Restrict the local distances to the `k_max` nearest points
+    local_points = local_points[:, :k_max]
+
     # Generate the search radius mask
-    distance_matrix_masked = search_radius_mask(distance_matrix, search_radius)
+    # ---- A boolean mask is used in lieu of a NaN-masked copy of the local distances
+    within_radius_mask = local_points <= search_radius
 
     # Identify mesh points that require extrapolation
     # ---- Count the number of values within the search radius
-    valid_distances = count_within_radius(distance_matrix_masked)
+    # ---- Only the `k_max` nearest points are considered, which is sufficient for comparisons
+    # ---- against `k_min` since `k_min <= k_max`
+    valid_distances = np.count_nonzero(within_radius_mask, axis=1)
     # ---- Identify rows where the number of valid points are less than `k_min`
     sparse_radii = np.hstack(np.where(valid_distances < k_min))
 
-    # Calculate the closest grid points and their indices
-    # ---- Closest indices
-    local_indices = distance_matrix.argsort(axis=1)
-    # ---- Map the distance matrix to the local indices
-    local_points = np.take_along_axis(distance_matrix, local_indices, axis=1)
-
     # Initialize matrices
     # ---- Within-radius (WR) samples
-    wr_indices = local_indices[:, :k_max].astype(float)
+    wr_indices = local_indices[:, :k_max].astype(local_points.dtype)
     # ---- Out-of-sample (OOS) indices
-    oos_indices = np.full((len(valid_distances), k_min), np.nan)
+    oos_indices = np.full((len(valid_distances), k_min), np.nan, dtype=local_points.dtype)
     # ---- OOS weights
     oos_weights = np.ones(len(valid_distances))
 
@@ -371,6 +2321,8 @@ def adaptive_search_radius(
         mesh_x = mesh_data["x"].to_numpy()[sparse_radii]
 
         # Update local points
+        # ---- Copy the local distances so that only the returned array is updated
+        local_points = local_points.copy()
         # ---- Fill NaN values
         local_points[sparse_radii, k_min:] = np.nan
         wr_indices[sparse_radii, k_min:] = np.nan
@@ -424,21 +2376,15 @@ def adaptive_search_radius(
             # ---- Index these values
             extrapolation_index = sparse_radii[western_limit_mask]
             # ---- Compute the OOS kriging weights
-            oos_mean = np.apply_along_axis(np.nanmean, 1, local_points[extrapolation_index, :k_min])
+            oos_mean = np.nanmean(local_points[extrapolation_index, :k_min], axis=1)
             # ---- Exponentiate the OOS mean
             oos_exp = np.exp(-oos_mean / search_radius)
             # ---- Update the OOS weights
             oos_weights[extrapolation_index] = oos_exp
             # ---- Get the outside indices that correspond to this tapered extrapolation
             sparse_extrapolation_index = nearby_indices[western_limit_mask].astype(float)
-            # ---- Apply indices as a mask to the NaN-masked distance matrix
-            extrapolated_distance = np.take_along_axis(
-                distance_matrix_masked[sparse_radii][western_limit_mask],
-                sparse_extrapolation_index.astype(int),
-                axis=1,
-            )
-            # ---- Create NaN mask
-            extrapolated_nan_mask = ~np.isnan(extrapolated_distance)
+            # ---- Apply indices as a mask to the search radius mask
+            extrapolated_nan_mask = within_radius_mask[extrapolation_index, :k_min]
             # -------- Apply mask to indices
             sparse_extrapolation_index_nan = sparse_extrapolation_index.copy()
             sparse_extrapolation_index_nan[extrapolated_nan_mask] = np.nan
@@ -446,7 +2392,7 @@ def adaptive_search_radius(
             oos_indices[extrapolation_index] = np.sort(sparse_extrapolation_index_nan)
             # ---- Get inside indices that apply to these points
             # -------- Create NaN mask for within-sample values
-            interpolated_nan_mask = np.isnan(extrapolated_distance)
+            interpolated_nan_mask = ~extrapolated_nan_mask
             # -------- Apply mask to indices
             sparse_interpolation_index_nan = sparse_extrapolation_index.copy()
             sparse_interpolation_index_nan[interpolated_nan_mask] = np.nan
@@ -472,42 +2418,96 @@ def adaptive_search_radius(
             )
 
     # Return output
-    return local_points[:, :k_max], wr_indices, oos_indices, oos_weights
+    return local_points, wr_indices, oos_indices, oos_weights
 
 
-def kriging_lambda(
-    anisotropy: float,
-    lagged_semivariogram: np.ndarray,
-    kriging_matrix: np.ndarray,
-):
+def validate_kriging_solver(solver: str):
     """
-    Apply singular value decomposition (SVD) to compute kriging (lambda) weights
+    Validate the kriging solver
 
     Parameters
     ----------
-    anisotropy: np.float64
-        Anisotropy ratio.
-    lagged_semivariogram: np.array
-        Lagged semivariogram
-    kriging_matrix: np.array
-        Kriging matrix.
+    solver: str
+        The linear solver used to compute the kriging weights.
     """
-    # Singular value decomposition (SVD)
-    # ---- U: left singular vectors (directions of maximum variance)
-    # ---- Sigma: singular values (amount of variance captured by each singular vector, U)
-    # ---- VH: conjugate transpose of the right singular vectors
-    U, Sigma, VH = np.linalg.svd(kriging_matrix, full_matrices=True)
 
-    # Create Sigma mask informed by the ratio-threshold
-    # ---- The ratio between all singular values and their respective
-    # ---- maximum is used to apply a mask that informs which values
-    # ---- are used to tabulate the kriging weights (aka lambda)
-    Sigma_mask = np.abs(Sigma / Sigma[0]) > anisotropy
+    if solver not in ["svd", "lu", "auto"]:
+        raise ValueError(
+            f"The kriging solver ('{solver}') is invalid. Only 'svd', 'lu', and 'auto' are valid "
+            f"inputs."
+        )
 
-    # Inverse masked semivariogram (K)
-    K_inv = np.matmul(
-        np.matmul(VH.T[:, Sigma_mask], np.diag(1.0 / Sigma[Sigma_mask])), U[:, Sigma_mask].T
-    )
 
-    # Calculate kriging weights (lambda)
-    return np.dot(K_inv, lagged_semivariogram)
+def validate_kriging_precision(precision: str):
+    """
+    Validate the kriging working precision
+
+    Parameters
+    ----------
+    precision: str
+        The floating-point precision used to compute the kriging weights.
+    """
+
+    if precision not in ["float64", "float32"]:
+        raise ValueError(
+            f"The kriging precision ('{precision}') is invalid. Only 'float64' and 'float32' are "
+            f"valid inputs."
+        )
+
+
+def validate_resolution_level(resolution_level: int):
+    """
+    Validate the kriging mesh resolution level
+
+    Parameters
+    ----------
+    resolution_level: int
+        The mesh coarsening level (see :func:`echopop.spatial.mesh.coarsen_mesh`), where level `i`
+        merges each `2 ** i x 2 ** i` block of cells and 0 is the full-resolution mesh.
+    """
+
+    if resolution_level not in [0, 1, 2, 3]:
+        raise ValueError(
+            f"The kriging mesh resolution level ('{resolution_level}') is invalid. Only 0 (full "
+            f"resolution), 1 (2x coarser), 2 (4x coarser), and 3 (8x coarser) are valid inputs."
+        )
+
+
+def validate_block_points(block_points: int):
+    """
+    Validate the number of block kriging discretization points
+
+    Parameters
+    ----------
+    block_points: int
+        The number of discretization points within each mesh cell.
+    """
+
+    if (
+        not isinstance(block_points, (int, np.integer))
+        or block_points < 1
+        or int(round(np.sqrt(block_points))) ** 2 != block_points
+    ):
+        raise ValueError(
+            f"The number of block kriging discretization points ('{block_points}') is invalid. "
+            f"Only positive square numbers (e.g. 4, 9, or 16) are valid inputs."
+        )
+
+
+def update_solver_counts(solver_counts: Optional[dict], n_lu: int, n_svd: int):
+    """
+    Increment the number of kriging systems solved by each linear solver path
+
+    Parameters
+    ----------
+    solver_counts: Optional[dict]
+        A dictionary of counts keyed by the solver path ('lu' and 'svd').
+    n_lu: int
+        The number of systems solved directly via LU decomposition.
+    n_svd: int
+        The number of systems solved via truncated singular value decomposition.
+    """
+
+    if solver_counts is not None:
+        solver_counts["lu"] = solver_counts.get("lu", 0) + int(n_lu)
+        solver_counts["svd"] = solver_counts.get("svd", 0) + int(n_svd)
@@ -1,12 +1,17 @@
-from typing import Union
+import hashlib
+import json
+import warnings
+from pathlib import Path
+from typing import Optional, Union
 
-import geopandas as gpd
-import geopy.distance
 import numpy as np
 import pandas as pd
-from scipy import interpolate
+import shapely
+from scipy import interpolate, sparse
+from scipy.sparse import csgraph
+from scipy.spatial import cKDTree
 
-from ..spatial.projection import wgs84_to_utm
+from ..spatial.projection import geodesic_distance, wgs84_to_utm_coordinates
 from ..spatial.transect import transect_bearing, transect_extent
 
 
@@ -61,16 +66,13 @@ def hull_crop_method(transect_data: pd.DataFrame, mesh_data: pd.DataFrame, setti
     # ---- Grid buffer distance (nmi)
     mesh_buffer_distance = settings_dict["mesh_buffer_distance"]
 
-    # Convert the mesh dataframes to a geodataframe
-    mesh_gdf = gpd.GeoDataFrame(
-        mesh_data,
-        geometry=gpd.points_from_xy(mesh_data["longitude"], mesh_data["latitude"]),
-        crs=settings_dict["projection"],
+    # Convert the mesh coordinates to UTM (m)
+    mesh_x, mesh_y = wgs84_to_utm_coordinates(
+        mesh_data["longitude"].to_numpy(),
+        mesh_data["latitude"].to_numpy(),
+        settings_dict["projection"],
     )
 
-    # Convert the mesh projection to UTM (m) -- In place
-    wgs84_to_utm(mesh_gdf)
-
     # Determine the survey extent by generating the border polygon
     survey_polygon = transect_extent(
         transect_data, settings_dict["projection"], num_nearest_transects
@@ -79,13 +81,18 @@ def hull_crop_method(transect_data: pd.DataFrame, mesh_data: pd.DataFrame, setti
     # Find the mesh coordinates that fall within the buffered polygon
     # ---- Convert `grid_buffer` (nmi) to m and add buffer to polygon
     survey_polygon_buffered = survey_polygon.buffer(mesh_buffer_distance * 1852)
+    # ---- Prepare the polygon for repeated predicate evaluations
+    shapely.prepare(survey_polygon_buffered)
+    # ---- Build the spatial index over the mesh points
+    mesh_tree = shapely.STRtree(shapely.points(mesh_x, mesh_y))
+    # ---- Query the points within the polygon (candidates are prefiltered by their bounding boxes)
+    within_polygon_indices = mesh_tree.query(survey_polygon_buffered, predicate="contains")
     # ---- Inclusion/union filter mask
-    within_polygon_mask = mesh_gdf.geometry.within(survey_polygon_buffered)
-    # ---- Apply mask to the mesh grid
-    mesh_gdf_masked = mesh_gdf[within_polygon_mask]
+    within_polygon_mask = np.zeros(len(mesh_data), dtype=bool)
+    within_polygon_mask[within_polygon_indices] = True
 
     # Return the masked mesh dataframe
-    return mesh_gdf_masked.drop(columns="geometry")
+    return mesh_data[within_polygon_mask]
 
 
 def transect_ends_crop_method(
@@ -197,24 +204,18 @@ def transect_ends_crop_method(
         region_3_latitude, transect_data.loc[3], "latitude", "longitude"
     )
 
-    # Iterate through each region to crop the mesh
+    # Compute the bounds of each interpolated step within each region to crop the mesh
     # ---- Region 1
-    region_1_index = []
     # -------- Compute the change in longitude (degrees)
     delta_longitude = latitude_resolution_deg * np.cos(np.radians(region_1_latitude))
-    # -------- Iterate through
-    for i in range(len(delta_longitude)):
-        # -------- Find the mesh indices that are within the survey extent
-        idx = np.where(
-            (mesh_data["longitude"] >= region_1_extents[0][i] - delta_longitude[i])
-            & (mesh_data["longitude"] <= region_1_extents[1][i] + delta_longitude[i])
-            & (mesh_data["latitude"] >= region_1_latitude[i] - latitude_resolution_deg)
-            & (mesh_data["latitude"] < region_1_latitude[i] + latitude_resolution_deg)
-        )
-        # -------- Append the indices
-        region_1_index.append(idx[0])
+    # -------- Find the mesh indices that are within the survey extent
+    region_1_index = mesh_bounds_join(
+        mesh_data,
+        (region_1_extents[0] - delta_longitude, region_1_extents[1] + delta_longitude),
+        (region_1_latitude - latitude_resolution_deg, region_1_latitude + latitude_resolution_deg),
+        "latitude",
+    )
     # ---- Region 2
-    region_2_index = []
     # -------- Extract the northern and southern components separately
     # -------- North
     transect_north = transect_data.loc[
@@ -224,56 +225,47 @@ def transect_ends_crop_method(
     transect_south = transect_data.loc[
         transect_data["latitude"] == transect_data["latitude_south"]
     ].loc[2]
-    # -------- Iterate through
-    for i in range(len(region_2_extents[0])):
-        # -------- Find the mesh indices that are within the survey extent: southern limit
-        if np.isnan(region_2_extents[0][i]) | np.isnan(region_2_extents[1][i]):
-            # -------- Compute the indices for the northern- and southernmost coordinates
-            # -------- North
-            lon_n_min = np.argmin(np.abs(region_2_longitude[i] - transect_north["longitude"]))
-            # -------- South
-            lon_s_min = np.argmin(np.abs(region_2_longitude[i] - transect_south["longitude"]))
-            # -------- Slope
-            slope = (
-                transect_north["latitude"].iloc[lon_n_min]
-                - transect_south["latitude"].iloc[lon_s_min]
-            ) / (
-                transect_north["longitude"].iloc[lon_n_min]
-                - transect_south["longitude"].iloc[lon_s_min]
-            )
-            # -------- Set a new border threshold
-            latitude_slope_i = (
-                slope * (region_2_longitude[i] - transect_south["longitude"].iloc[lon_s_min])
-                + transect_south["latitude"].iloc[lon_s_min]
-            )
-            if np.isnan(region_2_extents[0][i]):
-                # -------- Find the mesh indices that are within the survey extent
-                idx = np.where(
-                    (mesh_data["longitude"] >= region_2_longitude[i] - longitude_resolution_deg)
-                    & (mesh_data["longitude"] <= region_2_longitude[i] + longitude_resolution_deg)
-                    & (mesh_data["latitude"] >= latitude_slope_i - latitude_resolution_deg)
-                    & (mesh_data["latitude"] < region_2_extents[1][i] + latitude_resolution_deg)
-                )
-            else:
-                # -------- Find the mesh indices that are within the survey extent
-                idx = np.where(
-                    (mesh_data["longitude"] >= region_2_longitude[i] - longitude_resolution_deg)
-                    & (mesh_data["longitude"] <= region_2_longitude[i] + longitude_resolution_deg)
-                    & (mesh_data["latitude"] >= region_2_extents[0][i] - latitude_resolution_deg)
-                    & (mesh_data["latitude"] < latitude_slope_i + latitude_resolution_deg)
-                )
-        else:
-            # -------- Find the mesh indices that are within the survey extent
-            idx = np.where(
-                (mesh_data["longitude"] >= region_2_longitude[i] - longitude_resolution_deg)
-                & (mesh_data["longitude"] <= region_2_longitude[i] + longitude_resolution_deg)
-                & (mesh_data["latitude"] >= region_2_extents[0][i] - latitude_resolution_deg)
-                & (mesh_data["latitude"] < region_2_extents[1][i] + latitude_resolution_deg)
-            )
-        # -------- Append the indices
-        region_2_index.append(idx[0])
+    # -------- Compute the indices for the northern- and southernmost coordinates
+    # -------- North
+    lon_n_min = np.argmin(
+        np.abs(region_2_longitude[:, np.newaxis] - transect_north["longitude"].to_numpy()), axis=1
+    )
+    # -------- South
+    lon_s_min = np.argmin(
+        np.abs(region_2_longitude[:, np.newaxis] - transect_south["longitude"].to_numpy()), axis=1
+    )
+    # -------- Slope
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (
+            transect_north["latitude"].to_numpy()[lon_n_min]
+            - transect_south["latitude"].to_numpy()[lon_s_min]
+        ) / (
+            transect_north["longitude"].to_numpy()[lon_n_min]
+            - transect_south["longitude"].to_numpy()[lon_s_min]
+        )
+        # -------- Set a new border threshold for steps where either extent is missing
+        latitude_slope = (
+            slope * (region_2_longitude - transect_south["longitude"].to_numpy()[lon_s_min])
+            + transect_south["latitude"].to_numpy()[lon_s_min]
+        )
+    # -------- Replace the missing southern or northern limits
+    region_2_south = np.where(np.isnan(region_2_extents[0]), latitude_slope, region_2_extents[0])
+    region_2_north = np.where(
+        np.isnan(region_2_extents[0]),
+        region_2_extents[1],
+        np.where(np.isnan(region_2_extents[1]), latitude_slope, region_2_extents[1]),
+    )
+    # -------- Find the mesh indices that are within the survey extent
+    region_2_index = mesh_bounds_join(
+        mesh_data,
+        (
+            region_2_longitude - longitude_resolution_deg,
+            region_2_longitude + longitude_resolution_deg,
+        ),
+        (region_2_south - latitude_resolution_deg, region_2_north + latitude_resolution_deg),
+        "longitude",
+    )
     # ---- Region 3
-    region_3_index = []
     # -------- Compute the change in longitude (degrees)
     delta_longitude = latitude_resolution_deg * np.cos(np.radians(region_3_latitude))
     # -------- Extract the northern and southern components separately
@@ -285,73 +277,128 @@ def transect_ends_crop_method(
     transect_east = transect_data.loc[
         transect_data["longitude"] == transect_data["longitude_east"]
     ].loc[3]
-    # -------- Iterate through
-    for i in range(len(region_3_extents[0])):
-        # -------- Find the mesh indices that are within the survey extent: southern limit
-        if np.isnan(region_3_extents[0][i]) | np.isnan(region_3_extents[1][i]):
-            # -------- Compute the indices for the northern- and southernmost coordinates
-            # -------- North
-            # lat_w_max = np.argmax(transect_west["latitude"])
-            lat_w_max = np.argmin(transect_west["latitude"])
-            # -------- South
-            # lat_e_max = np.argmax(transect_east["latitude"])
-            lat_e_max = np.argmin(transect_east["latitude"])
-            # -------- Slope
-            # slope = (
-            #     transect_west["longitude"].iloc[lat_w_max]
-            #     - transect_east["longitude"].iloc[lat_e_max]
-            # ) / (transect_west["latitude"].min() - transect_east["latitude"].min())
-            slope = (transect_west["latitude"].min() - transect_east["latitude"].min()) / (
-                transect_west["longitude"].iloc[lat_w_max]
-                - transect_east["longitude"].iloc[lat_e_max]
-            )
-            # -------- Set a new border threshold
-            longitude_slope_i = (
-                # slope * (region_3_latitude[i] - transect_east["latitude"].max())
-                slope * (region_3_latitude[i] - transect_east["latitude"].min())
-                + transect_east["longitude"].iloc[lat_e_max]
-            )
-            if np.isnan(region_3_extents[0][i]):
-                # -------- Find the mesh indices that are within the survey extent
-                idx = np.where(
-                    (mesh_data["longitude"] >= longitude_slope_i - delta_longitude[i])
-                    & (mesh_data["longitude"] <= region_3_extents[1][i] + delta_longitude[i])
-                    & (mesh_data["latitude"] >= region_3_latitude[i] - latitude_resolution_deg)
-                    & (mesh_data["latitude"] < region_3_latitude[i] + latitude_resolution_deg)
-                )
-            else:
-                # -------- Find the mesh indices that are within the survey extent
-                idx = np.where(
-                    (mesh_data["longitude"] >= region_3_extents[0][i] - delta_longitude[i])
-                    & (mesh_data["longitude"] <= longitude_slope_i + delta_longitude[i])
-                    & (mesh_data["latitude"] >= region_3_latitude[i] - latitude_resolution_deg)
-                    & (mesh_data["latitude"] < region_3_latitude[i] + latitude_resolution_deg)
-                )
-        else:
-            # -------- Find the mesh indices that are within the survey extent
-            idx = np.where(
-                (mesh_data["longitude"] >= region_3_extents[0][i] - delta_longitude[i])
-                & (mesh_data["longitude"] <= region_3_extents[1][i] + delta_longitude[i])
-                & (mesh_data["latitude"] >= region_3_latitude[i] - latitude_resolution_deg)
-                & (mesh_data["latitude"] < region_3_latitude[i] + latitude_resolution_deg)
-            )
-        # -------- Append the indices
-        region_3_index.append(idx[0])
+    # -------- Compute the indices for the northern- and southernmost coordinates
+    # -------- North
+    lat_w_max = np.argmin(transect_west["latitude"])
+    # -------- South
+    lat_e_max = np.argmin(transect_east["latitude"])
+    # -------- Slope
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (transect_west["latitude"].min() - transect_east["latitude"].min()) / (
+            transect_west["longitude"].iloc[lat_w_max] - transect_east["longitude"].iloc[lat_e_max]
+        )
+        # -------- Set a new border threshold for steps where either extent is missing
+        longitude_slope = (
+            slope * (region_3_latitude - transect_east["latitude"].min())
+            + transect_east["longitude"].iloc[lat_e_max]
+        )
+    # -------- Replace the missing western or eastern limits
+    region_3_west = np.where(np.isnan(region_3_extents[0]), longitude_slope, region_3_extents[0])
+    region_3_east = np.where(
+        np.isnan(region_3_extents[0]),
+        region_3_extents[1],
+        np.where(np.isnan(region_3_extents[1]), longitude_slope, region_3_extents[1]),
+    )
+    # -------- Find the mesh indices that are within the survey extent
+    region_3_index = mesh_bounds_join(
+        mesh_data,
+        (region_3_west - delta_longitude, region_3_east + delta_longitude),
+        (region_3_latitude - latitude_resolution_deg, region_3_latitude + latitude_resolution_deg),
+        "latitude",
+    )
     # ---- Concatenate the region indices
     interpolated_indices = np.unique(
-        np.concatenate(
-            [
-                np.concatenate(region_1_index),
-                np.concatenate(region_2_index),
-                np.concatenate(region_3_index),
-            ]
-        )
+        np.concatenate([region_1_index, region_2_index, region_3_index])
     )
 
     # Crop the mesh data and return the output
     return mesh_data.loc[interpolated_indices]
 
 
+def mesh_bounds_join(
+    mesh_data: pd.DataFrame,
+    longitude_bounds: tuple[np.ndarray, np.ndarray],
+    latitude_bounds: tuple[np.ndarray, np.ndarray],
+    sort_by: str = "latitude",
+) -> np.ndarray:
+    """
+    Find the mesh nodes that fall within any of a set of longitude-latitude bounding boxes
+
+    Parameters
+    ----------
+    mesh_data: pd.DataFrame
+        Kriging mesh.
+    longitude_bounds: tuple[np.ndarray, np.ndarray]
+        The lower and upper longitude bounds (inclusive) of each bounding box.
+    latitude_bounds: tuple[np.ndarray, np.ndarray]
+        The lower (inclusive) and upper (exclusive) latitude bounds of each bounding box.
+    sort_by: str
+        The coordinate ('latitude' or 'longitude') that is sorted and searched to find the
+        candidate mesh nodes of each bounding box.
+
+    Returns
+    ----------
+    mesh_indices: np.ndarray
+        The positional mesh indices within each bounding box (concatenated in the order of the
+        bounding boxes). Bounding boxes with missing (NaN) bounds are empty.
+
+    Notes
+    ----------
+    The mesh is sorted once along `sort_by` so that the candidate nodes of each bounding box form
+    a contiguous range that is located via `np.searchsorted`. Only these candidates are compared
+    against the remaining bounds, so the cost scales with the number of candidates rather than
+    with the number of bounding boxes times the number of mesh nodes.
+    """
+
+    # Extract the mesh coordinates
+    # ---- Longitude
+    longitude = mesh_data["longitude"].to_numpy()
+    # ---- Latitude
+    latitude = mesh_data["latitude"].to_numpy()
+
+    # Get the bounds as arrays
+    longitude_lower, longitude_upper = map(np.asarray, longitude_bounds)
+    latitude_lower, latitude_upper = map(np.asarray, latitude_bounds)
+
+    # Sort the mesh along the search coordinate
+    if sort_by == "latitude":
+        values, lower, upper, upper_side = latitude, latitude_lower, latitude_upper, "left"
+    else:
+        values, lower, upper, upper_side = longitude, longitude_lower, longitude_upper, "right"
+    # ---- Sort
+    order = np.argsort(values, kind="stable")
+
+    # Find the range of sorted candidates within each bounding box
+    start = np.searchsorted(values[order], lower, side="left")
+    stop = np.searchsorted(values[order], upper, side=upper_side)
+    # ---- Drop bounding boxes with missing bounds
+    valid = ~(
+        np.isnan(longitude_lower)
+        | np.isnan(longitude_upper)
+        | np.isnan(latitude_lower)
+        | np.isnan(latitude_upper)
+    )
+    # ---- Count the candidates
+    counts = np.where(valid, np.maximum(stop - start, 0), 0)
+
+    # Expand the candidates of each bounding box
+    # ---- Map each candidate to its bounding box
+    box = np.repeat(np.arange(len(counts)), counts)
+    # ---- Get the positional mesh indices
+    candidates = order[start[box] + np.arange(counts.sum()) - (np.cumsum(counts) - counts)[box]]
+
+    # Apply the bounding box limits
+    within = (
+        (longitude[candidates] >= longitude_lower[box])
+        & (longitude[candidates] <= longitude_upper[box])
+        & (latitude[candidates] >= latitude_lower[box])
+        & (latitude[candidates] < latitude_upper[box])
+    )
+
+    # Return output
+    return candidates[within]
+
+
 def griddify_lag_distances(
     coordinates_1: Union[pd.DataFrame, np.ndarray],
     coordinates_2: Union[pd.DataFrame, np.ndarray],
@@ -539,11 +586,11 @@ def mesh_to_transects(
         "longitude"
     ].max()
     # ---- Calculate virtual transect distances
-    virtual_transect_summary["transect_distance"] = virtual_transect_summary.apply(
-        lambda row: geopy.distance.distance(
-            (row["latitude"], row["longitude_min"]), (row["latitude"], row["longitude_max"])
-        ).nm,
-        axis=1,
+    virtual_transect_summary["transect_distance"] = geodesic_distance(
+        virtual_transect_summary["longitude_min"],
+        virtual_transect_summary["latitude"],
+        virtual_transect_summary["longitude_max"],
+        virtual_transect_summary["latitude"],
     )
     # ---- Calculate the difference in latitude across the virtual transects (edge cases are handled
     # ---- using an additional step)
@@ -553,12 +600,11 @@ def mesh_to_transects(
         np.nanmean(np.diff(virtual_transect_summary["latitude"])),
     )
     # ---- Calculate the mean latitudinal distances to represent the mean transect spacing
-    virtual_transect_summary["mean_spacing"] = virtual_transect_summary.apply(
-        lambda row: geopy.distance.distance(
-            (row["latitude"], row["longitude_mean"]),
-            (row["latitude"] + row["d_latitude"], row["longitude_mean"]),
-        ).nm,
-        axis=1,
+    virtual_transect_summary["mean_spacing"] = geodesic_distance(
+        virtual_transect_summary["longitude_mean"],
+        virtual_transect_summary["latitude"],
+        virtual_transect_summary["longitude_mean"],
+        virtual_transect_summary["latitude"] + virtual_transect_summary["d_latitude"],
     )
     # ---- Calculate area
     virtual_transect_summary["transect_area"] = np.where(
@@ -647,3 +693,503 @@ def interpolate_survey_extent(
 
     # Apply the interpolators to the new coordinates and return the outputs
     return interpolator_lower(new_coords), interpolator_upper(new_coords)
+
+
+def mesh_cache_key(
+    mesh_data: pd.DataFrame,
+    transect_data: pd.DataFrame,
+    isobath_data: pd.DataFrame,
+    settings_dict: dict,
+) -> str:
+    """
+    Compute the content-addressed key of a cropped and coordinate-standardized kriging mesh
+
+    Parameters
+    ----------
+    mesh_data: pd.DataFrame
+        Kriging mesh.
+    transect_data: pd.DataFrame
+        Georeferenced transect data.
+    isobath_data: pd.DataFrame
+        Reference grid (200 m isobath) used for standardizing the coordinates.
+    settings_dict: dict
+        Dictionary that contains all of the analysis settings that detail specific algorithm
+        arguments and user-defined inputs.
+
+    Returns
+    ----------
+    cache_key: str
+        A SHA-256 digest of the mesh, transect coordinates, reference grid, the cropping settings
+        (including the projection used for the convex hull), and the coordinate standardization
+        settings.
+    """
+
+    # Initialize the hash
+    digest = hashlib.sha256()
+
+    # Hash the dataframes
+    for dataframe in [
+        mesh_data,
+        transect_data[["transect_num", "longitude", "latitude"]],
+        isobath_data,
+    ]:
+        # ---- Column names
+        digest.update(json.dumps(list(map(str, dataframe.columns))).encode())
+        # ---- Values
+        digest.update(pd.util.hash_pandas_object(dataframe, index=True).to_numpy().tobytes())
+
+    # Hash the settings that determine the cropped and standardized mesh
+    digest.update(
+        json.dumps(
+            {
+                "cropping_parameters": settings_dict["cropping_parameters"],
+                "extrapolate": settings_dict["extrapolate"],
+                "projection": settings_dict.get("projection"),
+                "standardize_coordinates": settings_dict["standardize_coordinates"],
+                "standardization_parameters": {
+                    key: settings_dict["kriging_parameters"].get(key)
+                    for key in ["longitude_reference", "longitude_offset", "latitude_offset"]
+                },
+            },
+            sort_keys=True,
+            default=str,
+        ).encode()
+    )
+
+    # Return output
+    return digest.hexdigest()
+
+
+def load_cached_mesh(cache_directory: Union[str, Path], cache_key: str) -> Optional[pd.DataFrame]:
+    """
+    Load a cropped and coordinate-standardized kriging mesh from the on-disk cache
+
+    Parameters
+    ----------
+    cache_directory: Union[str, Path]
+        The cache directory.
+    cache_key: str
+        The mesh cache key (see :func:`mesh_cache_key`).
+
+    Returns
+    ----------
+    mesh_data: Optional[pd.DataFrame]
+        The cached mesh, or `None` when the mesh has not been cached.
+    """
+
+    # Get the filepath
+    cache_file = Path(cache_directory) / f"mesh_{cache_key}.npz"
+
+    # Return None when no cached mesh exists
+    if not cache_file.exists():
+        return None
+
+    # Read the file
+    try:
+        with np.load(cache_file, allow_pickle=False) as cached:
+            columns = cached["columns"].tolist()
+            mesh_data = pd.DataFrame(
+                {column: cached[f"column_{i}"] for i, column in enumerate(columns)},
+                index=cached["index"],
+            )
+    except (OSError, ValueError, KeyError):
+        # ---- Corrupted or incompatible files are treated as a cache miss
+        return None
+
+    # Mark the file as recently used for the least-recently-used (LRU) eviction
+    cache_file.touch()
+
+    # Return output
+    return mesh_data
+
+
+def save_cached_mesh(
+    cache_directory: Union[str, Path],
+    cache_key: str,
+    mesh_data: pd.DataFrame,
+    max_cache_size: Optional[float] = None,
+):
+    """
+    Write a cropped and coordinate-standardized kriging mesh to the on-disk cache
+
+    Parameters
+    ----------
+    cache_directory: Union[str, Path]
+        The cache directory, which is created if it does not exist.
+    cache_key: str
+        The mesh cache key (see :func:`mesh_cache_key`).
+    mesh_data: pd.DataFrame
+        The cropped and coordinate-standardized kriging mesh.
+    max_cache_size: Optional[float]
+        The maximum total size (bytes) of the cached meshes. The least-recently-used (LRU) files
+        are removed until the cache fits within this size. When `None`, no files are removed.
+
+    Notes
+    ----------
+    Each column is stored as a separate array within a `.npz` archive. Meshes with object-dtype
+    or extension-dtype (e.g. categorical) columns are not cached since they cannot be read back
+    without unpickling.
+    """
+
+    # Skip meshes that cannot be stored without pickling
+    if not all(
+        isinstance(dtype, np.dtype) and dtype.kind != "O"
+        for dtype in [*mesh_data.dtypes, mesh_data.index.dtype]
+    ):
+        return
+
+    # Create the cache directory, if necessary
+    cache_directory = Path(cache_directory)
+    cache_directory.mkdir(parents=True, exist_ok=True)
+
+    # Write the file
+    # ---- Write to a temporary file first so that partially written files are never read
+    temporary_file = cache_directory / f"mesh_{cache_key}.tmp.npz"
+    np.savez(
+        temporary_file,
+        columns=np.array(list(map(str, mesh_data.columns))),
+        index=mesh_data.index.to_numpy(),
+        **{f"column_{i}": mesh_data[column].to_numpy() for i, column in enumerate(mesh_data)},
+    )
+    # ---- Rename
+    temporary_file.replace(cache_directory / f"mesh_{cache_key}.npz")
+
+    # Evict the least-recently-used files
+    if max_cache_size is not None:
+        evict_mesh_cache(cache_directory, max_cache_size)
+
+
+def evict_mesh_cache(cache_directory: Union[str, Path], max_cache_size: float):
+    """
+    Remove the least-recently-used (LRU) cached meshes until the cache fits within a size limit
+
+    Parameters
+    ----------
+    cache_directory: Union[str, Path]
+        The cache directory.
+    max_cache_size: float
+        The maximum total size (bytes) of the cached meshes.
+
+    Notes
+    ----------
+    The most recently used file is always kept, even when it alone exceeds `max_cache_size`, so
+    that a mesh is never evicted immediately after being written.
+    """
+
+    # Get the cached files ordered from the most to the least recently used
+    cache_files = sorted(
+        Path(cache_directory).glob("mesh_*.npz"), key=lambda f: f.stat().st_mtime, reverse=True
+    )
+
+    # Return early if the cache is empty
+    if not cache_files:
+        return
+
+    # Keep the most recently used file
+    cumulative_size = cache_files[0].stat().st_size
+    # ---- Warn if it alone exceeds the limit
+    if cumulative_size > max_cache_size:
+        warnings.warn(
+            f"The cached mesh '{cache_files[0].name}' ({cumulative_size} bytes) exceeds the "
+            f"maximum cache size ({max_cache_size} bytes) and will be retained until the next "
+            "write."
+        )
+
+    # Remove the remaining files once the cumulative size exceeds the limit
+    for cache_file in cache_files[1:]:
+        cumulative_size += cache_file.stat().st_size
+        if cumulative_size > max_cache_size:
+            cache_file.unlink(missing_ok=True)
+
+
+def mesh_resolution(
+    mesh_data: pd.DataFrame, coordinates: Optional[tuple[str, str]] = None
+) -> tuple[float, float]:
+    """
+    Estimate the longitudinal and latitudinal (or x- and y-axis) spacing of a gridded kriging mesh
+
+    Parameters
+    ----------
+    mesh_data: pd.DataFrame
+        Kriging mesh.
+    coordinates: Optional[tuple[str, str]]
+        The names of the horizontal and vertical coordinate columns (e.g. `("x", "y")`). When
+        `None`, the longitude and latitude columns are used.
+
+    Returns
+    ----------
+    longitude_spacing, latitude_spacing: tuple[float, float]
+        The median spacing between adjacent mesh nodes along each axis (in the units of the
+        coordinates).
+    """
+
+    # Extract the mesh coordinates
+    if coordinates is None:
+        # ---- Longitude
+        lon_col = [col for col in mesh_data.columns if "lon" in col.lower()][0]
+        # ---- Latitude
+        lat_col = [col for col in mesh_data.columns if "lat" in col.lower()][0]
+        # ---- Get the arrays
+        horizontal, vertical = mesh_data[lon_col].to_numpy(), mesh_data[lat_col].to_numpy()
+        # ---- Scale the longitudes so that distances are approximately isotropic
+        horizontal_scale = np.cos(np.radians(np.median(vertical)))
+    else:
+        # ---- Get the arrays
+        horizontal, vertical = (mesh_data[column].to_numpy() for column in coordinates)
+        # ---- No scaling
+        horizontal_scale = 1.0
+    # ---- Stack
+    points = np.column_stack([horizontal * horizontal_scale, vertical])
+
+    # Find the nodes within the 3 x 3 neighborhood of each node
+    _, neighbors = cKDTree(points).query(points, k=min(9, len(points)))
+    # ---- Compute the absolute offsets to each neighbor (n_mesh, k - 1, 2)
+    offsets = np.abs(points[neighbors[:, 1:]] - points[:, np.newaxis, :])
+    # ---- Classify the neighbors as zonal (east-west) or meridional (north-south)
+    zonal = offsets[..., 0] > offsets[..., 1]
+
+    # Compute the spacing along each axis from the closest neighbor in each direction
+    with warnings.catch_warnings():
+        # ---- Nodes without neighbors along an axis (e.g. at corners) are ignored
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        longitude_spacing = np.nanmedian(
+            np.nanmin(np.where(zonal, offsets[..., 0], np.nan), axis=1)
+        )
+        latitude_spacing = np.nanmedian(
+            np.nanmin(np.where(~zonal, offsets[..., 1], np.nan), axis=1)
+        )
+
+    # Validate
+    if not (np.isfinite(longitude_spacing) and np.isfinite(latitude_spacing)):
+        raise ValueError(
+            "The kriging mesh resolution could not be determined. The mesh must comprise "
+            "multiple nodes along both the longitudinal and latitudinal axes."
+        )
+
+    # Return output
+    return longitude_spacing / horizontal_scale, latitude_spacing
+
+
+def mesh_lattice_index(mesh_data: pd.DataFrame, projection: str = "epsg:4326") -> np.ndarray:
+    """
+    Recover the integer column and row indices of each node of a gridded kriging mesh
+
+    Parameters
+    ----------
+    mesh_data: pd.DataFrame
+        Kriging mesh.
+    projection: str
+        The coordinate reference system of the mesh longitudes and latitudes.
+
+    Returns
+    ----------
+    lattice_index: np.ndarray
+        A 2D integer array (n_mesh, 2) with the non-negative column and row index of each mesh
+        node.
+
+    Notes
+    ----------
+    Gridded meshes (e.g. the 2.5 nmi mesh) are regular in a projected coordinate system, so their
+    longitudinal spacing (in degrees) varies with latitude and their rows are not aligned with
+    parallels. The indices are therefore recovered from the mesh topology rather than by binning
+    the coordinates. The mesh is projected to UTM and rotated so that the grid axes are aligned
+    with the coordinate axes. Each node is then linked to its adjacent nodes along each axis, and
+    the index offsets are accumulated along a minimum spanning tree of these links. The tree
+    favors the links closest to a single grid step, so that the shifted centroids of cells cut by
+    the survey polygon do not corrupt the indices of the remaining nodes.
+    """
+
+    # Get the number of mesh nodes
+    n_mesh = len(mesh_data)
+    if n_mesh < 2:
+        return np.zeros((n_mesh, 2), dtype=int)
+
+    # Project the mesh coordinates
+    # ---- Longitude
+    longitude = mesh_data[[col for col in mesh_data.columns if "lon" in col.lower()][0]].to_numpy()
+    # ---- Latitude
+    latitude = mesh_data[[col for col in mesh_data.columns if "lat" in col.lower()][0]].to_numpy()
+    # ---- Convert to UTM (m)
+    points = np.column_stack(wgs84_to_utm_coordinates(longitude, latitude, projection))
+
+    # Align the grid axes with the coordinate axes
+    # ---- Get the offset to the nearest node, which is always along one of the grid axes
+    _, nearest = cKDTree(points).query(points, k=2)
+    nearest_offsets = points[nearest[:, 1]] - points
+    # ---- Average the grid orientation modulo 90 degrees
+    grid_angle = (
+        np.angle(np.exp(4j * np.arctan2(nearest_offsets[:, 1], nearest_offsets[:, 0])).mean()) / 4.0
+    )
+    # ---- Rotate
+    rotation = np.array(
+        [[np.cos(grid_angle), np.sin(grid_angle)], [-np.sin(grid_angle), np.cos(grid_angle)]]
+    )
+    points = points @ rotation.T
+    # ---- Scale to unit spacing along each axis
+    points = points / mesh_resolution(pd.DataFrame(points, columns=["x", "y"]), ("x", "y"))
+
+    # Link each node to its adjacent nodes along each axis
+    # ---- Get the 4 nearest nodes
+    distance, neighbors = cKDTree(points).query(points, k=min(5, n_mesh))
+    # ---- Flatten the links
+    head = np.repeat(np.arange(n_mesh), neighbors.shape[1] - 1)
+    tail = neighbors[:, 1:].ravel()
+    offsets = points[tail] - points[head]
+    # ---- Round to the nearest grid step
+    steps = np.rint(offsets)
+    # ---- Retain the links that span a single step along one axis
+    adjacent = (distance[:, 1:].ravel() < 1.5) & (np.abs(steps).sum(axis=1) == 1)
+    # ---- Deviation from a single grid step (offset to keep exact links within the sparse graph)
+    deviation = np.linalg.norm(offsets - steps, axis=1)[adjacent] + 1e-6
+
+    # Build the minimum spanning tree of the links
+    link_graph = sparse.csr_matrix(
+        (deviation, (head[adjacent], tail[adjacent])), shape=(n_mesh, n_mesh)
+    )
+    spanning_tree = csgraph.minimum_spanning_tree(link_graph.maximum(link_graph.T))
+    # ---- Get the connected components (e.g. disjoint regions of the mesh)
+    _, component = csgraph.connected_components(spanning_tree, directed=False)
+
+    # Get the parent of each node within the tree of each component
+    parent = np.arange(n_mesh)
+    for root in np.unique(component, return_index=True)[1]:
+        _, predecessors = csgraph.breadth_first_order(
+            spanning_tree, root, directed=False, return_predecessors=True
+        )
+        reached = predecessors >= 0
+        parent[reached] = predecessors[reached]
+
+    # Accumulate the grid steps from each node to the root of its tree via pointer jumping
+    lattice_index = np.rint(points - points[parent]).astype(int)
+    while np.any(parent != parent[parent]):
+        lattice_index += lattice_index[parent]
+        parent = parent[parent]
+
+    # Align the components with each other using their rounded coordinates
+    for label in np.unique(component):
+        members = component == label
+        lattice_index[members] += np.median(
+            np.rint(points[members]) - lattice_index[members], axis=0
+        ).astype(int)
+
+    # Return output
+    return lattice_index - lattice_index.min(axis=0)
+
+
+def coarsen_mesh(mesh_data: pd.DataFrame, factor: int, projection: str = "epsg:4326") -> dict:
+    """
+    Aggregate a gridded kriging mesh into coarser cells
+
+    Parameters
+    ----------
+    mesh_data: pd.DataFrame
+        Kriging mesh.
+    factor: int
+        The number of mesh cells along each axis that are merged into a single coarse cell (e.g.
+        2 merges each 2 x 2 block of cells).
+    projection: str
+        The coordinate reference system of the mesh longitudes and latitudes.
+
+    Returns
+    ----------
+    coarse_mesh: dict
+        A dictionary comprising the aggregation 'factor', the coarse mesh ('mesh_df'), the
+        position of the coarse cell that contains each mesh node ('parent_index'), and the
+        column and row indices of each coarse cell ('block_index').
+
+    Notes
+    ----------
+    The column and row indices of each mesh cell are recovered from the mesh topology (see
+    :func:`mesh_lattice_index`), so each coarse cell comprises at most `factor ** 2` mesh cells.
+    The 'fraction_cell_in_polygon' of a coarse cell is the summed fraction of its member cells
+    divided by `factor ** 2`, so the area of a coarse cell is `factor ** 2` times the area of a
+    mesh cell (`A0`). The remaining floating-point columns (e.g. the centroid coordinates) are
+    averaged with weights proportional to the fraction of each member cell within the survey
+    polygon. Other columns cannot be aggregated and are replaced by the integer 'parent_id' of
+    each coarse cell, which matches the values of 'parent_index'.
+    """
+
+    # Compute the column and row indices of each mesh cell
+    lattice_index = mesh_lattice_index(mesh_data, projection)
+
+    # Map each mesh cell to its coarse cell
+    block_index, parent_index = np.unique(lattice_index // factor, axis=0, return_inverse=True)
+    # ---- Flatten (the inverse array shape varies across numpy versions)
+    parent_index = parent_index.ravel()
+    # ---- Count the coarse cells
+    n_blocks = len(block_index)
+
+    # Aggregate the fraction of each coarse cell within the survey polygon
+    fraction = mesh_data["fraction_cell_in_polygon"].to_numpy(dtype=float)
+    fraction_sum = np.bincount(parent_index, weights=fraction, minlength=n_blocks)
+
+    # Compute the weighted mean of the remaining columns
+    # ---- Weights (coarse cells without any overlap with the polygon are averaged uniformly)
+    weights = np.where(fraction_sum[parent_index] > 0.0, fraction, 1.0)
+    weight_sum = np.bincount(parent_index, weights=weights, minlength=n_blocks)
+    # ---- Aggregate
+    coarse_mesh = pd.DataFrame(
+        {
+            "parent_id": np.arange(n_blocks),
+            **{
+                column: (
+                    fraction_sum / factor**2
+                    if column == "fraction_cell_in_polygon"
+                    else np.bincount(
+                        parent_index,
+                        weights=weights * mesh_data[column].to_numpy(),
+                        minlength=n_blocks,
+                    )
+                    / weight_sum
+                )
+                for column in mesh_data.columns
+                if pd.api.types.is_float_dtype(mesh_data[column])
+            },
+        }
+    )
+
+    # Return output
+    return {
+        "factor": factor,
+        "mesh_df": coarse_mesh,
+        "parent_index": parent_index,
+        "block_index": block_index,
+    }
+
+
+def block_neighbor_gradient(values: np.ndarray, block_index: np.ndarray) -> np.ndarray:
+    """
+    Compute the largest absolute difference between each coarse mesh cell and its neighbors
+
+    Parameters
+    ----------
+    values: np.ndarray
+        The value (n_blocks,) of each coarse cell.
+    block_index: np.ndarray
+        The column and row indices (n_blocks, 2) of each coarse cell (see :func:`coarsen_mesh`).
+
+    Returns
+    ----------
+    gradient: np.ndarray
+        The largest absolute difference (n_blocks,) between each cell and its (up to 8) adjacent
+        cells. Missing (NaN) values are ignored.
+    """
+
+    # Pad the grid so that every cell has a full neighborhood
+    grid = np.full(block_index.max(axis=0) + 3, np.nan)
+    # ---- Populate
+    grid[block_index[:, 0] + 1, block_index[:, 1] + 1] = values
+
+    # Compare each cell against its neighbors
+    gradient = np.zeros(len(values))
+    for d_column in (-1, 0, 1):
+        for d_row in (-1, 0, 1):
+            if d_column == 0 and d_row == 0:
+                continue
+            # ---- Get the neighboring values
+            neighbor_values = grid[block_index[:, 0] + 1 + d_column, block_index[:, 1] + 1 + d_row]
+            # ---- Update the maximum difference
+            gradient = np.fmax(gradient, np.abs(neighbor_values - values))
+
+    # Return output
+    return gradient
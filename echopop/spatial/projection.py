@@ -1,10 +1,15 @@
+from functools import lru_cache
 from typing import Optional, Tuple
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+from pyproj import Geod, Transformer
 from scipy import interpolate
 
+# Conversion factor: meters to nautical miles
+METERS_TO_NMI = 1.0 / 1852.0
+
 
 def utm_string_generator(longitude: float, latitude: float):
     """
@@ -60,6 +65,120 @@ def wgs84_to_utm(geodataframe: gpd.GeoDataFrame):
     geodataframe.to_crs(f"epsg:{utm_code}", inplace=True)
 
 
+@lru_cache(maxsize=32)
+def utm_transformer(projection: str, utm_code: str) -> Transformer:
+    """
+    Get a (cached) coordinate transformer from a projection to UTM
+
+    Parameters
+    ----------
+    projection: str
+        The source coordinate reference system (e.g. 'epsg:4326').
+    utm_code: str
+        The UTM EPSG code (see :func:`utm_string_generator`).
+    """
+
+    return Transformer.from_crs(projection, f"epsg:{utm_code}", always_xy=True)
+
+
+def wgs84_to_utm_coordinates(
+    longitude: np.ndarray, latitude: np.ndarray, projection: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts longitude/latitude (WGS84) coordinate arrays to UTM without constructing a
+    GeoDataFrame
+
+    Parameters
+    ----------
+    longitude: np.ndarray
+        Longitude coordinates
+    latitude: np.ndarray
+        Latitude coordinates
+    projection: str
+        The coordinate reference system of the input coordinates (e.g. 'epsg:4326').
+
+    Returns
+    ----------
+    x, y: Tuple[np.ndarray, np.ndarray]
+        The UTM easting and northing (m). The UTM zone is determined from the median coordinates,
+        which matches :func:`wgs84_to_utm`.
+    """
+
+    # Generate the equivalent UTM EPSG string
+    utm_code = utm_string_generator(np.median(longitude), np.median(latitude))
+
+    # Apply the CRS change
+    return utm_transformer(projection, utm_code).transform(
+        np.asarray(longitude, dtype=float), np.asarray(latitude, dtype=float)
+    )
+
+
+@lru_cache(maxsize=4)
+def geodesic_ellipsoid(ellipsoid: str = "WGS84") -> Geod:
+    """
+    Get a (cached) geodesic calculator for a reference ellipsoid
+
+    Parameters
+    ----------
+    ellipsoid: str
+        The reference ellipsoid name (e.g. 'WGS84').
+    """
+
+    return Geod(ellps=ellipsoid)
+
+
+def geodesic_distance(
+    longitude_1: np.ndarray,
+    latitude_1: np.ndarray,
+    longitude_2: np.ndarray,
+    latitude_2: np.ndarray,
+    ellipsoid: str = "WGS84",
+) -> np.ndarray:
+    """
+    Calculate the geodesic distances (nmi) between paired longitude/latitude coordinate arrays
+
+    Parameters
+    ----------
+    longitude_1: np.ndarray
+        Longitude coordinates of the starting points
+    latitude_1: np.ndarray
+        Latitude coordinates of the starting points
+    longitude_2: np.ndarray
+        Longitude coordinates of the end points
+    latitude_2: np.ndarray
+        Latitude coordinates of the end points
+    ellipsoid: str
+        The reference ellipsoid name (e.g. 'WGS84').
+
+    Returns
+    ----------
+    np.ndarray
+        The geodesic distance (nmi) between each pair of points.
+
+    Notes
+    -----
+    Distances are computed on whole arrays via :meth:`pyproj.Geod.inv`, which implements the
+    same Karney (2013) algorithm used by :func:`geopy.distance.geodesic`. Missing coordinates
+    propagate as NaN.
+    """
+
+    # Broadcast the coordinates to a common shape
+    lon_1, lat_1, lon_2, lat_2 = np.broadcast_arrays(
+        *(
+            np.asarray(coordinate, dtype=float)
+            for coordinate in (longitude_1, latitude_1, longitude_2, latitude_2)
+        )
+    )
+
+    # Compute the forward/back azimuths and distances (m)
+    _, _, distance = geodesic_ellipsoid(ellipsoid).inv(
+        lon_1.ravel(), lat_1.ravel(), lon_2.ravel(), lat_2.ravel()
+    )
+
+    # Return the distances (nmi)
+    return np.asarray(distance, dtype=float).reshape(lon_1.shape) * METERS_TO_NMI
+
+
 def transform_geometry(
     dataframe: pd.DataFrame,
     reference_grid: pd.DataFrame,
@@ -1,13 +1,12 @@
 from typing import List, Union
 
-import geopandas as gpd
-import geopy.distance
 import numpy as np
 import pandas as pd
-from shapely.geometry import Point, Polygon
+import shapely
+from scipy.spatial import cKDTree
 from shapely.ops import unary_union
 
-from ..spatial.projection import wgs84_to_utm
+from ..spatial.projection import geodesic_distance, wgs84_to_utm_coordinates
 
 
 def correct_transect_intervals(transect_data: pd.DataFrame, interval_threshold: float = 0.05):
@@ -117,6 +116,21 @@ def edit_transect_columns(transect_dict: dict, settings_dict: dict):
         transect_info["biomass_density"] = transect_data["biomass_density"]
     elif settings_dict["variable"] == "abundance":
         transect_info["number_density"] = transect_data["number_density"]
+    # ---- Additional kriged variables, if relevant
+    additional_variables = [
+        variable
+        for variable in settings_dict.get("variables", [])
+        if variable not in transect_info.columns
+    ]
+    # -------- Check that they exist
+    missing_variables = set(additional_variables) - set(transect_data.columns)
+    if missing_variables:
+        raise ValueError(
+            f"The following kriging variables are missing from the transect data: "
+            f"{', '.join(sorted(missing_variables))}."
+        )
+    # -------- Append
+    transect_info[additional_variables] = transect_data[additional_variables]
 
     # Return the output
     return transect_info.reset_index()
@@ -153,12 +167,11 @@ def transect_spatial_features(transect_data: pd.DataFrame):
     # ---- Max longitude
     transect_spatial["longitude_max"] = transect_data.groupby(["transect_num"])["longitude"].max()
     # ---- Calculate mean distance (nmi)
-    transect_spatial["transect_distance"] = transect_spatial.apply(
-        lambda row: geopy.distance.distance(
-            (row["latitude_mean"], row["longitude_min"]),
-            (row["latitude_mean"], row["longitude_max"]),
-        ).nm,
-        axis=1,
+    transect_spatial["transect_distance"] = geodesic_distance(
+        transect_spatial["longitude_min"],
+        transect_spatial["latitude_mean"],
+        transect_spatial["longitude_max"],
+        transect_spatial["latitude_mean"],
     )
     # ---- Calculate mean spacing
     transect_spatial["mean_spacing"] = transect_data.groupby(["transect_num"])[
@@ -206,26 +219,16 @@ def transect_array(index_matrix: np.ndarray, data_series: pd.Series):
     return [data_series[idx] for idx in index_matrix]
 
 
-def transect_coordinate_centroid(spatial_grouped: gpd.GeoSeries):
-    """
-    Calculate the centroid of a given spatial group
-
-    Parameters
-    ----------
-    spatial_grouped: gpd.GeoSeries
-        A GeoSeries comprising coordinates (i.e. points)
-    """
-
-    # Compute the union of all coordinates within `spatial_grouped`
-    centroid_point = spatial_grouped.unary_union.centroid
-
-    # Return output
-    return Point(centroid_point)
-
-
 def transect_extent(transect_data: pd.DataFrame, projection: str, num_nearest_transects: int):
     """
     Compute the extent of each transect line.
+
+    Notes
+    ----------
+    The `num_nearest_transects` nearest transects of each transect are found by querying a KD-tree
+    built over the transect centroids (UTM) and any transects tied with the farthest of these are
+    also included. The convex hull of the coordinates of each transect and its nearest neighbors
+    is computed from the coordinate arrays and the union of these hulls is returned.
     """
 
     # Detect the correct longitude and latitude coordinates
@@ -233,53 +236,82 @@ def transect_extent(transect_data: pd.DataFrame, projection: str, num_nearest_tr
     lat_col = [col for col in transect_data.columns if "lat" in col.lower()][0]
     # ---- Longitude
     lon_col = [col for col in transect_data.columns if "lon" in col.lower()][0]
-    # ---- Rename the dataframe
-    transect = transect_data.copy().rename(
-        columns={f"{lon_col}": "longitude", f"{lat_col}": "latitude"}
-    )
 
-    # Convert to GeoDataFrame
-    transect_gdf = gpd.GeoDataFrame(
-        transect,
-        geometry=gpd.points_from_xy(transect["longitude"], transect["latitude"]),
-        crs=projection,
+    # Convert from WGS84 to UTM
+    # ---- Sort by transect
+    transect = transect_data.sort_values("transect_num", kind="stable")
+    # ---- Convert
+    x, y = wgs84_to_utm_coordinates(
+        transect[lon_col].to_numpy(), transect[lat_col].to_numpy(), projection
     )
+    # ---- Stack the coordinates
+    coordinates = np.column_stack([x, y])
 
-    # Convert from WGS84 to UTM
-    wgs84_to_utm(transect_gdf)
+    # Index the coordinates of each transect line
+    # ---- Transect line numbers
+    transect_numbers, transect_counts = np.unique(
+        transect["transect_num"].to_numpy(), return_counts=True
+    )
+    # ---- Starting row of each transect line
+    transect_starts = np.cumsum(transect_counts) - transect_counts
+    # ---- Number of transect lines
+    n_transects = len(transect_numbers)
 
     # Calculate the centroid of each transect line
-    transect_centroid = transect_gdf.groupby("transect_num")["geometry"].apply(
-        transect_coordinate_centroid
+    # ---- The centroid is computed from the unique coordinates of each transect line
+    unique_coordinates = (
+        pd.DataFrame({"transect_num": transect["transect_num"].to_numpy(), "x": x, "y": y})
+        .drop_duplicates()
+        .groupby("transect_num")[["x", "y"]]
+        .mean()
+    )
+    transect_centroid = unique_coordinates.loc[transect_numbers].to_numpy()
+
+    # Find the nearest transect centroids
+    # ---- Build the spatial index
+    centroid_tree = cKDTree(transect_centroid)
+    # ---- Compute the distance to the `num_nearest_transects`-th nearest transect centroid
+    if num_nearest_transects > 0 and n_transects > 1:
+        # ---- Query the nearest centroids (including itself)
+        centroid_distance, centroid_index = centroid_tree.query(
+            transect_centroid, k=min(num_nearest_transects + 1, n_transects)
+        )
+        # ---- Exclude each transect from its own neighbors
+        centroid_distance = np.sort(
+            np.where(
+                centroid_index == np.arange(n_transects)[:, np.newaxis],
+                np.inf,
+                centroid_distance.reshape(n_transects, -1),
+            ),
+            axis=1,
+        )
+        # ---- Get the search distance
+        search_distance = centroid_distance[:, min(num_nearest_transects, n_transects - 1) - 1]
+    else:
+        search_distance = np.zeros(n_transects)
+    # ---- Find all transects (including ties) within the search distance
+    # ---- A relative tolerance guards against round-off between the two KD-tree queries
+    nearest_transects = centroid_tree.query_ball_point(
+        transect_centroid, r=search_distance * (1.0 + 1e-9)
     )
 
     # Generate grouped polygons around each transect line
-    # ---- Initialize polygon list
-    transect_polygons = []
-    # ---- Iterate through each transect
-    for transect in transect_centroid.index:
-        # ---- Extract coordinates of the transect
-        coord_centroid = transect_centroid[transect]
-        # ---- Extract all remaining centroids
-        other_centroids = transect_centroid[transect_centroid.index != transect].to_frame()
-        # ---- Calculate the distance between centroids
-        other_centroids["distance_centroid"] = other_centroids.geometry.apply(
-            lambda g: coord_centroid.distance(g)
-        )
-        # ---- Find the 'n' nearest transect centroids
-        nearest_centroids = other_centroids.distance_centroid.nsmallest(num_nearest_transects)
-        # ---- Filter the transect centroids
-        nearest_transects = other_centroids[
-            other_centroids.distance_centroid.isin(nearest_centroids)
-        ]
-        # ---- Parse the coordinates of the relevant transect numbers
-        unique_transects = np.append(nearest_transects.index, transect)
-        # ---- Get the full coordinates of the relevant transects
-        transect_coords = transect_gdf[transect_gdf.transect_num.isin(unique_transects)]
-        # ---- Generate the local polygon
-        polygon = Polygon(list(transect_coords.geometry))
-        # ---- Append the convex hull of the transect polygon to `transect_polygons`
-        transect_polygons.append(polygon.convex_hull)
+    # ---- Map each transect line to the transect lines within its polygon
+    polygon_members = [np.union1d(members, [i]) for i, members in enumerate(nearest_transects)]
+    polygon_index = np.repeat(np.arange(n_transects), [len(m) for m in polygon_members])
+    polygon_members = np.concatenate(polygon_members).astype(int)
+    # ---- Map each polygon to the coordinate rows of its transect lines
+    point_counts = transect_counts[polygon_members]
+    point_polygon = np.repeat(polygon_index, point_counts)
+    point_rows = (
+        np.repeat(transect_starts[polygon_members], point_counts)
+        + np.arange(point_counts.sum())
+        - np.repeat(np.cumsum(point_counts) - point_counts, point_counts)
+    )
+    # ---- Compute the convex hull of each set of transect coordinates
+    transect_polygons = shapely.convex_hull(
+        shapely.multipoints(coordinates[point_rows], indices=point_polygon)
+    )
 
     # Merge the polygons via the union of each set
     return unary_union(transect_polygons)
@@ -1,11 +1,15 @@
 import inspect
 import warnings
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Literal, Optional, Union
 
 import numpy as np
 import pandas as pd
 from lmfit import Minimizer, Parameters
-from scipy import special
+from scipy import optimize, special
+from scipy.spatial import cKDTree
+from scipy.stats import qmc
 
 from ..utils.validate_dict import VariogramBase, VariogramInitial, VariogramOptimize
 from .mesh import griddify_lag_distances
@@ -645,6 +649,40 @@ def variogram(
         An array containing the (normalized) semivariance for each lag bin.
     """
 
+    # Compile the model and evaluate
+    return compile_variogram(variogram_parameters, model, **kwargs)(distance_lags)
+
+
+def compile_variogram(
+    variogram_parameters: Optional[Dict[str, float]] = None,
+    model: Optional[Union[str, List[str]]] = None,
+    **kwargs,
+):
+    """
+    Resolve a variogram model and its parameters into a callable of the lag distances
+
+    Parameters
+    ----------
+    variogram_parameters: Optional[Dict[str, float]]
+        An optional dictionary that contains the variogram model name (`model`) and parameter
+        values (see :func:`variogram`).
+    model: Optional[Union[ str , list ]]
+        A string or list of model names (see :func:`variogram`) when the parameter values are
+        instead entered directly as `kwargs`.
+
+    Returns
+    ----------
+    variogram_model: functools.partial
+        The variogram model function with its parameters bound, which only requires the
+        `distance_lags` argument.
+
+    Notes
+    ----------
+    The model lookup and parameter validation are done once so that repeatedly evaluating the
+    returned callable (e.g. over many sets of lag distances) only incurs the cost of the model
+    computation itself.
+    """
+
     # Determine model source
     if variogram_parameters is not None:
         # ---- Get the variogram arguments and function from `variogram_parameters`
@@ -659,16 +697,10 @@ def variogram(
     variogram_args, variogram_function = get_variogram_arguments(model_source)
 
     # Evaluate whether required function parameters are present
-    if variogram_parameters is not None:
-        # ---- Get input arguments
-        input_args = variogram_parameters
-        # ---- Use `variogram_parameters` as source
-        arg_diff = set(list(variogram_args)) - set(input_args) - set(["distance_lags"])
-    else:
-        # ---- Get input arguments
-        input_args = kwargs
-        # ---- Use `kwargs` as source
-        arg_diff = set(list(variogram_args)) - set(input_args)
+    # ---- Get input arguments from `variogram_parameters` or `kwargs`
+    input_args = variogram_parameters if variogram_parameters is not None else kwargs
+    # ---- The lag distances are supplied when the model is evaluated
+    arg_diff = set(list(variogram_args)) - set(input_args) - set(["distance_lags"])
 
     # Raise error if any are missing
     if len(arg_diff) > 0:
@@ -679,8 +711,8 @@ def variogram(
     # Filter out only the variogram parameters required for the model
     required_args = dict((k, input_args[k]) for k in input_args if k in list(variogram_args))
 
-    # Pipe the parameters into the appropriate variogram function
-    return variogram_function["model_function"](distance_lags, **required_args)
+    # Bind the parameters to the appropriate variogram function
+    return partial(variogram_function["model_function"], **required_args)
 
 
 def prepare_variogram_matrices(transect_data: pd.DataFrame, lag_resolution: float, **kwargs):
@@ -790,6 +822,434 @@ def quantize_lags(
     return lag_counts, lag_estimates, lag_estimates_squared, lag_deviations
 
 
+def bin_lag_pairs(
+    head_estimates: np.ndarray[float],
+    tail_estimates: np.ndarray[float],
+    pair_lags: np.ndarray[int],
+    x_distance: np.ndarray[float],
+    y_distance: np.ndarray[float],
+    n_lags: int,
+    azimuth_range: float,
+) -> tuple:
+    """
+    Apply the azimuth filter to a set of point pairs and bin their statistics by lag
+
+    Parameters
+    ----------
+    head_estimates: np.ndarray
+        A 1D array of the field estimates at the head of each pair.
+    tail_estimates: np.ndarray
+        A 1D array of the field estimates at the tail of each pair.
+    pair_lags: np.ndarray
+        A 1D array of the lag index of each pair, which must all be less than `n_lags`.
+    x_distance: np.ndarray
+        A 1D array of the horizontal head-minus-tail coordinate differences of each pair.
+    y_distance: np.ndarray
+        A 1D array of the vertical head-minus-tail coordinate differences of each pair.
+    n_lags: int
+        The number of lags.
+    azimuth_range: float
+        The total azimuth angle range that is allowed for constraining the relative angles between
+        spatial points, particularly for cases where a high degree of directionality is assumed.
+
+    Returns
+    ----------
+    A tuple with the pair counts, summed tail estimates, summed squared tail estimates, and summed
+    squared head-tail deviations for each lag bin (including the zeroth bin).
+    """
+
+    # Compute the azimuth angles (self-points have angles of 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        azimuth = np.arctan(y_distance / x_distance) * 180.0 / np.pi
+    azimuth[np.isnan(azimuth)] = 0.0
+
+    # Define azimuth angle threshold
+    azimuth_threshold = 0.5 * azimuth_range
+
+    # Create the azimuth angle bitmap
+    azimuth_bitmap = (azimuth >= -azimuth_threshold) & (azimuth < azimuth_threshold)
+
+    # Apply the azimuth filter
+    pair_lags = pair_lags[azimuth_bitmap]
+    head_estimates = head_estimates[azimuth_bitmap]
+    tail_estimates = tail_estimates[azimuth_bitmap]
+
+    # Return the binned statistics
+    return (
+        np.bincount(pair_lags, minlength=n_lags),
+        np.bincount(pair_lags, weights=tail_estimates, minlength=n_lags),
+        np.bincount(pair_lags, weights=tail_estimates**2, minlength=n_lags),
+        np.bincount(pair_lags, weights=(head_estimates - tail_estimates) ** 2, minlength=n_lags),
+    )
+
+
+def bin_head_moments(
+    head_estimates: np.ndarray[float], pair_lags: np.ndarray[int], n_lags: int
+) -> np.ndarray:
+    """
+    Bin the counts, sums, and centered sums of squares of the head estimates of a set of point
+    pairs by lag
+
+    Parameters
+    ----------
+    head_estimates: np.ndarray
+        A 1D array of the field estimates at the head of each pair.
+    pair_lags: np.ndarray
+        A 1D array of the lag index of each pair, which must all be less than `n_lags`.
+    n_lags: int
+        The number of lags.
+
+    Returns
+    ----------
+    head_moments: np.ndarray
+        A 2D array with rows comprising the head counts, summed head estimates, and summed squared
+        deviations of the head estimates from their mean for each lag bin (including the zeroth
+        bin).
+
+    Notes
+    ----------
+    The squared deviations are accumulated in a second pass about the per-lag means rather than
+    from the raw squared sums, which avoids catastrophic cancellation when the mean is large
+    relative to the spread of the estimates.
+    """
+
+    # Bin the counts and sums
+    head_counts = np.bincount(pair_lags, minlength=n_lags)
+    head_sums = np.bincount(pair_lags, weights=head_estimates, minlength=n_lags)
+
+    # Compute the mean head estimate per lag bin
+    head_means = np.divide(head_sums, head_counts, out=np.zeros(n_lags), where=head_counts > 0)
+
+    # Bin the squared deviations from the mean
+    head_deviations = np.bincount(
+        pair_lags, weights=(head_estimates - head_means[pair_lags]) ** 2, minlength=n_lags
+    )
+
+    # Return output
+    return np.stack([head_counts, head_sums, head_deviations])
+
+
+def merge_head_moments(moments_a: np.ndarray, moments_b: np.ndarray) -> np.ndarray:
+    """
+    Merge two sets of per-lag head moments computed from disjoint sets of point pairs
+
+    Parameters
+    ----------
+    moments_a, moments_b: np.ndarray
+        2D arrays of head moments (see :func:`bin_head_moments`).
+
+    Returns
+    ----------
+    head_moments: np.ndarray
+        The head moments of the combined point pairs.
+
+    Notes
+    ----------
+    The centered sums of squares are combined using the pairwise update of Chan et al. (1979),
+    i.e. `M2 = M2_a + M2_b + (mean_b - mean_a) ** 2 * n_a * n_b / n`.
+    """
+
+    # Unpack
+    counts_a, sums_a, deviations_a = moments_a
+    counts_b, sums_b, deviations_b = moments_b
+
+    # Combine the counts and sums
+    counts = counts_a + counts_b
+    sums = sums_a + sums_b
+
+    # Compute the difference between the means of each set
+    # ---- Empty bins do not contribute to the correction term
+    mean_a = np.divide(sums_a, counts_a, out=np.zeros(len(sums_a)), where=counts_a > 0)
+    mean_b = np.divide(sums_b, counts_b, out=np.zeros(len(sums_b)), where=counts_b > 0)
+    # ---- Correction term
+    correction = np.divide(
+        (mean_b - mean_a) ** 2 * counts_a * counts_b,
+        counts,
+        out=np.zeros(len(sums)),
+        where=counts > 0,
+    )
+
+    # Return output
+    return np.stack([counts, sums, deviations_a + deviations_b + correction])
+
+
+def quantize_lag_pairs(
+    estimates: np.ndarray[float],
+    x: np.ndarray[float],
+    y: np.ndarray[float],
+    lag_resolution: float,
+    n_lags: int,
+    azimuth_range: float,
+    block_size: int = 1024,
+    **kwargs,
+) -> tuple:
+    """
+    Quantize lags by streaming point pairs in row blocks without materializing `n x n` matrices
+
+    Parameters
+    ----------
+    estimates: np.ndarray
+        A 1D array of field estimates.
+    x: np.ndarray
+        A 1D array of the horizontal coordinates associated with `estimates`.
+    y: np.ndarray
+        A 1D array of the vertical coordinates associated with `estimates`.
+    lag_resolution: float
+        The spatial increment/distance between each lag bin.
+    n_lags: int
+        The number of lags.
+    azimuth_range: float
+        The total azimuth angle range that is allowed for constraining the relative angles between
+        spatial points, particularly for cases where a high degree of directionality is assumed.
+    block_size: int
+        The number of rows (i.e. head points) that are paired against the remaining points per
+        block.
+
+    Returns
+    ----------
+    lag_counts: np.ndarray
+        The number of point pairs within each lag bin.
+    lag_estimates: np.ndarray
+        The summed tail estimates within each lag bin.
+    lag_estimates_squared: np.ndarray
+        The summed squared tail estimates within each lag bin.
+    lag_deviations: np.ndarray
+        The summed squared deviations between head and tail estimates within each lag bin.
+    head_moments: np.ndarray
+        A 2D array with rows comprising the head counts, summed head estimates, and summed squared
+        deviations of the head estimates from their mean within each lag bin (see
+        :func:`bin_head_moments`).
+
+    Notes
+    ----------
+    The point pairs, lag indices, and azimuth filter are identical to those from
+    :func:`prepare_variogram_matrices`, :func:`quantize_lags`, and the triangle mask used in
+    :func:`empirical_variogram`. Pairs that fall beyond `n_lags` are discarded before any of the
+    per-lag statistics are accumulated, so that memory usage scales with `block_size * n` rather
+    than `n * n`.
+    """
+
+    # Validate that `estimates` is a 1D array
+    if estimates.ndim > 1:
+        raise ValueError("Estimates array ('estimates') must be a 1D array.")
+
+    # Validate the block size
+    if not isinstance(block_size, (int, np.integer)) or block_size < 1:
+        raise ValueError("The row block size ('block_size') must be a positive integer.")
+
+    # Get the number of points
+    n_points = len(estimates)
+
+    # Pre-allocate the per-lag accumulators
+    # ---- Counts
+    lag_counts = np.zeros(n_lags, dtype=int)
+    # ---- Summed estimates
+    lag_estimates = np.zeros(n_lags)
+    # ---- Summed squared estimates
+    lag_estimates_squared = np.zeros(n_lags)
+    # ---- Summed deviations
+    lag_deviations = np.zeros(n_lags)
+    # ---- Head moments
+    head_moments = np.zeros((3, n_lags))
+
+    # Iterate through the row blocks
+    for start in range(0, max(n_points - 1, 0), block_size):
+        # ---- Rows within the block
+        rows = np.arange(start, min(start + block_size, n_points))
+        # ---- Only columns with `row + column < n - 1` are paired
+        n_columns = n_points - 1 - start
+        # ---- Triangle mask
+        pair_mask = np.arange(n_columns)[np.newaxis, :] < (n_points - 1 - rows)[:, np.newaxis]
+        # ---- Coordinate differences
+        x_distance = x[rows, np.newaxis] - x[np.newaxis, :n_columns]
+        y_distance = y[rows, np.newaxis] - y[np.newaxis, :n_columns]
+        # ---- Euclidean distances
+        distance_block = np.sqrt(x_distance * x_distance + y_distance * y_distance)
+        # ---- Convert to lags
+        lag_block = np.round(distance_block / lag_resolution).astype(int) + 1
+        # ---- Discard pairs beyond the maximum lag
+        pair_mask &= lag_block < n_lags
+        # ---- Get the retained pair indices
+        row_index, column_index = np.nonzero(pair_mask)
+        pair_lags = lag_block[row_index, column_index]
+        # ---- Bin the head moments prior to applying the azimuth filter
+        head_moments = merge_head_moments(
+            head_moments, bin_head_moments(estimates[rows[row_index]], pair_lags, n_lags)
+        )
+        # ---- Bin the azimuth-filtered pair statistics
+        pair_statistics = bin_lag_pairs(
+            estimates[rows[row_index]],
+            estimates[column_index],
+            pair_lags,
+            x_distance[row_index, column_index],
+            y_distance[row_index, column_index],
+            n_lags,
+            azimuth_range,
+        )
+        # ---- Accumulate
+        lag_counts += pair_statistics[0]
+        lag_estimates += pair_statistics[1]
+        lag_estimates_squared += pair_statistics[2]
+        lag_deviations += pair_statistics[3]
+
+    # Return the outputs as a tuple with the zeroth lag bin removed
+    return (
+        lag_counts[1:],
+        lag_estimates[1:],
+        lag_estimates_squared[1:],
+        lag_deviations[1:],
+        head_moments[:, 1:],
+    )
+
+
+def quantize_lag_tree(
+    estimates: np.ndarray[float],
+    x: np.ndarray[float],
+    y: np.ndarray[float],
+    lag_resolution: float,
+    n_lags: int,
+    azimuth_range: float,
+    **kwargs,
+) -> tuple:
+    """
+    Quantize lags from only the point pairs within the maximum lag distance using a KD-tree
+
+    Parameters
+    ----------
+    estimates: np.ndarray
+        A 1D array of field estimates.
+    x: np.ndarray
+        A 1D array of the horizontal coordinates associated with `estimates`.
+    y: np.ndarray
+        A 1D array of the vertical coordinates associated with `estimates`.
+    lag_resolution: float
+        The spatial increment/distance between each lag bin.
+    n_lags: int
+        The number of lags.
+    azimuth_range: float
+        The total azimuth angle range that is allowed for constraining the relative angles between
+        spatial points, particularly for cases where a high degree of directionality is assumed.
+
+    Returns
+    ----------
+    A tuple with the same lag statistics as those returned by :func:`quantize_lag_pairs`.
+
+    Notes
+    ----------
+    The triangle mask used in :func:`empirical_variogram` retains the ordered pair `(i, j)`
+    whenever `i + j < n - 1`. Since this condition is symmetric, each unordered pair returned by
+    :meth:`scipy.spatial.cKDTree.query_pairs` is counted in both directions, and self-pairs are
+    counted once for `2 * i < n - 1`. The cost therefore scales with the number of point pairs
+    within the maximum lag distance rather than `n * n`.
+    """
+
+    # Validate that `estimates` is a 1D array
+    if estimates.ndim > 1:
+        raise ValueError("Estimates array ('estimates') must be a 1D array.")
+
+    # Get the number of points
+    n_points = len(estimates)
+
+    # Enumerate the unordered point pairs within the maximum lag distance
+    # ---- Retained lags satisfy round(d / lag_resolution) + 1 < n_lags, i.e.
+    # ---- d < (n_lags - 1.5) * lag_resolution, so this radius already includes every such pair
+    pairs = cKDTree(np.column_stack([x, y])).query_pairs(
+        r=(n_lags - 1) * lag_resolution, output_type="ndarray"
+    )
+    # ---- Retain the pairs within the triangle
+    pairs = pairs[pairs.sum(axis=1) < n_points - 1]
+
+    # Create the ordered head and tail indices
+    # ---- Self-pairs
+    self_index = np.arange(n_points // 2)
+    # ---- Head
+    head = np.concatenate([pairs[:, 0], pairs[:, 1], self_index])
+    # ---- Tail
+    tail = np.concatenate([pairs[:, 1], pairs[:, 0], self_index])
+
+    # Compute the lags
+    # ---- Coordinate differences
+    x_distance = x[head] - x[tail]
+    y_distance = y[head] - y[tail]
+    # ---- Euclidean distances
+    pair_distance = np.sqrt(x_distance * x_distance + y_distance * y_distance)
+    # ---- Convert to lags
+    pair_lags = np.round(pair_distance / lag_resolution).astype(int) + 1
+    # ---- Discard pairs beyond the maximum lag
+    in_range = pair_lags < n_lags
+    head, tail, pair_lags = head[in_range], tail[in_range], pair_lags[in_range]
+
+    # Bin the head moments prior to applying the azimuth filter
+    head_moments = bin_head_moments(estimates[head], pair_lags, n_lags)
+
+    # Bin the azimuth-filtered pair statistics
+    lag_counts, lag_estimates, lag_estimates_squared, lag_deviations = bin_lag_pairs(
+        estimates[head],
+        estimates[tail],
+        pair_lags,
+        x_distance[in_range],
+        y_distance[in_range],
+        n_lags,
+        azimuth_range,
+    )
+
+    # Return the outputs as a tuple with the zeroth lag bin removed
+    return (
+        lag_counts[1:],
+        lag_estimates[1:],
+        lag_estimates_squared[1:],
+        lag_deviations[1:],
+        head_moments[:, 1:],
+    )
+
+
+def dense_lag_statistics(
+    estimates: np.ndarray[float], transect_data: pd.DataFrame, variogram_parameters: dict
+) -> tuple:
+    """
+    Quantize lags from the dense `n x n` azimuth and lag matrices
+
+    Parameters
+    ----------
+    estimates: np.ndarray
+        A 1D array of field estimates.
+    transect_data: pd.DataFrame
+        A dataframe containing the "x" and "y" coordinates associated with `estimates`.
+    variogram_parameters: dict
+        A dictionary that includes `lag_resolution`, `n_lags`, and `azimuth_range`.
+
+    Returns
+    ----------
+    A tuple with the same lag statistics as those returned by :func:`quantize_lag_pairs`.
+    """
+
+    # Get the number of lags
+    n_lags = variogram_parameters["n_lags"]
+
+    # Calculate the lag distance matrix among transect data
+    azimuth_matrix, lag_matrix = prepare_variogram_matrices(transect_data, **variogram_parameters)
+
+    # Create a triangle mask with the diaganol offset to the left by 1
+    # ---- Initial mask
+    triangle_mask = np.tri(len(estimates), k=-1, dtype=bool)
+    # ---- Vertically and then horizontally flip to force the 'True' and 'False' positions
+    triangle_mask_flp = np.flip(np.flip(triangle_mask), axis=1)
+
+    # Quantize lag metrics
+    lag_counts, lag_estimates, lag_estimates_squared, lag_deviations = quantize_lags(
+        estimates, lag_matrix, triangle_mask_flp, azimuth_matrix, **variogram_parameters
+    )
+
+    # Bin the head moments of each lag using the triangle bitmap
+    # ---- Get the head (row) indices and lags of the pairs within the maximum lag
+    head, tail = np.nonzero(triangle_mask_flp & (lag_matrix < n_lags))
+    # ---- Bin
+    head_moments = bin_head_moments(estimates[head], lag_matrix[head, tail], n_lags)
+
+    # Return the outputs as a tuple
+    return lag_counts, lag_estimates, lag_estimates_squared, lag_deviations, head_moments[:, 1:]
+
+
 def empirical_variogram(
     transect_data: pd.DataFrame, variogram_parameters: dict, settings_dict: dict
 ) -> tuple:
@@ -817,6 +1277,12 @@ def empirical_variogram(
     settings_dict: dict
         A dictionary that passes configuration information that including:
             - `variable`: Biological estimate variable (e.g. `'biomass'`).
+            - `pair_engine`: The engine used for enumerating point pairs. This can either be
+            "chunked" (default), which streams point pairs in row blocks (see
+            :func:`quantize_lag_pairs`), "kdtree", which only enumerates the point pairs within the
+            maximum lag distance (see :func:`quantize_lag_tree`), or "dense", which computes the
+            full `n x n` azimuth and lag matrices.
+            - `block_size`: The number of rows per block for the "chunked" engine (default: 1024).
 
     Returns
     ----------
@@ -836,48 +1302,53 @@ def empirical_variogram(
     estimates = transect_data[settings_dict["variable"]].to_numpy()
 
     # Extract relevant variogram parameters
-    # ---- Lag resolution ['lcsl']
-    # lag_resolution = variogram_parameters["lag_resolution"]
-    # ---- Number of lags
-    n_lags = variogram_parameters["n_lags"]
     # ---- Compute the lags ['h']
     lags = variogram_parameters["distance_lags"]
 
-    # Calculate the lag distance matrix among transect data
-    # transect_distance_matrix, transect_azimuth_matrix = griddify_lag_distances(
-    #     transect_data, transect_data, angles=True
-    # )
-    # ---- Convert to lags
-    # lag_matrix = np.round(transect_distance_matrix / lag_resolution).astype(int) + 1
-    azimuth_matrix, lag_matrix = prepare_variogram_matrices(transect_data, **variogram_parameters)
-
-    # Create a triangle mask with the diaganol offset to the left by 1
-    # ---- Initial mask
-    triangle_mask = np.tri(len(estimates), k=-1, dtype=bool)
-    # ---- Vertically and then horizontally flip to force the 'True' and 'False' positions
-    triangle_mask_flp = np.flip(np.flip(triangle_mask), axis=1)
+    # Validate the pair engine
+    pair_engine = settings_dict.get("pair_engine", "chunked")
+    if pair_engine not in ["chunked", "dense", "kdtree"]:
+        raise ValueError(
+            f"The pair engine ('pair_engine') must either be 'chunked', 'dense', or 'kdtree' (not "
+            f"'{pair_engine}')."
+        )
 
     # Quantize lag metrics
-    lag_counts, lag_estimates, lag_estimates_squared, lag_deviations = quantize_lags(
-        estimates, lag_matrix, triangle_mask_flp, azimuth_matrix, **variogram_parameters
-    )
-
-    # Compute the mean and standard deviation of the head estimates for each lag bin
-    # ---- Apply a mask using the triangle bitmap
-    head_mask = np.where(triangle_mask_flp, lag_matrix, -1)
-
-    # Helper function for computing the binned summations for each row
-    def bincount_row(row, n_lags):
-        return np.bincount(row[row != -1], minlength=n_lags)[1:n_lags]
-
-    # Pre-allocate vectors/arrays that will be iteratively filled
-    head_index = np.zeros((len(estimates), n_lags - 1))
-    # ---- Find the head indices of each lag for each row
-    head_index = np.apply_along_axis(bincount_row, axis=1, arr=head_mask, n_lags=n_lags)
+    if pair_engine == "chunked":
+        # ---- Stream the point pairs in row blocks
+        lag_counts, lag_estimates, lag_estimates_squared, lag_deviations, head_moments = (
+            quantize_lag_pairs(
+                estimates,
+                transect_data["x"].to_numpy(),
+                transect_data["y"].to_numpy(),
+                block_size=settings_dict.get("block_size", 1024),
+                **variogram_parameters,
+            )
+        )
+    elif pair_engine == "kdtree":
+        # ---- Enumerate only the point pairs within the maximum lag distance
+        lag_counts, lag_estimates, lag_estimates_squared, lag_deviations, head_moments = (
+            quantize_lag_tree(
+                estimates,
+                transect_data["x"].to_numpy(),
+                transect_data["y"].to_numpy(),
+                **variogram_parameters,
+            )
+        )
+    else:
+        # ---- Compute the dense azimuth and lag matrices
+        lag_counts, lag_estimates, lag_estimates_squared, lag_deviations, head_moments = (
+            dense_lag_statistics(estimates, transect_data, variogram_parameters)
+        )
 
     # Compute the standardized semivariance [gamma(h)]
     gamma_h, lag_covariance = semivariance(
-        estimates, lag_estimates, lag_estimates_squared, lag_counts, lag_deviations, head_index
+        estimates,
+        lag_estimates,
+        lag_estimates_squared,
+        lag_counts,
+        lag_deviations,
+        head_moments=head_moments,
     )
 
     # Prepend a 0.0 and force the nugget effect to be 0.0, if necessary
@@ -948,19 +1419,56 @@ def semivariance(
     lag_estimates_squared: np.ndarray,
     lag_counts: np.ndarray,
     lag_deviations: np.ndarray,
-    head_index: np.ndarray,
+    head_index: Optional[np.ndarray] = None,
+    head_moments: Optional[np.ndarray] = None,
 ) -> tuple:
     """
     Compute the standardized semivariance.
+
+    Parameters
+    ----------
+    head_index: Optional[np.ndarray]
+        A 2D array with the number of times each point is the head of a pair within each lag bin.
+    head_moments: Optional[np.ndarray]
+        A 2D array with rows comprising the head counts, summed head estimates, and summed squared
+        deviations of the head estimates from their mean within each lag bin (see
+        :func:`bin_head_moments`). When supplied, this is used instead of `head_index`.
     """
 
+    # Reduce the head indices to the per-lag head moments, if necessary
+    if head_moments is None:
+        if head_index is None:
+            raise ValueError("Either 'head_index' or 'head_moments' must be supplied.")
+        # ---- Counts and sums
+        head_counts = head_index.sum(axis=0)
+        head_sums = (estimates[:, np.newaxis] * head_index).sum(axis=0)
+        # ---- Squared deviations from the mean
+        head_means = np.divide(
+            head_sums, head_counts, out=np.zeros(len(head_sums)), where=head_counts > 0
+        )
+        head_moments = np.stack(
+            [
+                head_counts,
+                head_sums,
+                ((estimates[:, np.newaxis] - head_means) ** 2 * head_index).sum(axis=0),
+            ]
+        )
+    # ---- Unpack
+    head_counts, head_estimates, head_deviations = head_moments
+
     # Calculate the mean head estimate per lag bin
-    mean_head = (estimates[:, np.newaxis] * (head_index / lag_counts)).sum(axis=0)
+    mean_head = head_estimates / lag_counts
 
     # Calculate the standard deviation of head values per lag
-    sigma_head = np.sqrt(
-        ((estimates[:, np.newaxis] - mean_head) ** 2 * (head_index / lag_counts)).sum(axis=0)
-    )
+    # ---- The head counts can differ from `lag_counts` since the azimuth filter is not applied, so
+    # ---- the deviations are shifted from the mean of the head estimates to `mean_head`
+    with np.errstate(divide="ignore", invalid="ignore"):
+        head_offset = head_estimates / head_counts - mean_head
+    head_variance = (
+        head_deviations + head_counts * np.where(head_counts > 0, head_offset, 0.0) ** 2
+    ) / lag_counts
+    # ---- Standard deviation
+    sigma_head = np.sqrt(head_variance)
 
     # Calculate the global mean and variance for each lag bin
     # ---- Mean
@@ -1159,9 +1667,18 @@ def initialize_optimization_config(optimization_parameters: Dict[str, Any]):
     return lmfit_parameters
 
 
+# Resolved variogram models keyed by their normalized model names
+VARIOGRAM_MODEL_REGISTRY = {}
+
+
 def get_variogram_arguments(model_name: Union[str, List[str]]):
     """
     Get the variogram function arguments
+
+    Notes
+    ----------
+    The model function and its signature are resolved once per model and then retrieved from
+    `VARIOGRAM_MODEL_REGISTRY`.
     """
 
     # Convert to lowercase to match reference model dictionary
@@ -1174,27 +1691,84 @@ def get_variogram_arguments(model_name: Union[str, List[str]]):
         # ---- Alphabetic sort
         model_input.sort()
 
-    # Parse user input from reference model dictionary
-    # ---- Check against VARIOGRAM_MODELS API to ensure model exists
-    if isinstance(model_input, list) and (tuple(model_input) in VARIOGRAM_MODELS["composite"]):
-        # if (len(model_input) > 1) & (tuple(model_input) in VARIOGRAM_MODELS["composite"]):
-        # ---- Parse model function
-        model_function = VARIOGRAM_MODELS["composite"][tuple(model_input)]
-    # elif (len([model_input]) == 1) & (model_input in VARIOGRAM_MODELS["single"]):
-    elif not isinstance(model_input, list) and (model_input in VARIOGRAM_MODELS["single"]):
-        # ---- Parse model function
-        model_function = VARIOGRAM_MODELS["single"][model_input]
-    else:
-        raise LookupError(
-            f"The model input ({model_name}) could not be matched to an"
-            f" existing variogram method."
+    # Create the registry key
+    model_key = tuple(model_input) if isinstance(model_input, list) else model_input
+
+    # Resolve the model, if it has not already been registered
+    if model_key not in VARIOGRAM_MODEL_REGISTRY:
+        # Parse user input from reference model dictionary
+        # ---- Check against VARIOGRAM_MODELS API to ensure model exists
+        if isinstance(model_key, tuple) and (model_key in VARIOGRAM_MODELS["composite"]):
+            # ---- Parse model function
+            model_function = VARIOGRAM_MODELS["composite"][model_key]
+        elif not isinstance(model_key, tuple) and (model_key in VARIOGRAM_MODELS["single"]):
+            # ---- Parse model function
+            model_function = VARIOGRAM_MODELS["single"][model_key]
+        else:
+            raise LookupError(
+                f"The model input ({model_name}) could not be matched to an"
+                f" existing variogram method."
+            )
+        # ---- Register the function signature and model function
+        VARIOGRAM_MODEL_REGISTRY[model_key] = (
+            inspect.signature(model_function).parameters,
+            model_function,
         )
 
-    # Check input parameters against the required function arguments
-    # ---- Get the function signature
-    function_signature = inspect.signature(model_function)
-    # ---- Create ordered dictionary of required arguments
-    return function_signature.parameters, {"model_function": model_function}
+    # Get the required function arguments and model function
+    function_parameters, model_function = VARIOGRAM_MODEL_REGISTRY[model_key]
+
+    # Return output
+    return function_parameters, {"model_function": model_function}
+
+
+def variogram_cost_function(
+    parameters: Parameters, x: np.ndarray, y: np.ndarray, w: np.ndarray, model_function
+) -> np.ndarray:
+    """
+    Compute the weighted residuals between a variogram model and the empirical semivariance
+
+    Parameters
+    ----------
+    parameters: lmfit.Parameters
+        The variogram model parameters.
+    x: np.ndarray
+        The lag distances.
+    y: np.ndarray
+        The empirical semivariance.
+    w: np.ndarray
+        The lag weights.
+    model_function: Callable
+        The variogram model function (see :func:`get_variogram_arguments`).
+    """
+
+    yr = model_function(x, **parameters.valuesdict())
+    return (yr - y) * w
+
+
+def variogram_fit_data(
+    lag_counts: np.ndarray, lags: np.ndarray, gamma_h: np.ndarray, max_range: float
+) -> np.ndarray:
+    """
+    Stack the lag distances, empirical semivariance, and lag weights within the maximum range
+
+    Returns
+    ----------
+    data_stack: np.ndarray
+        A 2D array with rows comprising the lag distances, semivariance, and lag weights.
+    """
+
+    # Compute the lag weights
+    lag_weights = lag_counts / lag_counts.sum()
+
+    # Vertically stack the lags, semivariance, and weights
+    data_stack = np.vstack((lags, gamma_h, lag_weights))
+
+    # Index lag distances that are within the parameterized range
+    within_range = np.where(lags <= max_range)[0]
+
+    # Truncate the data stack
+    return data_stack[:, within_range]
 
 
 def optimize_variogram(
@@ -1211,18 +1785,8 @@ def optimize_variogram(
     Optimize variogram parameters.
     """
 
-    # Compute the lag weights
-    lag_weights = lag_counts / lag_counts.sum()
-
-    # Vertically stack the lags, semivariance, and weights
-    data_stack = np.vstack((lags, gamma_h, lag_weights))
-
-    # Index lag distances that are within the parameterized range
-    # within_range = np.where(lags <= variogram_parameters["range"])[0]
-    within_range = np.where(lags <= range)[0]
-
-    # Truncate the data stack
-    truncated_stack = data_stack[:, within_range]
+    # Truncate the lags, semivariance, and weights to the parameterized range
+    truncated_stack = variogram_fit_data(lag_counts, lags, gamma_h, range)
 
     # Get model name
     # _, variogram_fun = get_variogram_arguments(variogram_parameters["model"])
@@ -1230,16 +1794,16 @@ def optimize_variogram(
 
     # Create helper cost-function that is weighted using the kriging weights (`w`), lag
     # distances (`x`), and empirical semivariance (`y`)
-    def cost_function(parameters, x, y, w):
-        yr = variogram_fun["model_function"](x, **parameters)
-        return (yr - y) * w
+    # ---- The model function is resolved once and evaluated with the plain parameter values
+    model_function = variogram_fun["model_function"]
 
     # Compute the initial fit based on the pre-optimized parameter values
-    initial_fit = cost_function(
+    initial_fit = variogram_cost_function(
         optimization_settings["parameters"],
         x=truncated_stack[0],
         y=truncated_stack[1],
         w=truncated_stack[2],
+        model_function=model_function,
     )
 
     # Compute the initial mean absolute deviation (MAD)
@@ -1247,9 +1811,9 @@ def optimize_variogram(
 
     # Generate `Minimizer` function class required for bounded optimization
     minimizer = Minimizer(
-        cost_function,
+        variogram_cost_function,
         optimization_settings["parameters"],
-        fcn_args=(truncated_stack[0], truncated_stack[1], truncated_stack[2]),
+        fcn_args=(truncated_stack[0], truncated_stack[1], truncated_stack[2], model_function),
     )
 
     # Minimize the cost-function to compute the best-fit/optimized variogram parameters
@@ -1272,3 +1836,545 @@ def optimize_variogram(
         ),
         (list(best_fit_params.keys()), list(best_fit_params.values()), mad_optimized),
     )
+
+
+def variogram_search_bounds(parameters: Parameters, names: List[str]) -> tuple:
+    """
+    Get finite lower and upper search bounds for the optimized variogram parameters
+
+    Parameters
+    ----------
+    parameters: lmfit.Parameters
+        The variogram model parameters.
+    names: List[str]
+        The names of the parameters that are optimized.
+
+    Returns
+    ----------
+    A tuple with the lower and upper bounds of each parameter in `names`.
+
+    Notes
+    ----------
+    Unbounded limits are replaced by a search window that extends from the initial value by its
+    magnitude (or 1.0, whichever is larger).
+    """
+
+    # Get the initial values and limits
+    value = np.array([parameters[name].value for name in names], dtype=float)
+    lower = np.array([parameters[name].min for name in names], dtype=float)
+    upper = np.array([parameters[name].max for name in names], dtype=float)
+
+    # Replace unbounded limits with a finite search window around the initial values
+    span = np.maximum(np.abs(value), 1.0)
+    # ---- Lower
+    lower = np.where(np.isfinite(lower), lower, value - span)
+    # ---- Upper
+    upper = np.where(np.isfinite(upper), upper, np.maximum(lower, value) + span)
+
+    return lower, upper
+
+
+def sample_variogram_starts(
+    parameters: Parameters, n_starts: int, random_state: Optional[int] = None
+) -> List[Dict[str, float]]:
+    """
+    Draw starting values for the optimized variogram parameters via Latin hypercube sampling
+
+    Parameters
+    ----------
+    parameters: lmfit.Parameters
+        The variogram model parameters.
+    n_starts: int
+        The total number of starting points, which includes the initial values in `parameters`.
+    random_state: Optional[int]
+        Seed for the Latin hypercube sampler.
+
+    Returns
+    ----------
+    starts: List[Dict[str, float]]
+        A list of dictionaries with the starting value of each optimized parameter. The first
+        entry always corresponds to the initial values in `parameters`.
+    """
+
+    # Get the names of the optimized parameters
+    names = [name for name, parameter in parameters.items() if parameter.vary]
+
+    # Initialize with the initial values
+    starts = [{name: parameters[name].value for name in names}]
+
+    # Return early if no additional starting points are required
+    if n_starts == 1 or len(names) == 0:
+        return starts
+
+    # Get the search bounds
+    lower, upper = variogram_search_bounds(parameters, names)
+
+    # Draw the samples from the unit hypercube and scale them to the search bounds
+    samples = qmc.LatinHypercube(d=len(names), seed=random_state).random(n_starts - 1)
+    samples = lower + samples * (upper - lower)
+
+    # Return the starting values
+    return starts + [dict(zip(names, sample)) for sample in samples]
+
+
+def variogram_sum_of_squares(
+    values: np.ndarray,
+    names: List[str],
+    fixed_values: Dict[str, float],
+    data_stack: np.ndarray,
+    model_function,
+) -> float:
+    """
+    Compute the weighted sum of squared residuals of a variogram model for a set of parameter
+    values
+    """
+
+    # Evaluate the model
+    fitted = model_function(data_stack[0], **{**fixed_values, **dict(zip(names, values))})
+
+    # Compute the weighted sum of squares
+    sum_of_squares = np.sum(((fitted - data_stack[1]) * data_stack[2]) ** 2)
+
+    # Return the sum of squares, which is set to infinity for invalid evaluations
+    return sum_of_squares if np.isfinite(sum_of_squares) else np.inf
+
+
+def global_variogram_start(
+    parameters: Parameters,
+    data_stack: np.ndarray,
+    model_function,
+    random_state: Optional[int] = None,
+) -> Dict[str, float]:
+    """
+    Seed the variogram optimization with a global search via differential evolution
+
+    Parameters
+    ----------
+    parameters: lmfit.Parameters
+        The variogram model parameters.
+    data_stack: np.ndarray
+        A 2D array with rows comprising the lag distances, semivariance, and lag weights (see
+        :func:`variogram_fit_data`).
+    model_function: Callable
+        The variogram model function (see :func:`get_variogram_arguments`).
+    random_state: Optional[int]
+        Seed for :func:`scipy.optimize.differential_evolution`.
+
+    Returns
+    ----------
+    start: Dict[str, float]
+        A dictionary with the starting value of each optimized parameter.
+    """
+
+    # Get the names of the optimized parameters
+    names = [name for name, parameter in parameters.items() if parameter.vary]
+
+    # Return the initial values if there are no optimized parameters
+    if len(names) == 0:
+        return {}
+
+    # Get the search bounds
+    lower, upper = variogram_search_bounds(parameters, names)
+
+    # Get the values of the fixed parameters
+    fixed_values = {
+        name: parameter.value for name, parameter in parameters.items() if not parameter.vary
+    }
+
+    # Run the global search
+    result = optimize.differential_evolution(
+        variogram_sum_of_squares,
+        bounds=list(zip(lower, upper)),
+        args=(names, fixed_values, data_stack, model_function),
+        seed=random_state,
+        polish=False,
+    )
+
+    return dict(zip(names, result.x))
+
+
+def fit_variogram_start(
+    start: Dict[str, float],
+    parameters: Parameters,
+    data_stack: np.ndarray,
+    model_function,
+    config: Dict[str, Any],
+) -> tuple:
+    """
+    Optimize the variogram parameters from a single set of starting values
+
+    Parameters
+    ----------
+    start: Dict[str, float]
+        A dictionary with the starting value of each optimized parameter.
+    parameters: lmfit.Parameters
+        The variogram model parameters.
+    data_stack: np.ndarray
+        A 2D array with rows comprising the lag distances, semivariance, and lag weights (see
+        :func:`variogram_fit_data`).
+    model_function: Callable
+        The variogram model function (see :func:`get_variogram_arguments`).
+    config: Dict[str, Any]
+        The `lmfit` optimization configuration (see :func:`initialize_optimization_config`).
+
+    Returns
+    ----------
+    A tuple with the best-fit parameter values, the mean absolute deviation (MAD), the
+    least-squares cost (sum of squared weighted residuals), and whether the optimization succeeded.
+    """
+
+    # Copy the parameters and update the starting values
+    start_parameters = parameters.copy()
+    for name, value in start.items():
+        start_parameters[name].set(value=value)
+
+    # Minimize the cost-function
+    result = Minimizer(
+        variogram_cost_function,
+        start_parameters,
+        fcn_args=(data_stack[0], data_stack[1], data_stack[2], model_function),
+    ).minimize(method="least_squares", **config)
+
+    return (
+        result.params.valuesdict(),
+        np.mean(np.abs(result.residual)),
+        result.chisqr,
+        result.success,
+    )
+
+
+def multistart_optimize_variogram(
+    lag_counts: np.ndarray,
+    lags: np.ndarray,
+    gamma_h: np.ndarray,
+    optimization_settings: dict,
+    model: Union[str, List[str]],
+    range: float,
+    n_starts: int = 1,
+    n_workers: Optional[int] = None,
+    global_search: bool = False,
+    random_state: Optional[int] = None,
+    **kwargs,
+):
+    """
+    Optimize variogram parameters from multiple starting points.
+
+    Parameters
+    ----------
+    n_starts: int
+        The total number of starting points, which includes the initial values. Additional
+        starting points are drawn within the parameter bounds via Latin hypercube sampling.
+    n_workers: Optional[int]
+        The number of worker processes used for running the fits. The fits are run sequentially
+        when this is `None`.
+    global_search: bool
+        When `True`, an additional starting point is seeded by a global search via
+        :func:`scipy.optimize.differential_evolution`.
+    random_state: Optional[int]
+        Seed used for drawing the starting points and for the global search.
+
+    Returns
+    ----------
+    A tuple with the same best-fit parameters, initial fit, and optimized fit as
+    :func:`optimize_variogram` (for the starting point with the lowest least-squares cost), and a
+    `pd.DataFrame` with the optimized parameter values, MAD, least-squares cost ('cost'), and
+    convergence of every starting point.
+
+    Notes
+    ----------
+    The best starting point is the one with the lowest least-squares cost, which is the objective
+    minimized by each fit. The MAD is reported for comparison with :func:`optimize_variogram`.
+    """
+
+    # Validate the multi-start settings
+    for name, value in {"n_starts": n_starts, "n_workers": n_workers}.items():
+        if value is None and name == "n_workers":
+            continue
+        if not isinstance(value, (int, np.integer)) or isinstance(value, bool) or value < 1:
+            raise ValueError(f"Argument `{name}` must be a positive integer. Got: {value}.")
+
+    # Truncate the lags, semivariance, and weights to the parameterized range
+    data_stack = variogram_fit_data(lag_counts, lags, gamma_h, range)
+
+    # Get the model function
+    _, variogram_fun = get_variogram_arguments(model)
+    model_function = variogram_fun["model_function"]
+
+    # Extract the initial parameters
+    parameters = optimization_settings["parameters"]
+
+    # Compute the initial mean absolute deviation (MAD)
+    mad_initial = np.mean(
+        np.abs(variogram_cost_function(parameters, *data_stack, model_function=model_function))
+    )
+
+    # Draw the starting points
+    starts = sample_variogram_starts(parameters, n_starts, random_state)
+    # ---- Label the source of each starting point
+    start_types = ["initial"] + ["latin_hypercube"] * (len(starts) - 1)
+    # ---- Seed an additional starting point from a global search
+    if global_search:
+        starts.append(global_variogram_start(parameters, data_stack, model_function, random_state))
+        start_types.append("differential_evolution")
+
+    # Optimize from each starting point
+    fit_start = partial(
+        fit_variogram_start,
+        parameters=parameters,
+        data_stack=data_stack,
+        model_function=model_function,
+        config=optimization_settings["config"],
+    )
+    # ---- Distribute the fits across worker processes, if requested
+    if n_workers is not None and n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            fits = list(executor.map(fit_start, starts))
+    else:
+        fits = [fit_start(start) for start in starts]
+
+    # Tabulate the solutions
+    solutions = pd.DataFrame(
+        [
+            {"start_type": start_type, **best_fit, "MAD": mad, "cost": cost, "success": success}
+            for start_type, (best_fit, mad, cost, success) in zip(start_types, fits)
+        ]
+    )
+
+    # Select the best fit (lowest least-squares cost)
+    best_fit_params, mad_optimized, _, _ = fits[int(np.nanargmin(solutions["cost"]))]
+
+    return (
+        best_fit_params,
+        (list(parameters.keys()), list(parameters.valuesdict().values()), mad_initial),
+        (list(best_fit_params.keys()), list(best_fit_params.values()), mad_optimized),
+        solutions,
+    )
+
+
+def get_variogram_models(
+    models: Optional[List[Union[str, List[str]]]] = None,
+) -> List[Union[str, List[str]]]:
+    """
+    Get and validate a list of variogram model names
+
+    Parameters
+    ----------
+    models: Optional[List[Union[str, List[str]]]]
+        A list of model names (see :func:`variogram`). When `None`, every model in
+        `VARIOGRAM_MODELS["single"]` and `VARIOGRAM_MODELS["composite"]` is returned.
+    """
+
+    # Get all available models
+    if models is None:
+        models = list(VARIOGRAM_MODELS["single"]) + [
+            list(model) for model in VARIOGRAM_MODELS["composite"]
+        ]
+    # ---- Require at least one model
+    elif len(models) == 0:
+        raise ValueError("At least one variogram model must be supplied.")
+
+    # Validate that each model exists
+    for model in models:
+        get_variogram_arguments(model)
+
+    return list(models)
+
+
+def fit_variogram_model(
+    model: Union[str, List[str]],
+    lag_counts: np.ndarray,
+    lags: np.ndarray,
+    gamma_h: np.ndarray,
+    variogram_parameters: Dict[str, Any],
+    default_variogram_parameters: Dict[str, Any],
+    initialize_variogram: Union[List[str], Dict[str, Any]],
+    optimization_config: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Fit a single variogram model to a precomputed empirical variogram
+
+    Parameters
+    ----------
+    model: Union[str, List[str]]
+        A string or list of model names (see :func:`variogram`).
+    lag_counts: np.ndarray
+        An array containing counts of valid values per lag bin.
+    lags: np.ndarray
+        Lag distance array.
+    gamma_h: np.ndarray
+        Semivariance array.
+    variogram_parameters: Dict[str, Any]
+        User-defined variogram model parameters (see :func:`initialize_variogram_parameters`).
+    default_variogram_parameters: Dict[str, Any]
+        Default variogram model parameters.
+    initialize_variogram: Union[List[str], Dict[str, Any]]
+        The parameters that are optimized (see :func:`initialize_initial_optimization_values`).
+        Parameters that are not arguments of `model` are ignored.
+    optimization_config: Dict[str, Any]
+        The `lmfit` optimization configuration (see :func:`initialize_optimization_config`).
+
+    Returns
+    ----------
+    fit: Dict[str, Any]
+        A dictionary with the model name, the number of optimized parameters, the weighted mean
+        absolute deviation (MAD), the Akaike (AIC) and Bayesian (BIC) information criteria, and the
+        optimized parameter values.
+
+    Notes
+    ----------
+    The information criteria are computed from the weighted sum of squared residuals (RSS) over
+    the `n` lags within the maximum range and the number of optimized parameters (`k`), as in
+    `lmfit`: `AIC = n * log(RSS / n) + 2 * k` and `BIC = n * log(RSS / n) + k * log(n)`.
+    """
+
+    # Get the model arguments
+    model_args, variogram_fun = get_variogram_arguments(model)
+
+    # Initialize and validate the variogram model parameters
+    valid_variogram_params = initialize_variogram_parameters(
+        {**variogram_parameters, "model": model}, default_variogram_parameters
+    )
+
+    # Filter the optimized parameters to those required by the model
+    if isinstance(initialize_variogram, dict):
+        model_initial_values = {k: v for k, v in initialize_variogram.items() if k in model_args}
+    else:
+        model_initial_values = [k for k in initialize_variogram if k in model_args]
+
+    # Initialize and validate the initial values/boundary inputs
+    optimization_settings = {
+        "parameters": initialize_initial_optimization_values(
+            model_initial_values, valid_variogram_params
+        ),
+        "config": optimization_config,
+    }
+
+    # Optimize the parameters
+    best_fit_params, _, optimized_fit = optimize_variogram(
+        lag_counts, lags, gamma_h, optimization_settings, **valid_variogram_params
+    )
+
+    # Compute the weighted sum of squared residuals
+    data_stack = variogram_fit_data(lag_counts, lags, gamma_h, valid_variogram_params["range"])
+    fitted = variogram_fun["model_function"](data_stack[0], **best_fit_params)
+    residual_sum_of_squares = np.sum(((fitted - data_stack[1]) * data_stack[2]) ** 2)
+
+    # Compute the information criteria
+    # ---- Number of lags
+    n_lags = data_stack.shape[1]
+    # ---- Number of optimized parameters
+    n_parameters = sum(parameter.vary for parameter in optimization_settings["parameters"].values())
+    # ---- Log-likelihood term
+    with np.errstate(divide="ignore"):
+        likelihood = n_lags * np.log(residual_sum_of_squares / n_lags)
+
+    return {
+        "model": model,
+        "n_parameters": n_parameters,
+        "MAD": optimized_fit[2],
+        "AIC": likelihood + 2 * n_parameters,
+        "BIC": likelihood + n_parameters * np.log(n_lags),
+        **best_fit_params,
+    }
+
+
+def compare_variogram_models(
+    lag_counts: np.ndarray,
+    lags: np.ndarray,
+    gamma_h: np.ndarray,
+    variogram_parameters: Dict[str, Any],
+    default_variogram_parameters: Dict[str, Any],
+    initialize_variogram: Union[List[str], Dict[str, Any]],
+    optimization_config: Dict[str, Any],
+    models: Optional[List[Union[str, List[str]]]] = None,
+    n_workers: Optional[int] = None,
+    rank_by: Literal["AIC", "BIC", "MAD"] = "AIC",
+) -> pd.DataFrame:
+    """
+    Fit and rank multiple variogram models against the same empirical variogram
+
+    Parameters
+    ----------
+    models: Optional[List[Union[str, List[str]]]]
+        A list of model names (see :func:`variogram`). When `None`, every model in
+        `VARIOGRAM_MODELS["single"]` and `VARIOGRAM_MODELS["composite"]` is fitted.
+    n_workers: Optional[int]
+        The number of worker processes used for fitting the models. The models are fitted
+        sequentially when this is `None`.
+    rank_by: Literal["AIC", "BIC", "MAD"]
+        The metric used for ranking the models, where lower values are better.
+
+    Returns
+    ----------
+    comparison: pd.DataFrame
+        A dataframe with one row per model that includes its rank, the number of optimized
+        parameters, the weighted mean absolute deviation (MAD), the Akaike (AIC) and Bayesian (BIC)
+        information criteria, and the optimized parameter values (see :func:`fit_variogram_model`).
+        Models that could not be fitted are ranked last with missing metrics.
+
+    Notes
+    ----------
+    The remaining arguments are passed to :func:`fit_variogram_model`.
+    """
+
+    # Validate the ranking metric
+    if rank_by not in ["AIC", "BIC", "MAD"]:
+        raise ValueError(
+            f"The ranking metric ('rank_by') must either be 'AIC', 'BIC', or 'MAD' (not "
+            f"'{rank_by}')."
+        )
+
+    # Validate the number of workers
+    if n_workers is not None and (
+        not isinstance(n_workers, (int, np.integer)) or isinstance(n_workers, bool) or n_workers < 1
+    ):
+        raise ValueError(f"Argument `n_workers` must be a positive integer. Got: {n_workers}.")
+
+    # Get and validate the models
+    models = get_variogram_models(models)
+
+    # Bundle the shared arguments
+    fit_model = partial(
+        fit_variogram_model,
+        lag_counts=lag_counts,
+        lags=lags,
+        gamma_h=gamma_h,
+        variogram_parameters=variogram_parameters,
+        default_variogram_parameters=default_variogram_parameters,
+        initialize_variogram=initialize_variogram,
+        optimization_config=optimization_config,
+    )
+
+    # Fit each model
+    if n_workers is not None and n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(fit_model, model) for model in models]
+            outcomes = [future.exception() or future.result() for future in futures]
+    else:
+        outcomes = []
+        for model in models:
+            try:
+                outcomes.append(fit_model(model))
+            except Exception as e:
+                outcomes.append(e)
+
+    # Tabulate the fits
+    metrics = ["n_parameters", "MAD", "AIC", "BIC"]
+    fits = []
+    for model, outcome in zip(models, outcomes):
+        # ---- Record models that could not be fitted
+        if isinstance(outcome, Exception):
+            warnings.warn(f"The variogram model {model} could not be fitted: {outcome}")
+            fits.append({"model": model, **dict.fromkeys(metrics, np.nan)})
+        else:
+            fits.append(outcome)
+    # ---- Convert to a DataFrame
+    comparison = pd.DataFrame(fits)
+
+    # Rank the models
+    comparison = comparison.sort_values(rank_by, na_position="last", kind="stable").reset_index(
+        drop=True
+    )
+    comparison.insert(0, "rank", np.arange(1, len(comparison) + 1))
+
+    return comparison
@@ -8,10 +8,12 @@ from IPython.display import display
 from .analysis import (
     acoustics_to_biology,
     apportion_kriged_values,
+    cross_validate_kriging,
     krige,
     process_transect_data,
     stratified_summary,
     variogram_analysis,
+    variogram_model_comparison,
 )
 from .core import DATA_STRUCTURE
 from .graphics import variogram_interactive as egv
@@ -399,6 +401,12 @@ class Survey:
             "decay_power",
         ],
         variable: Literal["biomass"] = "biomass",
+        pair_engine: Literal["chunked", "dense", "kdtree"] = "chunked",
+        block_size: int = 1024,
+        n_starts: int = 1,
+        n_workers: Optional[int] = None,
+        global_search: bool = False,
+        random_state: Optional[int] = None,
         verbose: bool = True,
     ):
         """
@@ -450,6 +458,27 @@ class Survey:
             "abundance" and "biomass", with the default being "biomass". These inputs correspond
             to fitting the empirical and theoretical variograms on "number density" and "biomass
             density", respectively.
+        pair_engine: Literal["chunked", "dense", "kdtree"]
+            The engine used for enumerating the point pairs of the empirical variogram. The
+            "chunked" engine (default) streams point pairs in row blocks, "kdtree" only enumerates
+            the point pairs within the maximum lag distance, and "dense" computes the full `n x n`
+            azimuth and lag matrices. See
+            :fun:`echopop.spatial.variogram.empirical_variogram` for more details.
+        block_size: int
+            The number of rows per block when `pair_engine="chunked"`.
+        n_starts: int
+            The total number of starting points used for optimizing the variogram parameters,
+            which includes the initial values. Additional starting points are drawn within the
+            parameter bounds via Latin hypercube sampling and the fit with the lowest least-squares
+            cost is retained. See
+            :fun:`echopop.spatial.variogram.multistart_optimize_variogram` for more details.
+        n_workers: Optional[int]
+            The number of worker processes used for running the fits from each starting point.
+        global_search: bool
+            When set to `True`, an additional starting point is seeded by a global search via
+            differential evolution.
+        random_state: Optional[int]
+            Seed used for drawing the starting points and for the global search.
         verbose: bool
             When set to `True`, optional console messages and reports are provided to users.
 
@@ -485,6 +514,12 @@ class Survey:
                     ),
                     "force_lag_zero": force_lag_zero,
                     "model": model,
+                    "pair_engine": pair_engine,
+                    "block_size": block_size,
+                    "n_starts": n_starts,
+                    "n_workers": n_workers,
+                    "global_search": global_search,
+                    "random_state": random_state,
                     "standardize_coordinates": standardize_coordinates,
                     "stratum_name": self.analysis["settings"]["transect"]["stratum_name"],
                     "variable": variable,
@@ -527,6 +562,9 @@ class Survey:
                 "optimized_fit": best_fit_variogram["optimized_fit"],
             }
         )
+        # ---- Add the solutions from each starting point, if computed
+        if best_fit_variogram["multistart"] is not None:
+            self.analysis["variogram"].update({"multistart": best_fit_variogram["multistart"]})
 
         # Add variogram result
         self.results.update(
@@ -537,6 +575,158 @@ class Survey:
         if verbose:
             em.variogram_results_msg(self.analysis["variogram"])
 
+    def compare_variogram_models(
+        self,
+        models: Optional[List[Union[str, List[str]]]] = None,
+        variogram_parameters: Dict[str, Any] = {},
+        optimization_parameters: Dict[str, Any] = {},
+        n_lags: int = 30,
+        azimuth_range: float = 360.0,
+        standardize_coordinates: bool = True,
+        force_lag_zero: bool = True,
+        initialize_variogram: Union[List[str], Dict[str, Any]] = [
+            "nugget",
+            "sill",
+            "correlation_range",
+            "hole_effect_range",
+            "decay_power",
+        ],
+        variable: Literal["biomass"] = "biomass",
+        pair_engine: Literal["chunked", "dense", "kdtree"] = "chunked",
+        block_size: int = 1024,
+        n_workers: Optional[int] = None,
+        rank_by: Literal["AIC", "BIC", "MAD"] = "AIC",
+        verbose: bool = True,
+    ):
+        """
+        Fit and rank multiple variogram models against a single empirical variogram
+
+        Parameters
+        ----------
+        models: Optional[List[Union[str, List[str]]]]
+            A list of model names, where a list of two names represents a composite model (e.g.
+            ['bessel', 'exponential']). When `None`, every single family and composite model in
+            :fun:`echopop.spatial.variogram.VARIOGRAM_MODELS` is fitted.
+        variogram_parameters: VariogramBase
+            A dictionary comprising various arguments required for computing the model variogram.
+            The 'model' entry is ignored since it is set by `models`. See
+            :fun:`echopop.utils.validate.VariogramBase` and
+            :fun:`echopop.spatial.variogram.variogram` for more details on the required/default
+            parameters.
+        optimization_parameters: VariogramOptimize
+            A dictionary comprising various arguments for optimizing the variogram fits via
+            non-linear least squares. See :fun:`echopop.utils.validate.VariogramOptimize` for more
+            details on the required/default parameters.
+        n_lags: int
+            See the `variogram_parameters` argument in
+            :fun:`echopop.spatial.variogram.empirical_variogram` for more details on
+            `n_lags`.
+        azimuth_range: float
+            The total azimuth angle range that is allowed for constraining
+            the relative angles between spatial points, particularly for cases where a high degree
+            of directionality is assumed.
+        standardize_coordinates: bool
+            When set to `True`, transect coordinates are standardized using reference coordinates.
+        force_lag_zero: bool
+            See the `variogram_parameters` argument in
+            :fun:`echopop.spatial.variogram.empirical_variogram` for more details on
+            `force_lag_zero`.
+        initialize_variogram: VariogramInitial
+            A dictionary or list that indicates how each variogram parameter (see
+            :fun:`echopop.spatial.variogram.variogram` for more details) is configured for
+            optimization. Only the parameters that are arguments of each model are optimized for
+            that model. See :fun:`echopop.utils.validate.VariogramInitial` and
+            :fun:`echopop.utils.validate.InitialValues` for more details.
+        variable: Literal["biomass"]
+            Transect data values used for fitting the variograms. Only "biomass" (i.e. biomass
+            density) is currently supported.
+        pair_engine: Literal["chunked", "dense", "kdtree"]
+            The engine used for enumerating the point pairs of the empirical variogram. See
+            :fun:`echopop.spatial.variogram.empirical_variogram` for more details.
+        block_size: int
+            The number of rows per block when `pair_engine="chunked"`.
+        n_workers: Optional[int]
+            The number of worker processes used for fitting the models.
+        rank_by: Literal["AIC", "BIC", "MAD"]
+            The metric used for ranking the models: the Akaike information criterion ("AIC"),
+            the Bayesian information criterion ("BIC"), or the weighted mean absolute deviation
+            ("MAD"). Lower values rank higher.
+        verbose: bool
+            When set to `True`, the ranked comparison is printed to the console.
+
+        Notes
+        -----
+        The empirical variogram is computed once and shared by all models. The ranked comparison
+        is stored in `self.results["variogram_comparison"]` and returned.
+        """
+
+        # Check dataset integrity
+        dataset_integrity(self.input, analysis="variogram")
+
+        # Validate "variable" input
+        if variable not in ["biomass"]:
+            raise ValueError(
+                f"The user input for `variable` ({variable}) is invalid. Only `variable='biomass'` "
+                f"is a valid input for the `compare_variogram_models()` method."
+            )
+
+        # Parameterize analysis settings that will be applied to the variogram model comparison
+        self.analysis["settings"].update(
+            {
+                "variogram_comparison": {
+                    "azimuth_range": azimuth_range,
+                    "fit_parameters": (
+                        initialize_variogram.keys()
+                        if isinstance(initialize_variogram, dict)
+                        else initialize_variogram
+                    ),
+                    "force_lag_zero": force_lag_zero,
+                    "models": models,
+                    "pair_engine": pair_engine,
+                    "block_size": block_size,
+                    "n_workers": n_workers,
+                    "rank_by": rank_by,
+                    "standardize_coordinates": standardize_coordinates,
+                    "stratum_name": self.analysis["settings"]["transect"]["stratum_name"],
+                    "variable": variable,
+                    "verbose": verbose,
+                    "optimization": optimization_parameters,
+                }
+            }
+        )
+
+        # Append `kriging_parameters` to the settings dictionary
+        if standardize_coordinates:
+            self.analysis["settings"]["variogram_comparison"].update(
+                {"kriging_parameters": self.input["statistics"]["kriging"]["model_config"]}
+            )
+
+        # Create a copy of the existing variogram settings
+        default_variogram_parameters = self.input["statistics"]["variogram"]["model_config"].copy()
+        # ---- Update n_lags
+        default_variogram_parameters.update({"n_lags": n_lags})
+
+        # Fit and rank the variogram models
+        comparison = variogram_model_comparison(
+            variogram_parameters,
+            default_variogram_parameters,
+            optimization_parameters,
+            initialize_variogram,
+            self.analysis["transect"],
+            self.analysis["settings"]["variogram_comparison"],
+            self.input["statistics"]["kriging"]["isobath_200m_df"],
+        )
+
+        # Add the comparison to the results
+        self.results.update({"variogram_comparison": comparison})
+
+        # Print result if `verbose == True`
+        if verbose:
+            em.variogram_comparison_msg(comparison, rank_by)
+
+        # Return the ranked comparison
+        return comparison
+
     def kriging_analysis(
         self,
         cropping_parameters: Dict[str, Any] = {},
@@ -544,8 +734,20 @@ class Survey:
         coordinate_transform: bool = True,
         extrapolate: bool = False,
         best_fit_variogram: bool = False,
-        variable: Literal["biomass"] = "biomass",
+        variable: Union[Literal["biomass"], List[str]] = "biomass",
         variogram_parameters: Optional[Dict[str, Any]] = None,
+        n_workers: Optional[int] = None,
+        tile_size: int = 10000,
+        return_weights: bool = False,
+        solver: Literal["svd", "lu", "auto"] = "svd",
+        precision: Literal["float64", "float32"] = "float64",
+        mesh_cache_directory: Optional[Union[str, Path]] = None,
+        mesh_cache_size: Optional[float] = 1e9,
+        incremental: bool = False,
+        resolution_level: int = 0,
+        refinement: Optional[Dict[str, float]] = None,
+        block_points: Optional[int] = None,
+        chunk_size: Optional[int] = None,
         verbose: bool = True,
     ):
         """
@@ -554,23 +756,107 @@ class Survey:
 
         Parameters
         ----------
-        variable
-            Biological variable that will be interpolated via kriging
+        variable: Union[Literal["biomass"], List[str]]
+            Biological variable that will be interpolated via kriging. A list of transect variables
+            (e.g. `["biomass", "biomass_density", "nasc"]`) can be supplied to interpolate them all
+            with a single set of kriging weights. The first variable is used for the default
+            kriged results and apportionment while each variable adds its own columns to the
+            kriged mesh results.
+        n_workers: Optional[int]
+            The number of worker processes used for kriging. When defined, the kriging mesh is
+            partitioned into spatial tiles that are interpolated in parallel. Defaults to `None`,
+            where all mesh nodes are interpolated within the current process.
+        tile_size: int
+            The maximum number of mesh nodes within each spatial tile when `n_workers` is defined.
+        return_weights: bool
+            When True, the sparse kriging weight operator is stored in
+            `self.analysis["kriging"]["weight_operator"]` so that other transect variables can be
+            interpolated onto the same mesh without re-solving the kriging systems (see
+            :func:`echopop.spatial.krige.apply_kriging_weights`).
+        solver: Literal["svd", "lu", "auto"]
+            The linear solver used to compute the kriging weights. This can either be 'svd'
+            (default) for a truncated singular value decomposition, 'lu' for a direct solve via LU
+            decomposition, or 'auto', which uses the direct solve unless a kriging matrix is
+            near-singular (see :func:`echopop.spatial.krige.batch_kriging_lambda`).
+        precision: Literal["float64", "float32"]
+            The floating-point precision used to compute the kriging weights. 'float32' halves the
+            memory of the neighbor distances, variogram evaluations, and kriging matrices while the
+            interpolated values are still accumulated in float64. A comparison of the survey
+            estimate and CV against a float64 reference over a sample of mesh nodes is stored in
+            `self.results["kriging"]["precision_report"]` (see
+            :func:`echopop.spatial.krige.kriging_precision_report`).
+        mesh_cache_directory: Optional[Union[str, Path]]
+            Directory where the cropped and coordinate-standardized kriging mesh is cached. Cached
+            meshes are keyed by the contents of the mesh, transect coordinates, isobath reference,
+            and the cropping and standardization settings, so repeated runs with the same inputs
+            skip the mesh cropping and coordinate transformation. Defaults to `None`, where no
+            cache is used.
+        mesh_cache_size: Optional[float]
+            The maximum total size (bytes) of the mesh cache. The least-recently-used meshes are
+            removed when this size is exceeded. Defaults to 1 GB. When `None`, no meshes are
+            removed.
+        incremental: bool
+            When True, the kriging weights of the previous incremental run (stored in
+            `self.analysis["kriging"]["weight_operator"]`) are reused and only the mesh nodes
+            affected by newly appended transect intervals are re-solved (see
+            :func:`echopop.spatial.krige.update_kriging_weights`). The survey-wide estimates are
+            recomputed from the updated weights. The first incremental run computes every mesh
+            node.
+        resolution_level: int
+            The coarsening level of the kriging mesh (see :func:`echopop.spatial.mesh.coarsen_mesh`)
+            that is kriged: 0 (default) for the full-resolution mesh, or 1, 2, and 3 for meshes
+            that are 2x, 4x, and 8x coarser along each axis. Coarse levels are useful for fast
+            previews and parameter exploration prior to the final full-resolution run.
+        refinement: Optional[Dict[str, float]]
+            Thresholds for the 'kriged_variance' and/or 'gradient' (the largest absolute
+            difference in the kriged mean between adjacent coarse mesh nodes) that are used when
+            `resolution_level > 0`. Only the mesh nodes within coarse cells that exceed either
+            threshold are re-kriged at full resolution, while the remaining mesh nodes inherit
+            the kriged values of their coarse cell (see
+            :func:`echopop.spatial.krige.multiresolution_kriging`). The results are then reported
+            at full resolution. Defaults to `None`, where no refinement is done.
+        block_points: Optional[int]
+            The number of points (a square number, e.g. 4, 9, or 16) used to discretize each mesh
+            cell for block kriging. The kriged values then represent the average over each cell
+            rather than the value at its centroid, and the kriged variance accounts for the
+            within-cell variability (see :func:`echopop.spatial.krige.block_discretization`).
+            Defaults to `None`, where the mesh nodes are point-kriged.
+        chunk_size: Optional[int]
+            The maximum number of mesh nodes kriged at once when `n_workers` is not defined. The
+            memory of the intermediate neighbor, semivariogram, and kriging matrix arrays is then
+            bounded by `chunk_size` rather than by the size of the mesh (see
+            :func:`echopop.spatial.krige.kriging_iter`). Defaults to `None`, where the entire mesh
+            is kriged at once.
         """
 
         # Check dataset integrity
         dataset_integrity(self.input, analysis="kriging")
 
+        # Format the kriged variable(s) as a list
+        variables = [variable] if isinstance(variable, str) else list(variable)
+
         # Populate settings dictionary with input argument values/entries
         self.analysis["settings"].update(
             {
                 "kriging": {
                     "best_fit_variogram": best_fit_variogram,
+                    "block_points": block_points,
+                    "chunk_size": chunk_size,
                     "cropping_parameters": {**cropping_parameters},
                     "extrapolate": extrapolate,
+                    "incremental": incremental,
                     "kriging_parameters": {**kriging_parameters},
+                    "mesh_cache": {"directory": mesh_cache_directory, "max_size": mesh_cache_size},
+                    "n_workers": n_workers,
+                    "precision": precision,
+                    "refinement": refinement,
+                    "resolution_level": resolution_level,
+                    "return_weights": return_weights,
+                    "solver": solver,
                     "standardize_coordinates": coordinate_transform,
-                    "variable": variable,
+                    "tile_size": tile_size,
+                    "variable": variables[0],
+                    "variables": variables,
                     "verbose": verbose,
                 },
             },
@@ -658,6 +944,106 @@ class Survey:
         if verbose:
             em.kriging_results_msg(self.results["kriging"], self.analysis["settings"]["kriging"])
 
+    def kriging_cross_validation(
+        self,
+        kriging_parameters: Dict[str, Any] = {},
+        coordinate_transform: bool = True,
+        best_fit_variogram: bool = False,
+        variable: Literal["biomass"] = "biomass",
+        variogram_parameters: Optional[Dict[str, Any]] = None,
+        verbose: bool = True,
+    ):
+        """
+        Evaluate the kriging and variogram parameters via leave-one-out cross-validation
+
+        Parameters
+        ----------
+        kriging_parameters: Dict[str, Any]
+            Kriging parameters (e.g. 'kmin', 'kmax', 'search_radius') that supersede the default
+            values imported from the configuration *.yaml files.
+        coordinate_transform: bool
+            When set to `True`, transect coordinates are standardized using reference coordinates.
+        best_fit_variogram: bool
+            When set to `True`, the best-fit variogram parameters computed via
+            :func:`Survey.fit_variogram` are used when no variogram model configuration is
+            available.
+        variable: Literal["biomass"]
+            Biological variable that is cross-validated.
+        variogram_parameters: Optional[Dict[str, Any]]
+            Variogram parameters that supersede the default values imported from the
+            configuration *.yaml files.
+        verbose: bool
+            When set to `True`, optional console messages and reports are provided to users.
+
+        Notes
+        -----
+        Each transect interval is predicted from its neighbors with the interval itself left out
+        and the prediction errors are stored in `self.results["kriging_cross_validation"]`. The
+        kriging systems of intervals with the same number of neighbors are solved as a batch (see
+        :func:`echopop.spatial.krige.kriging_cross_validation`). This enables comparing different
+        sets of kriging and variogram parameters without running :func:`Survey.kriging_analysis`.
+        """
+
+        # Check dataset integrity
+        dataset_integrity(self.input, analysis="kriging")
+
+        # Populate settings dictionary with input argument values/entries
+        self.analysis["settings"].update(
+            {
+                "kriging_cross_validation": {
+                    "best_fit_variogram": best_fit_variogram,
+                    "kriging_parameters": {**kriging_parameters},
+                    "standardize_coordinates": coordinate_transform,
+                    "variable": variable,
+                    "verbose": verbose,
+                    # ---- From `self.config`
+                    "projection": self.config["geospatial"]["init"],
+                    # ---- From `self.transect_analysis` settings
+                    "exclude_age1": self.analysis["settings"]["transect"]["exclude_age1"],
+                    "stratum": self.analysis["settings"]["transect"]["stratum"],
+                    "stratum_name": (
+                        "stratum_num"
+                        if self.analysis["settings"]["transect"]["stratum"] == "ks"
+                        else "inpfc"
+                    ),
+                },
+            },
+        )
+
+        # Define the variogram parameters
+        # ---- Start from the configured model, if available
+        if "model_config" in self.input["statistics"]["variogram"]:
+            cv_variogram_parameters = {**self.input["statistics"]["variogram"]["model_config"]}
+        elif best_fit_variogram is True:
+            cv_variogram_parameters = {
+                **self.results["variogram"]["model"],
+                **self.results["variogram"]["model_fit"],
+            }
+        else:
+            cv_variogram_parameters = {}
+        # ---- Update with the user-defined values
+        if variogram_parameters:
+            cv_variogram_parameters.update(variogram_parameters)
+        # ---- Add to the settings
+        self.analysis["settings"]["kriging_cross_validation"].update(
+            {"variogram_parameters": cv_variogram_parameters}
+        )
+
+        # Compute the leave-one-out errors
+        cross_validation_results = cross_validate_kriging(
+            self.input, self.analysis, self.analysis["settings"]["kriging_cross_validation"]
+        )
+
+        # Save the results to the `results` attribute
+        self.results.update({"kriging_cross_validation": cross_validation_results})
+
+        # Print result if `verbose == True`
+        if verbose:
+            em.kriging_cross_validation_msg(
+                self.results["kriging_cross_validation"],
+                self.analysis["settings"]["kriging_cross_validation"],
+            )
+
     def summary(self, results_name: str):
         """
         Summary property that prints out formatted results for the desired analysis
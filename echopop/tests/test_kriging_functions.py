@@ -1,9 +1,132 @@
+import geopandas as gpd
+import geopy.distance
 import numpy as np
+import pandas as pd
+import pytest
 
-from echopop.spatial.krige import kriging_lambda, kriging_matrix
+from echopop.spatial.krige import (
+    apply_kriging_weights,
+    batch_kriging_lambda,
+    batch_kriging_matrix,
+    batch_kriging_weights,
+    block_average_variogram,
+    block_discretization,
+    kriging,
+    kriging_cross_validation,
+    kriging_iter,
+    multiresolution_kriging,
+    partition_mesh_tiles,
+    search_nearest_neighbors,
+)
+from echopop.spatial.mesh import (
+    block_neighbor_gradient,
+    coarsen_mesh,
+    hull_crop_method,
+    load_cached_mesh,
+    mesh_bounds_join,
+    mesh_cache_key,
+    mesh_lattice_index,
+    save_cached_mesh,
+)
+from echopop.spatial.projection import geodesic_distance, wgs84_to_utm
+from echopop.spatial.transect import transect_extent
+from echopop.spatial.variogram import compile_variogram, variogram
 
 
-def test_kriging_lambda():
+def test_batch_kriging_matrix():
+
+    # Mock x-coordinates
+    test_x_coordinates = np.linspace(0.0, 10.0, 5)
+
+    # Mock y-coordinates
+    test_y_coordinates = np.linspace(0.0, 10.0, 5)
+
+    # Mock variogram parameters
+    test_variogram_parameters = {
+        "range": 10.0,
+        "correlation_range": 2.0,
+        "hole_effect_range": 0.0,
+        "nugget": 0.0,
+        "sill": 5.0,
+        "decay_power": 1.0,
+        "model": ["bessel", "exponential"],
+    }
+
+    # Evaluate `batch_kriging_matrix` over a stack of identical coordinates
+    eval_kriging_matrix = batch_kriging_matrix(
+        np.tile(test_x_coordinates, (2, 1)),
+        np.tile(test_y_coordinates, (2, 1)),
+        compile_variogram(test_variogram_parameters),
+    )
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Expected outcome
+    expected_matrix = np.array(
+        [
+            [0.00000000, 4.14643112, 4.85428403, 4.97512428, 4.99575337, 1.00000000],
+            [4.14643112, 0.00000000, 4.14643112, 4.85428403, 4.97512428, 1.00000000],
+            [4.85428403, 4.14643112, 0.00000000, 4.14643112, 4.85428403, 1.00000000],
+            [4.97512428, 4.85428403, 4.14643112, 0.00000000, 4.14643112, 1.00000000],
+            [4.99575337, 4.97512428, 4.85428403, 4.14643112, 0.00000000, 1.00000000],
+            [1.00000000, 1.00000000, 1.00000000, 1.00000000, 1.00000000, 0.00000000],
+        ]
+    )
+
+    # Test
+    assert eval_kriging_matrix.shape == (2, 6, 6)
+    assert np.allclose(eval_kriging_matrix, expected_matrix)
+
+
+def test_search_nearest_neighbors():
+
+    # Mock transect data
+    rng = np.random.default_rng(99)
+    test_transect_data = pd.DataFrame(
+        {"x": rng.uniform(-1.0, 1.0, size=200), "y": rng.uniform(-1.0, 1.0, size=200)}
+    )
+
+    # Mock mesh data
+    test_mesh_data = pd.DataFrame(
+        {"x": rng.uniform(-1.5, 1.5, size=50), "y": rng.uniform(-1.5, 1.5, size=50)}
+    )
+
+    # Evaluate `search_nearest_neighbors` for each backend
+    # ---- KD-tree
+    kdtree_points, kdtree_indices = search_nearest_neighbors(
+        test_transect_data, test_mesh_data, 10, "kdtree"
+    )
+    # ---- Dense distance matrix
+    dense_points, dense_indices = search_nearest_neighbors(
+        test_transect_data, test_mesh_data, 10, "dense"
+    )
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Shape
+    assert kdtree_points.shape == (50, 10)
+    # Distances
+    assert np.allclose(kdtree_points, dense_points)
+    # Indices
+    assert np.array_equal(kdtree_indices, dense_indices)
+    # Ascending order
+    assert np.all(np.diff(kdtree_points, axis=1) >= 0.0)
+
+    # Test when `k_max` spans every transect interval
+    kdtree_points_all, _ = search_nearest_neighbors(
+        test_transect_data, test_mesh_data, 200, "kdtree"
+    )
+    dense_points_all, _ = search_nearest_neighbors(test_transect_data, test_mesh_data, 200, "dense")
+    assert np.allclose(kdtree_points_all, dense_points_all)
+
+    # Test for invalid backend
+    with pytest.raises(ValueError, match="neighbor search method"):
+        assert search_nearest_neighbors(test_transect_data, test_mesh_data, 10, "octree")
+
+
+def test_batch_kriging_lambda():
 
     # Mock lagged semivariance values
     test_lagged_semivariogram = np.array([0.0, 0.50, 0.75, 0.875, 0.9375, 1.0])
@@ -23,9 +146,11 @@ def test_kriging_lambda():
         ]
     )
 
-    # Evaluate `kriging_lambda`
-    eval_kriging_lambda = kriging_lambda(
-        test_anisotropy, test_lagged_semivariogram, test_kriging_matrix
+    # Evaluate `batch_kriging_lambda` over a stack of identical matrices
+    eval_batch_kriging_lambda = batch_kriging_lambda(
+        test_anisotropy,
+        np.tile(test_lagged_semivariogram, (3, 1)),
+        np.tile(test_kriging_matrix, (3, 1, 1)),
     )
 
     # -----------------
@@ -36,47 +161,1103 @@ def test_kriging_lambda():
         [3.2621651, -1.01812305, -0.14593900, -0.16842517, -0.9296778, 0.41402284]
     )
     # Test
-    assert np.allclose(eval_kriging_lambda, expected_array)
+    assert eval_batch_kriging_lambda.shape == (3, 6)
+    assert np.allclose(eval_batch_kriging_lambda, expected_array)
 
 
-def test_kriging_matrix():
+def test_batch_kriging_lambda_solver():
 
-    # Mock x-coordinates
-    test_x_coordinates = np.linspace(0.0, 10.0, 5)
+    # Mock lagged semivariance values
+    test_lagged_semivariogram = np.array([0.0, 0.50, 0.75, 0.875, 0.9375, 1.0])
 
-    # Mock y-coordinates
-    test_y_coordinates = np.linspace(0.0, 10.0, 5)
+    # Mock anisotropy value
+    test_anisotropy = 0.001
 
-    # Mock variogram parameters
+    # Mock kriging matrix
+    test_kriging_matrix = np.array(
+        [
+            [0.00, 0.11, 0.20, 0.24, 0.25, 1.00],
+            [0.11, 0.00, 0.11, 0.20, 0.24, 1.00],
+            [0.20, 0.11, 0.00, 0.11, 0.20, 1.00],
+            [0.24, 0.20, 0.11, 0.00, 0.11, 1.00],
+            [0.25, 0.24, 0.20, 0.11, 0.00, 1.00],
+            [1.00, 1.00, 1.00, 1.00, 1.00, 0.00],
+        ]
+    )
+    # ---- Mock singular kriging matrix (first two points are co-located)
+    test_singular_matrix = test_kriging_matrix.copy()
+    test_singular_matrix[1, :] = test_singular_matrix[0, :]
+    test_singular_matrix[:, 1] = test_singular_matrix[:, 0]
+    # ---- Stack the well-conditioned and singular matrices
+    test_lagged_stack = np.tile(test_lagged_semivariogram, (3, 1))
+    test_matrix_stack = np.stack([test_kriging_matrix, test_singular_matrix, test_kriging_matrix])
+
+    # Evaluate `batch_kriging_lambda` for each solver
+    solver_counts = {solver: {} for solver in ["svd", "lu", "auto"]}
+    eval_lambda = {
+        solver: batch_kriging_lambda(
+            test_anisotropy, test_lagged_stack, test_matrix_stack, solver, solver_counts[solver]
+        )
+        for solver in ["svd", "lu", "auto"]
+    }
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Direct and SVD solvers agree for well-conditioned matrices
+    assert np.allclose(eval_lambda["lu"][[0, 2]], eval_lambda["svd"][[0, 2]])
+    assert np.allclose(eval_lambda["auto"][[0, 2]], eval_lambda["svd"][[0, 2]])
+    # The singular matrix falls back to SVD
+    assert np.all(np.isfinite(eval_lambda["svd"]))
+    assert np.allclose(eval_lambda["lu"][1], eval_lambda["svd"][1])
+    assert np.allclose(eval_lambda["auto"][1], eval_lambda["svd"][1])
+    # Solver path counts
+    assert solver_counts["svd"] == {"lu": 0, "svd": 3}
+    assert solver_counts["lu"] == {"lu": 2, "svd": 1}
+    assert solver_counts["auto"] == {"lu": 2, "svd": 1}
+
+    # Test for invalid solver
+    with pytest.raises(ValueError, match="kriging solver"):
+        assert batch_kriging_lambda(
+            test_anisotropy, test_lagged_stack, test_matrix_stack, "cholesky"
+        )
+
+
+def test_batch_kriging_weights():
+
+    # Mock transect coordinates and values
+    rng = np.random.default_rng(99)
+    test_x_coordinates = rng.uniform(-1.0, 1.0, size=30)
+    test_y_coordinates = rng.uniform(-1.0, 1.0, size=30)
+    test_variable_data = rng.uniform(0.0, 10.0, size=30)
+
+    # Mock kriging and variogram parameters
+    # ---- Disable the singular value truncation for comparisons against exact solutions
+    test_kriging_parameters = {"anisotropy": 1e-12, "kmin": 3, "kmax": 5, "search_radius": 0.5}
     test_variogram_parameters = {
-        "range": 10.0,
-        "correlation_range": 2.0,
+        "correlation_range": 0.2,
         "hole_effect_range": 0.0,
         "nugget": 0.0,
-        "sill": 5.0,
-        "decay_power": 1.0,
+        "sill": 1.0,
+        "decay_power": 1.5,
         "model": ["bessel", "exponential"],
     }
+    test_variogram_model = compile_variogram(test_variogram_parameters)
+
+    # Mock the neighbor arrays for 4 mesh nodes
+    # ---- Range grid (NaN-padded for the mesh nodes with fewer than `kmax` neighbors)
+    test_range_grid = np.array(
+        [
+            [0.10, 0.20, 0.30, 0.40, 0.60],
+            [0.05, 0.10, 0.15, 0.20, 0.25],
+            [0.40, 0.55, 0.70, np.nan, np.nan],
+            [0.60, 0.70, 0.80, np.nan, np.nan],
+        ]
+    )
+    # ---- WR indices
+    test_inside_indices = np.array(
+        [
+            [0.0, 1.0, 2.0, 3.0, 4.0],
+            [5.0, 6.0, 7.0, 8.0, 9.0],
+            [10.0, np.nan, np.nan, np.nan, np.nan],
+            [np.nan, np.nan, np.nan, np.nan, np.nan],
+        ]
+    )
+    # ---- OOS indices
+    test_outside_indices = np.array(
+        [
+            [np.nan, np.nan, np.nan],
+            [np.nan, np.nan, np.nan],
+            [11.0, 12.0, np.nan],
+            [13.0, 14.0, 15.0],
+        ]
+    )
+    # ---- OOS weights
+    test_outside_weights = np.array([1.0, 1.0, 1.0, 0.5])
+    # ---- M2 lagged semivariogram
+    test_M2 = np.sort(np.hstack((test_variogram_model(test_range_grid), np.ones((4, 1)))))
+
+    # Evaluate `batch_kriging_weights`
+    eval_weight_operator = batch_kriging_weights(
+        test_inside_indices,
+        test_outside_indices,
+        test_outside_weights,
+        test_M2,
+        test_range_grid,
+        test_kriging_parameters,
+        test_variogram_parameters,
+        test_x_coordinates,
+        test_y_coordinates,
+    )
+    # ---- Apply the weights
+    eval_kriged_values = apply_kriging_weights(eval_weight_operator, test_variable_data)
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Expected outcome (solving each mesh node separately)
+    expected_kriged_values = np.full((4, 3), np.nan)
+    for i in range(4):
+        # ---- Combine the IS and OOS indices
+        composite = np.concatenate([test_inside_indices[i], test_outside_indices[i]])
+        composite = composite[~np.isnan(composite)].astype(int)
+        # ---- Drop the NaN-padding
+        M2 = test_M2[i][~np.isnan(test_M2[i])]
+        range_vals = test_range_grid[i][~np.isnan(test_range_grid[i])]
+        # ---- Set the values beyond the search radius to 0.0
+        variable_indexed = np.where(range_vals > 0.5, 0.0, test_variable_data[composite])
+        # ---- Solve the kriging system
+        K = np.ones((len(composite) + 1, len(composite) + 1))
+        K[:-1, :-1] = test_variogram_model(
+            np.hypot(
+                test_x_coordinates[composite, np.newaxis] - test_x_coordinates[composite],
+                test_y_coordinates[composite, np.newaxis] - test_y_coordinates[composite],
+            )
+        )
+        np.fill_diagonal(K, 0.0)
+        weights = np.linalg.solve(K, M2)
+        # ---- Point estimate, kriged variance, and sample variance
+        point_estimate = weights[:-1] @ variable_indexed * test_outside_weights[i]
+        kriged_variance = weights @ M2
+        # ---- The mock semivariograms do not match the coordinates, so the variance can be < 0.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sample_variance = np.sqrt(kriged_variance * np.var(variable_indexed, ddof=1)) / np.abs(
+                point_estimate
+            )
+        expected_kriged_values[i] = [
+            point_estimate,
+            kriged_variance,
+            np.nan if np.abs(point_estimate) < np.finfo(float).eps else sample_variance,
+        ]
+    # Test
+    assert eval_kriged_values.shape == (4, 3)
+    assert np.allclose(eval_kriged_values, expected_kriged_values, equal_nan=True)
+    assert np.array_equal(eval_weight_operator["neighbor_counts"], [5, 5, 3, 3])
+
+
+@pytest.fixture
+def kriging_data():
+
+    # Mock transect data
+    rng = np.random.default_rng(99)
+    transect_data = pd.DataFrame(
+        {
+            "transect_num": np.repeat(np.arange(1, 11), 20),
+            "latitude": np.repeat(np.linspace(34.0, 35.0, 10), 20),
+            "x": np.tile(np.linspace(-0.5, 0.5, 20), 10),
+            "y": np.repeat(np.linspace(-0.5, 0.5, 10), 20) + rng.normal(0.0, 0.001, 200),
+            "biomass_density": rng.lognormal(1.0, 1.0, 200),
+        }
+    )
+
+    # Mock mesh data
+    mesh_x, mesh_y = np.meshgrid(np.linspace(-0.8, 0.6, 30), np.linspace(-0.6, 0.6, 20))
+    mesh_data = pd.DataFrame(
+        {
+            "latitude": 34.5 + mesh_y.ravel(),
+            "longitude": -123.0 + mesh_x.ravel(),
+            "x": mesh_x.ravel(),
+            "y": mesh_y.ravel(),
+            "fraction_cell_in_polygon": rng.uniform(0.5, 1.0, 600),
+        }
+    )
+
+    # Mock settings
+    settings_dict = {
+        "variable": "biomass_density",
+        "verbose": False,
+        "kriging_parameters": {
+            "anisotropy": 0.001,
+            "kmin": 3,
+            "kmax": 10,
+            "search_radius": 0.1,
+            "A0": 6.25,
+        },
+        "variogram_parameters": {
+            "correlation_range": 0.05,
+            "hole_effect_range": 0.0,
+            "nugget": 0.0,
+            "sill": 1.0,
+            "decay_power": 1.5,
+            "model": ["bessel", "exponential"],
+        },
+    }
+
+    return transect_data, mesh_data, settings_dict
+
+
+def test_partition_mesh_tiles(kriging_data):
+
+    # Get the mesh
+    _, mesh_data, _ = kriging_data
+
+    # Evaluate `partition_mesh_tiles`
+    tiles = partition_mesh_tiles(mesh_data, 64)
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Tile sizes
+    assert all([len(tile) <= 64 for tile in tiles])
+    # Every mesh node is assigned to exactly one tile
+    assert np.array_equal(np.sort(np.concatenate(tiles)), np.arange(len(mesh_data)))
+
+
+def test_parallel_kriging(kriging_data):
+
+    # Get the mock data
+    transect_data, mesh_data, settings_dict = kriging_data
+
+    # Evaluate `kriging` in serial
+    serial_results = kriging(transect_data, mesh_data, settings_dict)
+
+    # Evaluate `kriging` in parallel
+    parallel_results = kriging(
+        transect_data, mesh_data, {**settings_dict, "n_workers": 2, "tile_size": 64}
+    )
+    # ---- Dense neighbor search
+    parallel_dense_results = kriging(
+        transect_data,
+        mesh_data,
+        {**settings_dict, "n_workers": 2, "tile_size": 64, "neighbor_search": "dense"},
+    )
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Survey-wide estimates
+    assert np.isclose(serial_results["survey_estimate"], parallel_results["survey_estimate"])
+    assert np.isclose(serial_results["survey_cv"], parallel_results["survey_cv"])
+    # Mesh node estimates
+    pd.testing.assert_frame_equal(
+        serial_results["mesh_results_df"], parallel_results["mesh_results_df"]
+    )
+    pd.testing.assert_frame_equal(
+        serial_results["mesh_results_df"], parallel_dense_results["mesh_results_df"]
+    )
+
+    # Test for invalid parallelization arguments
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        assert kriging(transect_data, mesh_data, {**settings_dict, "n_workers": 0})
+    # Test for an invalid neighbor search backend within the workers
+    with pytest.raises(ValueError, match="neighbor search method"):
+        assert kriging(
+            transect_data, mesh_data, {**settings_dict, "n_workers": 2, "neighbor_search": "octree"}
+        )
+
+
+def test_apply_kriging_weights(kriging_data):
+
+    # Get the mock data
+    transect_data, mesh_data, settings_dict = kriging_data
+
+    # Evaluate `kriging` and return the weight operator
+    kriged_results = kriging(transect_data, mesh_data, {**settings_dict, "return_weights": True})
+    # ---- Get the operator
+    weight_operator = kriged_results["weight_operator"]
+
+    # Re-krige the same variable using the weight operator
+    eval_kriged_values = apply_kriging_weights(
+        weight_operator, transect_data["biomass_density"].to_numpy()
+    )
+
+    # Krige several variables at once
+    variable_matrix = np.column_stack(
+        [transect_data["biomass_density"].to_numpy(), 2.0 * transect_data["biomass_density"]]
+    )
+    eval_kriged_matrix = apply_kriging_weights(weight_operator, variable_matrix)
+
+    # --------------------------
+    # Test for type and shape
+    # --------------------------
+    assert weight_operator["weights"].format == "csr"
+    assert weight_operator["weights"].shape == (len(mesh_data), len(transect_data))
+    assert eval_kriged_values.shape == (len(mesh_data), 3)
+    assert eval_kriged_matrix.shape == (len(mesh_data), 3, 2)
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Point estimate, kriged variance, and sample variance
+    mesh_results = kriged_results["mesh_results_df"]
+    assert np.allclose(eval_kriged_values[:, 0], mesh_results["kriged_mean"])
+    assert np.allclose(eval_kriged_values[:, 1], mesh_results["kriged_variance"])
+    assert np.allclose(eval_kriged_values[:, 2], mesh_results["sample_variance"], equal_nan=True)
+    # The operator is linear
+    assert np.allclose(eval_kriged_matrix[:, 0, 0], eval_kriged_values[:, 0])
+    assert np.allclose(eval_kriged_matrix[:, 0, 1], 2.0 * eval_kriged_values[:, 0])
+    # The sample CV is scale-invariant
+    assert np.allclose(eval_kriged_matrix[:, 2, 1], eval_kriged_values[:, 2], equal_nan=True)
+
+
+def test_multiple_variable_kriging(kriging_data):
+
+    # Get the mock data
+    transect_data, mesh_data, settings_dict = kriging_data
+    # ---- Add a second variable
+    transect_data = transect_data.assign(nasc=np.sqrt(transect_data["biomass_density"]))
+
+    # Evaluate `kriging` for each variable separately
+    biomass_results = kriging(transect_data, mesh_data, settings_dict)
+    nasc_results = kriging(transect_data, mesh_data, {**settings_dict, "variable": "nasc"})
+
+    # Evaluate `kriging` for both variables at once
+    multiple_results = kriging(
+        transect_data, mesh_data, {**settings_dict, "variable": ["biomass_density", "nasc"]}
+    )
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # The first variable populates the default columns
+    assert multiple_results["variable"] == "biomass_density"
+    pd.testing.assert_frame_equal(
+        biomass_results["mesh_results_df"],
+        multiple_results["mesh_results_df"][biomass_results["mesh_results_df"].columns],
+    )
+    # Variable-specific columns and survey-wide results
+    for name, results in {"biomass_density": biomass_results, "nasc": nasc_results}.items():
+        for column in ["kriged_mean", "sample_variance", "sample_cv"]:
+            assert np.allclose(
+                multiple_results["mesh_results_df"][f"{name}_{column}"],
+                results["mesh_results_df"][column],
+                equal_nan=True,
+            )
+        for key in ["survey_mean", "survey_estimate", "survey_cv"]:
+            assert np.isclose(multiple_results["variables"][name][key], results[key])
+
+    # Variables whose names share a prefix with the mesh cell fractions or coordinates are retained
+    prefix_results = kriging(
+        transect_data.assign(fraction_adult=transect_data["nasc"], x_density=transect_data["nasc"]),
+        mesh_data,
+        {**settings_dict, "variable": ["biomass_density", "fraction_adult", "x_density"]},
+    )
+    for name in ["fraction_adult", "x_density"]:
+        assert np.allclose(
+            prefix_results["mesh_results_df"][f"{name}_sample_cv"],
+            nasc_results["mesh_results_df"]["sample_cv"],
+            equal_nan=True,
+        )
+    # ---- The mesh cell fractions and coordinates are dropped
+    assert not {"fraction_cell_in_polygon", "x", "y"} & set(prefix_results["mesh_results_df"])
+
+
+def test_local_variogram_evaluation(kriging_data):
+
+    # Get the mock settings
+    _, _, settings_dict = kriging_data
+
+    # Mock NaN-padded local range estimates
+    rng = np.random.default_rng(7)
+    test_range_grid = rng.uniform(0.0, 0.2, size=(50, 10))
+    test_range_grid[::3, 4:] = np.nan
+
+    # Evaluate `variogram` over the full range grid
+    eval_variogram = variogram(
+        distance_lags=test_range_grid, variogram_parameters=settings_dict["variogram_parameters"]
+    )
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Expected outcome (row-wise evaluation)
+    expected_variogram = np.apply_along_axis(
+        variogram, 1, test_range_grid, settings_dict["variogram_parameters"]
+    )
+    # Test
+    assert np.array_equal(eval_variogram, expected_variogram, equal_nan=True)
+
+
+def test_kriging_cross_validation(kriging_data):
+
+    # Get the mock data
+    transect_data, _, settings_dict = kriging_data
+    # ---- Add an isolated interval west of the first transect (tapered extrapolation)
+    transect_data = pd.concat(
+        [
+            transect_data,
+            pd.DataFrame(
+                {
+                    "transect_num": [1],
+                    "latitude": [34.0],
+                    "x": [-0.8],
+                    "y": [-0.5],
+                    "biomass_density": [5.0],
+                }
+            ),
+        ],
+        ignore_index=True,
+    )
+
+    # Evaluate `kriging_cross_validation`
+    eval_results = kriging_cross_validation(transect_data, settings_dict)
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Expected outcome (kriging each left-out interval from the remaining transect intervals)
+    # ---- Western extent, interior, eastern end, and isolated intervals
+    test_positions = [20, 105, 119, len(transect_data) - 1]
+    expected_values = []
+    for i in test_positions:
+        # ---- Krige a single-node mesh at the left-out interval (the isolated interval is 0.0)
+        with np.errstate(divide="ignore"):
+            kriged_results = kriging(
+                transect_data.drop(index=i).reset_index(drop=True),
+                transect_data.iloc[[i]][["x", "y"]].assign(fraction_cell_in_polygon=1.0),
+                settings_dict,
+            )
+        expected_values.append(
+            kriged_results["mesh_results_df"][["kriged_mean", "kriged_variance"]].to_numpy()[0]
+        )
+    expected_values = np.array(expected_values)
+    # Test
+    cross_validation_df = eval_results["cross_validation_df"]
+    assert np.allclose(cross_validation_df["predicted"].iloc[test_positions], expected_values[:, 0])
+    assert np.allclose(
+        cross_validation_df["kriged_variance"].iloc[test_positions], expected_values[:, 1]
+    )
+    # ---- Residuals and summary statistics
+    z = transect_data["biomass_density"].to_numpy()
+    residuals = z - cross_validation_df["predicted"].to_numpy()
+    assert np.allclose(cross_validation_df["residual"], residuals)
+    assert np.isclose(eval_results["rmse"], np.sqrt(np.mean(residuals**2)))
+    assert np.allclose(
+        cross_validation_df["standardized_error"],
+        residuals / np.sqrt(cross_validation_df["kriged_variance"] * np.var(z)),
+    )
+
+
+def test_float32_kriging(kriging_data):
+
+    # Get the mock data
+    transect_data, mesh_data, settings_dict = kriging_data
+
+    # Evaluate `kriging` in double precision
+    float64_results = kriging(transect_data, mesh_data, settings_dict)
+
+    # Evaluate `kriging` in single precision
+    float32_results = kriging(
+        transect_data, mesh_data, {**settings_dict, "precision": "float32", "return_weights": True}
+    )
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Survey-wide estimates
+    assert np.isclose(
+        float32_results["survey_estimate"], float64_results["survey_estimate"], rtol=1e-3
+    )
+    assert np.isclose(float32_results["survey_cv"], float64_results["survey_cv"], rtol=1e-3)
+    # The weights are stored in double precision
+    assert float32_results["weight_operator"]["weights"].dtype == np.float64
+    assert float32_results["weight_operator"]["kriged_variance"].dtype == np.float64
+    # Accuracy report
+    precision_report = float32_results["precision_report"]
+    assert precision_report["n_nodes"] == len(mesh_data)
+    assert precision_report["survey_estimate"]["relative_error"] < 1e-3
+    assert precision_report["survey_cv"]["relative_error"] < 1e-3
+    assert np.isclose(
+        precision_report["survey_estimate"]["float64"], float64_results["survey_estimate"]
+    )
+    # ---- No report is produced in double precision
+    assert "precision_report" not in float64_results
+
+    # Test for invalid precision
+    with pytest.raises(ValueError, match="kriging precision"):
+        assert kriging(transect_data, mesh_data, {**settings_dict, "precision": "float16"})
+
+
+def test_mesh_cache(kriging_data, tmp_path):
+
+    # Get the mock data
+    transect_data, mesh_data, _ = kriging_data
+    # ---- Mock transect coordinates
+    transect_data = transect_data.assign(longitude=-123.0 + transect_data["x"])
+    # ---- Mock reference grid
+    isobath_data = pd.DataFrame(
+        {"longitude": np.linspace(-124.0, -123.5, 5), "latitude": np.linspace(34.0, 35.0, 5)}
+    )
+    # ---- Mock settings
+    settings_dict = {
+        "cropping_parameters": {"crop_method": "transect_ends", "num_nearest_transects": 4},
+        "extrapolate": False,
+        "standardize_coordinates": True,
+        "kriging_parameters": {
+            "longitude_reference": -124.78,
+            "longitude_offset": -124.78,
+            "latitude_offset": 45.0,
+        },
+    }
+
+    # Compute the cache keys
+    cache_key = mesh_cache_key(mesh_data, transect_data, isobath_data, settings_dict)
+    # ---- Same inputs
+    repeated_key = mesh_cache_key(mesh_data.copy(), transect_data, isobath_data, settings_dict)
+    # ---- Different cropping parameters
+    cropping_key = mesh_cache_key(
+        mesh_data,
+        transect_data,
+        isobath_data,
+        {**settings_dict, "cropping_parameters": {"crop_method": "convex_hull"}},
+    )
+    # ---- Different projection
+    projection_key = mesh_cache_key(
+        mesh_data, transect_data, isobath_data, {**settings_dict, "projection": "epsg:32610"}
+    )
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Cache keys
+    assert cache_key == repeated_key
+    assert cache_key != cropping_key
+    assert cache_key != projection_key
+    # Cache miss
+    assert load_cached_mesh(tmp_path, cache_key) is None
+    # Round-trip
+    save_cached_mesh(tmp_path, cache_key, mesh_data)
+    pd.testing.assert_frame_equal(load_cached_mesh(tmp_path, cache_key), mesh_data)
+    # Least-recently-used eviction
+    cache_size = (tmp_path / f"mesh_{cache_key}.npz").stat().st_size
+    save_cached_mesh(tmp_path, cropping_key, mesh_data, max_cache_size=1.5 * cache_size)
+    assert load_cached_mesh(tmp_path, cache_key) is None
+    assert load_cached_mesh(tmp_path, cropping_key) is not None
+    # ---- The newest file is retained even when it alone exceeds the limit
+    with pytest.warns(UserWarning, match="exceeds the maximum cache size"):
+        save_cached_mesh(tmp_path, cache_key, mesh_data, max_cache_size=0.5 * cache_size)
+    assert load_cached_mesh(tmp_path, cache_key) is not None
+    assert load_cached_mesh(tmp_path, cropping_key) is None
+
+
+def test_incremental_kriging(kriging_data):
+
+    # Get the mock data
+    transect_data, mesh_data, settings_dict = kriging_data
+
+    # Evaluate `kriging` before the last transect is appended
+    previous_results = kriging(
+        transect_data.iloc[:180], mesh_data, {**settings_dict, "return_weights": True}
+    )
+
+    # Evaluate `kriging` incrementally
+    incremental_results = kriging(
+        transect_data,
+        mesh_data,
+        {
+            **settings_dict,
+            "previous_weight_operator": previous_results["weight_operator"],
+            "return_weights": True,
+        },
+    )
+
+    # Evaluate `kriging` from scratch
+    full_results = kriging(transect_data, mesh_data, settings_dict)
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Only a subset of the mesh nodes are re-solved
+    updated_nodes = incremental_results["weight_operator"]["updated_nodes"]
+    assert 0 < len(updated_nodes) < len(mesh_data)
+    # Survey-wide estimates
+    assert np.isclose(incremental_results["survey_estimate"], full_results["survey_estimate"])
+    assert np.isclose(incremental_results["survey_cv"], full_results["survey_cv"])
+    # Mesh node estimates
+    pd.testing.assert_frame_equal(
+        incremental_results["mesh_results_df"], full_results["mesh_results_df"]
+    )
+
+    # Every mesh node is re-solved when the previous transect coordinates have changed
+    shifted_results = kriging(
+        transect_data.assign(x=transect_data["x"] * 1.01),
+        mesh_data,
+        {
+            **settings_dict,
+            "previous_weight_operator": previous_results["weight_operator"],
+            "return_weights": True,
+        },
+    )
+    assert len(shifted_results["weight_operator"]["updated_nodes"]) == len(mesh_data)
+
+    # Every mesh node is re-solved when the settings that determine the weights have changed
+    for changed_settings in [
+        {
+            "variogram_parameters": {
+                **settings_dict["variogram_parameters"],
+                "nugget": 0.1,
+                "correlation_range": 0.08,
+            }
+        },
+        {"kriging_parameters": {**settings_dict["kriging_parameters"], "kmax": 5}},
+        {"solver": "lu"},
+    ]:
+        changed_results = kriging(
+            transect_data,
+            mesh_data,
+            {
+                **settings_dict,
+                **changed_settings,
+                "previous_weight_operator": previous_results["weight_operator"],
+                "return_weights": True,
+            },
+        )
+        expected_results = kriging(transect_data, mesh_data, {**settings_dict, **changed_settings})
+        assert len(changed_results["weight_operator"]["updated_nodes"]) == len(mesh_data)
+        assert np.isclose(changed_results["survey_estimate"], expected_results["survey_estimate"])
+
+
+def test_mesh_bounds_join():
+
+    # Mock mesh data
+    rng = np.random.default_rng(5)
+    test_mesh_data = pd.DataFrame(
+        {"longitude": rng.uniform(-125.0, -120.0, 2000), "latitude": rng.uniform(34.0, 48.0, 2000)}
+    )
+    # ---- Add values that fall exactly on the bounds
+    test_mesh_data.loc[:9, "latitude"] = 40.0
+    test_mesh_data.loc[10:19, "longitude"] = -122.0
+
+    # Mock bounding boxes
+    test_latitude = np.linspace(34.0, 48.0, 50)
+    test_longitude_lower = rng.uniform(-125.0, -122.0, 50)
+    test_longitude_lower[[3, 17]] = np.nan
+    test_bounds = (
+        (test_longitude_lower, np.full(50, -122.0)),
+        (test_latitude - 0.25, np.where(test_latitude == 40.0, 40.0, test_latitude + 0.25)),
+    )
+
+    # Evaluate `mesh_bounds_join` for each search coordinate
+    latitude_indices = mesh_bounds_join(test_mesh_data, *test_bounds, "latitude")
+    longitude_indices = mesh_bounds_join(test_mesh_data, *test_bounds, "longitude")
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Expected outcome (full mesh scan for each bounding box)
+    expected_indices = np.concatenate(
+        [
+            np.where(
+                (test_mesh_data["longitude"] >= test_bounds[0][0][i])
+                & (test_mesh_data["longitude"] <= test_bounds[0][1][i])
+                & (test_mesh_data["latitude"] >= test_bounds[1][0][i])
+                & (test_mesh_data["latitude"] < test_bounds[1][1][i])
+            )[0]
+            for i in range(50)
+        ]
+    )
+    # Test
+    assert np.array_equal(np.unique(latitude_indices), np.unique(expected_indices))
+    assert np.array_equal(np.unique(longitude_indices), np.unique(expected_indices))
+
+
+def test_hull_crop_method():
+
+    # Mock transect data
+    rng = np.random.default_rng(11)
+    test_transect_data = pd.DataFrame(
+        {
+            "transect_num": np.repeat(np.arange(1, 9), 15),
+            "longitude": np.tile(np.linspace(-125.5, -124.0, 15), 8) + rng.normal(0.0, 0.01, 120),
+            "latitude": np.repeat(np.linspace(40.0, 42.0, 8), 15),
+        }
+    )
+
+    # Mock mesh data
+    mesh_longitude, mesh_latitude = np.meshgrid(
+        np.linspace(-126.5, -123.0, 60), np.linspace(39.5, 42.5, 50)
+    )
+    test_mesh_data = pd.DataFrame(
+        {"longitude": mesh_longitude.ravel(), "latitude": mesh_latitude.ravel()}
+    )
+
+    # Mock settings
+    test_settings = {
+        "num_nearest_transect": 3,
+        "mesh_buffer_distance": 2.5,
+        "projection": "epsg:4326",
+    }
+
+    # Evaluate `hull_crop_method`
+    eval_mesh = hull_crop_method(test_transect_data, test_mesh_data, test_settings)
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Expected outcome (GeoDataFrame reprojection and point-wise predicate)
+    mesh_gdf = gpd.GeoDataFrame(
+        test_mesh_data,
+        geometry=gpd.points_from_xy(test_mesh_data["longitude"], test_mesh_data["latitude"]),
+        crs="epsg:4326",
+    )
+    wgs84_to_utm(mesh_gdf)
+    survey_polygon = transect_extent(test_transect_data, "epsg:4326", 3).buffer(2.5 * 1852)
+    expected_mesh = test_mesh_data[mesh_gdf.geometry.within(survey_polygon)]
+    # Test
+    assert 0 < len(eval_mesh) < len(test_mesh_data)
+    pd.testing.assert_frame_equal(eval_mesh, expected_mesh)
+
+
+def test_transect_extent():
 
-    # Evaluate `kriging_matrix`
-    eval_kriging_matrix = kriging_matrix(
-        test_x_coordinates, test_y_coordinates, test_variogram_parameters
+    # Mock transect data
+    rng = np.random.default_rng(13)
+    test_transect_data = pd.DataFrame(
+        {
+            "transect_num": np.repeat(np.arange(1, 21), 10),
+            "longitude": np.tile(np.linspace(-125.5, -124.0, 10), 20) + rng.normal(0.0, 0.05, 200),
+            "latitude": np.repeat(np.linspace(38.0, 44.0, 20), 10) + rng.normal(0.0, 0.01, 200),
+        }
+    )
+
+    # Evaluate `transect_extent`
+    eval_polygon = transect_extent(test_transect_data, "epsg:4326", 3)
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Expected outcome (pairwise centroid distances and per-transect convex hulls)
+    transect_gdf = gpd.GeoDataFrame(
+        test_transect_data,
+        geometry=gpd.points_from_xy(
+            test_transect_data["longitude"], test_transect_data["latitude"]
+        ),
+        crs="epsg:4326",
+    )
+    wgs84_to_utm(transect_gdf)
+    centroids = transect_gdf.groupby("transect_num")["geometry"].apply(
+        lambda g: g.union_all().centroid
+    )
+    expected_polygons = []
+    for transect in centroids.index:
+        distances = centroids.drop(transect).apply(lambda g: centroids[transect].distance(g))
+        members = np.append(distances.nsmallest(3).index, transect)
+        expected_polygons.append(
+            transect_gdf[transect_gdf["transect_num"].isin(members)].union_all().convex_hull
+        )
+    expected_polygon = gpd.GeoSeries(expected_polygons).union_all()
+    # Test
+    assert eval_polygon.symmetric_difference(expected_polygon).area < 1e-6 * expected_polygon.area
+
+
+def test_geodesic_distance():
+
+    # Mock coordinates
+    rng = np.random.default_rng(17)
+    test_longitude_1 = rng.uniform(-135.0, -120.0, 50)
+    test_latitude_1 = rng.uniform(32.0, 56.0, 50)
+    test_longitude_2 = test_longitude_1 + rng.uniform(-2.0, 2.0, 50)
+    test_latitude_2 = test_latitude_1 + rng.uniform(-0.5, 0.5, 50)
+
+    # Evaluate `geodesic_distance`
+    eval_distance = geodesic_distance(
+        test_longitude_1, test_latitude_1, test_longitude_2, test_latitude_2
     )
 
     # -----------------
     # Test for equality
     # -----------------
     # Expected outcome
-    expected_matrix = np.array(
+    expected_distance = np.array(
         [
-            [0.00000000, 4.14643112, 4.85428403, 4.97512428, 4.99575337, 1.00000000],
-            [4.14643112, 0.00000000, 4.14643112, 4.85428403, 4.97512428, 1.00000000],
-            [4.85428403, 4.14643112, 0.00000000, 4.14643112, 4.85428403, 1.00000000],
-            [4.97512428, 4.85428403, 4.14643112, 0.00000000, 4.14643112, 1.00000000],
-            [4.99575337, 4.97512428, 4.85428403, 4.14643112, 0.00000000, 1.00000000],
-            [1.00000000, 1.00000000, 1.00000000, 1.00000000, 1.00000000, 0.00000000],
+            geopy.distance.distance((lat_1, lon_1), (lat_2, lon_2)).nm
+            for lon_1, lat_1, lon_2, lat_2 in zip(
+                test_longitude_1, test_latitude_1, test_longitude_2, test_latitude_2
+            )
         ]
     )
+    # Test
+    assert eval_distance.shape == expected_distance.shape
+    assert np.allclose(eval_distance, expected_distance, rtol=1e-9, atol=1e-9)
+    # ---- Scalar broadcasting
+    eval_broadcast = geodesic_distance(-125.0, 40.0, np.array([-125.0, -124.0]), 40.0)
+    expected_broadcast = [0.0, geopy.distance.distance((40.0, -125.0), (40.0, -124.0)).nm]
+    assert np.allclose(eval_broadcast, expected_broadcast, rtol=1e-9, atol=1e-9)
+
+
+def test_coarsen_mesh(kriging_data):
 
+    # Get the mock data
+    _, mesh_data, _ = kriging_data
+
+    # Evaluate `coarsen_mesh` for each resolution level
+    pyramid = {level: coarsen_mesh(mesh_data, 2**level) for level in [1, 2, 3]}
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    for level, coarse_mesh in pyramid.items():
+        factor = 2**level
+        # ---- Number of coarse cells (30 x 20 mesh cells)
+        assert coarse_mesh["factor"] == factor
+        assert len(coarse_mesh["mesh_df"]) == int(np.ceil(30 / factor) * np.ceil(20 / factor))
+        # ---- The total area within the survey polygon is conserved
+        assert np.isclose(
+            coarse_mesh["mesh_df"]["fraction_cell_in_polygon"].sum() * factor**2,
+            mesh_data["fraction_cell_in_polygon"].sum(),
+        )
+        # ---- Coarse centroids are the fraction-weighted means of the member cells
+        expected_longitude = (
+            mesh_data["longitude"]
+            .mul(mesh_data["fraction_cell_in_polygon"])
+            .groupby(coarse_mesh["parent_index"])
+            .sum()
+            / mesh_data["fraction_cell_in_polygon"].groupby(coarse_mesh["parent_index"]).sum()
+        )
+        assert np.allclose(coarse_mesh["mesh_df"]["longitude"], expected_longitude)
+    # ---- Each coarse cell is the union of cells of the level below it
+    for level in [2, 3]:
+        parent_pairs = np.unique(
+            np.column_stack([pyramid[level - 1]["parent_index"], pyramid[level]["parent_index"]]),
+            axis=0,
+        )
+        assert len(parent_pairs) == len(pyramid[level - 1]["mesh_df"])
+
+    # Evaluate `block_neighbor_gradient`
+    block_index = pyramid[1]["block_index"]
+    test_values = np.random.default_rng(3).normal(size=len(block_index))
+    eval_gradient = block_neighbor_gradient(test_values, block_index)
+    # ---- Expected outcome (brute-force comparison against adjacent cells)
+    adjacent = np.abs(block_index[:, np.newaxis, :] - block_index[np.newaxis, :, :]).max(axis=2)
+    expected_gradient = np.where(
+        adjacent == 1, np.abs(test_values[:, np.newaxis] - test_values[np.newaxis, :]), 0.0
+    ).max(axis=1)
     # Test
-    assert np.allclose(eval_kriging_matrix, expected_matrix)
+    assert np.allclose(eval_gradient, expected_gradient)
+
+
+def test_coarsen_mesh_survey_grid(test_path):
+
+    # Load the 2.5 nmi survey mesh
+    pytest.importorskip("openpyxl")
+    mesh_data = pd.read_excel(
+        test_path["INPUT"]
+        / "Kriging_files"
+        / "Kriging_grid_files"
+        / "krig_grid2_5nm_cut_centroids_2013.xlsx"
+    )
+
+    # Evaluate `mesh_lattice_index`
+    lattice_index = mesh_lattice_index(mesh_data)
+
+    # Evaluate `coarsen_mesh` for each resolution level
+    pyramid = {level: coarsen_mesh(mesh_data, 2**level) for level in [1, 2, 3]}
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # The lattice indices match the grid cell numbering (243 columns per row)
+    expected_index = np.column_stack([mesh_data["ET_ID"] % 243, mesh_data["ET_ID"] // 243])
+    assert len(np.unique(lattice_index - expected_index, axis=0)) == 1
+    # Each coarse cell comprises at most `factor ** 2` mesh cells
+    for level, coarse_mesh in pyramid.items():
+        assert np.bincount(coarse_mesh["parent_index"]).max() <= 4**level
+        assert coarse_mesh["mesh_df"]["fraction_cell_in_polygon"].max() <= 1.0
+        # ---- The integer coarse cell ids are carried over
+        assert np.array_equal(
+            coarse_mesh["mesh_df"]["parent_id"], np.arange(len(coarse_mesh["mesh_df"]))
+        )
+
+
+def test_multiresolution_kriging(kriging_data):
+
+    # Get the mock data
+    transect_data, mesh_data, settings_dict = kriging_data
+
+    # Evaluate `multiresolution_kriging` without refining any coarse cells
+    coarse_results = multiresolution_kriging(
+        transect_data,
+        mesh_data,
+        {**settings_dict, "resolution_level": 1, "refinement": {"gradient": np.inf}},
+    )
+
+    # Evaluate `multiresolution_kriging` when every coarse cell is refined
+    refined_results = multiresolution_kriging(
+        transect_data,
+        mesh_data,
+        {**settings_dict, "resolution_level": 1, "refinement": {"kriged_variance": -np.inf}},
+    )
+
+    # Evaluate `kriging` at full resolution
+    full_results = kriging(transect_data, mesh_data, settings_dict)
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Without refinement, the survey estimate matches kriging at the coarse level
+    coarse_mesh = coarsen_mesh(mesh_data, 2)
+    expected_coarse_results = kriging(
+        transect_data,
+        coarse_mesh["mesh_df"],
+        {
+            **settings_dict,
+            "kriging_parameters": {**settings_dict["kriging_parameters"], "A0": 6.25 * 4},
+        },
+    )
+    assert coarse_results["refinement"]["n_refined_nodes"] == 0
+    assert np.isclose(coarse_results["survey_estimate"], expected_coarse_results["survey_estimate"])
+    assert np.allclose(
+        coarse_results["mesh_results_df"]["kriged_mean"],
+        expected_coarse_results["mesh_results_df"]["kriged_mean"].to_numpy()[
+            coarse_mesh["parent_index"]
+        ],
+        equal_nan=True,
+    )
+    # When every coarse cell is refined, the results match kriging at full resolution
+    assert refined_results["refinement"]["n_refined_nodes"] == len(mesh_data)
+    assert np.isclose(refined_results["survey_estimate"], full_results["survey_estimate"])
+    assert np.isclose(refined_results["survey_cv"], full_results["survey_cv"])
+    pd.testing.assert_frame_equal(
+        refined_results["mesh_results_df"].drop(columns="refined"), full_results["mesh_results_df"]
+    )
+
+
+def test_block_kriging(kriging_data):
+
+    # Get the mock data
+    transect_data, mesh_data, settings_dict = kriging_data
+
+    # Evaluate `block_discretization`
+    discretization = block_discretization(mesh_data, 9, settings_dict["variogram_parameters"])
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # The discretization points form a regular 3 x 3 grid centered on the cell centroid
+    cell_width, cell_height = discretization["cell_size"]
+    assert np.isclose(cell_width, 1.4 / 29) and np.isclose(cell_height, 1.2 / 19)
+    assert discretization["offsets"].shape == (9, 2)
+    assert np.allclose(discretization["offsets"].mean(axis=0), 0.0)
+    assert np.allclose(
+        np.unique(discretization["offsets"][:, 0]), [-cell_width / 3, 0.0, cell_width / 3]
+    )
+    # ---- Mean within-cell semivariogram
+    variogram_model = compile_variogram(settings_dict["variogram_parameters"])
+    expected_block_variance = np.mean(
+        [
+            variogram_model(np.array([np.linalg.norm(p - q)]))[0] if i != j else 0.0
+            for i, p in enumerate(discretization["offsets"])
+            for j, q in enumerate(discretization["offsets"])
+        ]
+    )
+    assert np.isclose(discretization["block_variance"], expected_block_variance)
+
+    # Evaluate `block_average_variogram`
+    rng = np.random.default_rng(21)
+    test_mesh = rng.uniform(-0.5, 0.5, (50, 2))
+    test_neighbors = rng.uniform(-0.5, 0.5, (50, 4, 2))
+    test_range = np.linalg.norm(test_neighbors - test_mesh[:, np.newaxis, :], axis=2)
+    test_range[::7, -1] = np.nan
+    eval_variogram = block_average_variogram(
+        test_mesh[:, 0],
+        test_mesh[:, 1],
+        test_neighbors[..., 0],
+        test_neighbors[..., 1],
+        test_range,
+        discretization["offsets"],
+        variogram_model,
+        chunk_size=16,
+    )
+    # ---- Expected outcome (average over the discretization points of each cell)
+    expected_variogram = np.array(
+        [
+            [
+                variogram_model(
+                    np.linalg.norm(
+                        test_neighbors[i, j] - (test_mesh[i] + discretization["offsets"]), axis=1
+                    )
+                ).mean()
+                for j in range(4)
+            ]
+            for i in range(50)
+        ]
+    )
+    expected_variogram[np.isnan(test_range)] = np.nan
+    # Test
+    assert np.allclose(eval_variogram, expected_variogram, equal_nan=True)
+
+    # A single discretization point at the centroid reduces to point kriging
+    point_results = kriging(transect_data, mesh_data, settings_dict)
+    block_results = kriging(transect_data, mesh_data, {**settings_dict, "block_points": 1})
+    pd.testing.assert_frame_equal(
+        block_results["mesh_results_df"], point_results["mesh_results_df"]
+    )
+    # ---- Block kriging over 16 points per cell
+    block_results = kriging(transect_data, mesh_data, {**settings_dict, "block_points": 16})
+    assert np.isfinite(block_results["survey_estimate"])
+    assert not np.allclose(
+        block_results["mesh_results_df"]["kriged_variance"],
+        point_results["mesh_results_df"]["kriged_variance"],
+    )
+
+    # ---- The block kriging variance is clipped at 0.0 (inflated within-cell semivariogram)
+    inflated_discretization = {
+        **block_discretization(mesh_data, 16, settings_dict["variogram_parameters"]),
+        "block_variance": 10.0,
+    }
+    with np.errstate(invalid="raise"):
+        clipped_results = kriging(
+            transect_data,
+            mesh_data,
+            {**settings_dict, "block_points": 16, "block_discretization": inflated_discretization},
+        )
+    clipped_mesh = clipped_results["mesh_results_df"]
+    assert np.all(clipped_mesh["kriged_variance"] == 0.0)
+    assert not clipped_mesh["sample_cv"].isna().any()
+
+    # Invalid number of discretization points
+    with pytest.raises(ValueError, match="discretization points"):
+        kriging(transect_data, mesh_data, {**settings_dict, "block_points": 8})
+
+
+def test_kriging_iter(kriging_data):
+
+    # Get the mock data
+    transect_data, mesh_data, settings_dict = kriging_data
+    transect_data = transect_data.assign(nasc=transect_data["biomass_density"] ** 0.5)
+    settings_dict = {
+        **settings_dict,
+        "variable": ["biomass_density", "nasc"],
+        "return_weights": True,
+    }
+
+    # Evaluate `kriging_iter`
+    chunk_operators = []
+    mesh_frames = list(kriging_iter(transect_data, mesh_data, settings_dict, 64, chunk_operators))
+
+    # Evaluate `kriging` with and without chunks
+    chunked_results = kriging(transect_data, mesh_data, {**settings_dict, "chunk_size": 64})
+    full_results = kriging(transect_data, mesh_data, settings_dict)
+
+    # -----------------
+    # Test for equality
+    # -----------------
+    # Chunks
+    assert [len(frame) for frame in mesh_frames] == [64] * 9 + [24]
+    assert len(chunk_operators) == 10
+    pd.testing.assert_frame_equal(
+        pd.concat(mesh_frames),
+        full_results["mesh_results_df"].drop(
+            columns=["sample_cv", "biomass_density_sample_cv", "nasc_sample_cv"]
+        ),
+    )
+    # Mesh node estimates
+    pd.testing.assert_frame_equal(
+        chunked_results["mesh_results_df"], full_results["mesh_results_df"]
+    )
+    # Survey-wide estimates
+    assert np.isclose(chunked_results["survey_estimate"], full_results["survey_estimate"])
+    assert np.isclose(chunked_results["survey_cv"], full_results["survey_cv"])
+    assert np.isclose(
+        chunked_results["variables"]["nasc"]["survey_cv"],
+        full_results["variables"]["nasc"]["survey_cv"],
+    )
+    # Weight operators
+    assert np.allclose(
+        chunked_results["weight_operator"]["weights"].toarray(),
+        full_results["weight_operator"]["weights"].toarray(),
+    )
+
+    # Invalid chunk size
+    with pytest.raises(ValueError, match="chunk_size"):
+        next(kriging_iter(transect_data, mesh_data, settings_dict, 0))
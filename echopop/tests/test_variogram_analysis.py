@@ -7,11 +7,19 @@ import pytest
 import echopop.spatial.variogram as esv
 from echopop.spatial.variogram import (
     VARIOGRAM_MODELS,
+    bin_head_moments,
+    compare_variogram_models,
+    dense_lag_statistics,
+    empirical_variogram,
     initialize_initial_optimization_values,
     initialize_optimization_config,
     initialize_variogram_parameters,
+    merge_head_moments,
+    multistart_optimize_variogram,
     optimize_variogram,
     prepare_variogram_matrices,
+    quantize_lag_pairs,
+    quantize_lag_tree,
     quantize_lags,
     semivariance,
     variogram_matrix_filter,
@@ -485,6 +493,111 @@ def test_quantize_lags(
         assert all([np.allclose(e, o) for (e, o) in zip(expected_tuple, output)])
 
 
+@pytest.mark.parametrize("azimuth_range", [360.0, 90.0], ids=["Omnidirectional", "Directional"])
+@pytest.mark.parametrize("block_size", [1, 7, 1024], ids=["Single row", "Partial", "Full"])
+def test_quantize_lag_pairs(azimuth_range, block_size):
+
+    # -------------------------
+    # Mock inputs
+    rng = np.random.default_rng(99)
+    n_points = 60
+    transect_data = pd.DataFrame(
+        {
+            "x": rng.uniform(-0.5, 0.5, size=n_points),
+            "y": rng.uniform(-0.5, 0.5, size=n_points),
+            "biomass": rng.uniform(0.0, 10.0, size=n_points),
+        }
+    )
+    # ---- Add a coincident point
+    transect_data.loc[10, ["x", "y"]] = transect_data.loc[0, ["x", "y"]]
+    # ---- Variogram parameters
+    variogram_parameters = {
+        "lag_resolution": 0.05,
+        "n_lags": 12,
+        "distance_lags": np.arange(1, 12) * 0.05,
+        "azimuth_range": azimuth_range,
+        "force_lag_zero": True,
+    }
+
+    # -------------------------
+    # Evaluate [ TUPLE ]
+    estimates = transect_data["biomass"].to_numpy()
+    # ---- Dense reference
+    expected = dense_lag_statistics(estimates, transect_data, variogram_parameters)
+    # ---- Chunked
+    output = quantize_lag_pairs(
+        estimates,
+        transect_data["x"].to_numpy(),
+        transect_data["y"].to_numpy(),
+        block_size=block_size,
+        **variogram_parameters,
+    )
+
+    # -------------------------
+    # ASSERT
+    # ---- Same shapes
+    assert all([e.shape == o.shape for (e, o) in zip(expected, output)])
+    # ---- Identical lag and head counts
+    assert np.array_equal(expected[0], output[0])
+    assert np.array_equal(expected[-1][0], output[-1][0])
+    # ---- Equal sums
+    assert all([np.allclose(e, o) for (e, o) in zip(expected[1:], output[1:])])
+
+    # -------------------------
+    # Evaluate [ TUPLE ] AND ASSERT
+    # ---- Compute the empirical variogram with each engine
+    dense_output = empirical_variogram(
+        transect_data, variogram_parameters, {"variable": "biomass", "pair_engine": "dense"}
+    )
+    chunked_output = empirical_variogram(
+        transect_data,
+        variogram_parameters,
+        {"variable": "biomass", "pair_engine": "chunked", "block_size": block_size},
+    )
+    # ---- Identical lags and lag counts
+    assert np.array_equal(dense_output[0], chunked_output[0])
+    assert np.array_equal(dense_output[2], chunked_output[2])
+    # ---- Equal semivariance and mean lag covariance
+    assert np.allclose(dense_output[1], chunked_output[1], equal_nan=True)
+    assert np.isclose(dense_output[3], chunked_output[3])
+
+    # -------------------------
+    # Evaluate [ TUPLE ] AND ASSERT
+    # ---- KD-tree
+    tree_output = quantize_lag_tree(
+        estimates,
+        transect_data["x"].to_numpy(),
+        transect_data["y"].to_numpy(),
+        **variogram_parameters,
+    )
+    assert all([e.shape == o.shape for (e, o) in zip(expected, tree_output)])
+    assert np.array_equal(expected[0], tree_output[0])
+    assert np.array_equal(expected[-1][0], tree_output[-1][0])
+    assert all([np.allclose(e, o) for (e, o) in zip(expected[1:], tree_output[1:])])
+    # ---- Empirical variogram
+    tree_variogram = empirical_variogram(
+        transect_data, variogram_parameters, {"variable": "biomass", "pair_engine": "kdtree"}
+    )
+    assert np.array_equal(dense_output[2], tree_variogram[2])
+    assert np.allclose(dense_output[1], tree_variogram[1], equal_nan=True)
+    assert np.isclose(dense_output[3], tree_variogram[3])
+
+    # -------------------------
+    # ASSERT [ ValueError ]
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        quantize_lag_pairs(
+            estimates,
+            transect_data["x"].to_numpy(),
+            transect_data["y"].to_numpy(),
+            block_size=0,
+            **variogram_parameters,
+        )
+    with pytest.raises(ValueError, match="must either be 'chunked', 'dense', or 'kdtree'"):
+        empirical_variogram(
+            transect_data, variogram_parameters, {"variable": "biomass", "pair_engine": "invalid"}
+        )
+
+
 @pytest.fixture
 def optimize_variogram_data():
 
@@ -791,6 +904,148 @@ def test_optimize_variogram(parameterization, expected_optimize_variogram, optim
             # assert np.isclose(optimized_fit[2], comparison["optimized_fit"][2], atol=1e-4)
 
 
+def test_multistart_optimize_variogram():
+
+    # -------------------------
+    # Mock the empirical variogram
+    lags = np.linspace(0.0, 0.3, 31)
+    gamma_h = esv.exponential(lags, sill=1.0, nugget=0.1, correlation_range=0.05)
+    lag_counts = np.linspace(100, 400, lags.size).astype(int)
+
+    # -------------------------
+    # Initialize the variogram and optimization parameters
+    valid_variogram_params = initialize_variogram_parameters(
+        {"model": "exponential", "lag_resolution": 0.01, "n_lags": 30},
+        {"sill": 0.5, "nugget": 0.0, "correlation_range": 0.5},
+    )
+    optimization_settings = {
+        "parameters": initialize_initial_optimization_values(
+            ["correlation_range", "nugget", "sill"], valid_variogram_params
+        ),
+        "config": initialize_optimization_config({}),
+    }
+
+    # -------------------------
+    # Evaluate [ TUPLE ]
+    _, single_initial_fit, single_optimized_fit = optimize_variogram(
+        lag_counts, lags, gamma_h, optimization_settings, **valid_variogram_params
+    )
+    best_fit_variogram, initial_fit, optimized_fit, solutions = multistart_optimize_variogram(
+        lag_counts,
+        lags,
+        gamma_h,
+        optimization_settings,
+        n_starts=5,
+        global_search=True,
+        random_state=99,
+        **valid_variogram_params,
+    )
+
+    # -------------------------
+    # ASSERT
+    # ---- Identical initial fit
+    assert initial_fit[0] == single_initial_fit[0]
+    assert np.isclose(initial_fit[2], single_initial_fit[2])
+    # ---- One solution per starting point
+    start_types = ["initial"] + ["latin_hypercube"] * 4 + ["differential_evolution"]
+    assert list(solutions["start_type"]) == start_types
+    # ---- The best fit corresponds to the lowest least-squares cost (MAD is reported)
+    best_solution = solutions.loc[solutions["cost"].idxmin()]
+    assert np.isclose(optimized_fit[2], best_solution["MAD"])
+    assert all(
+        np.isclose(best_fit_variogram[name], best_solution[name]) for name in optimized_fit[0]
+    )
+    assert best_solution["cost"] <= solutions["cost"].iloc[0] + 1e-12
+    # ---- The initial starting point reproduces the single fit
+    assert np.isclose(solutions["MAD"].iloc[0], single_optimized_fit[2])
+    assert set(best_fit_variogram) == set(optimized_fit[0])
+
+    # -------------------------
+    # ASSERT [ ValueError ]
+    with pytest.raises(ValueError, match="Argument `n_starts` must be a positive integer"):
+        multistart_optimize_variogram(
+            lag_counts, lags, gamma_h, optimization_settings, n_starts=0, **valid_variogram_params
+        )
+
+
+def test_compare_variogram_models():
+
+    # -------------------------
+    # Mock the empirical variogram
+    lags = np.linspace(0.0, 0.3, 31)
+    gamma_h = esv.exponential(lags, sill=1.0, nugget=0.1, correlation_range=0.05)
+    gamma_h = gamma_h + np.random.default_rng(99).normal(0.0, 0.01, size=lags.size)
+    lag_counts = np.linspace(100, 400, lags.size).astype(int)
+
+    # -------------------------
+    # Mock the variogram parameters
+    default_variogram_parameters = {
+        "n_lags": 30,
+        "lag_resolution": 0.01,
+        "sill": 0.5,
+        "nugget": 0.0,
+        "correlation_range": 0.5,
+        "hole_effect_range": 0.0,
+        "decay_power": 1.5,
+    }
+    initialize_variogram = ["correlation_range", "nugget", "sill"]
+    models = ["exponential", "gaussian", ["bessel", "exponential"]]
+
+    # -------------------------
+    # Evaluate [ DATAFRAME ]
+    comparison = compare_variogram_models(
+        lag_counts,
+        lags,
+        gamma_h,
+        {},
+        default_variogram_parameters,
+        initialize_variogram,
+        initialize_optimization_config({}),
+        models=models,
+    )
+
+    # -------------------------
+    # ASSERT
+    # ---- One ranked row per model
+    assert len(comparison) == len(models)
+    assert list(comparison["rank"]) == [1, 2, 3]
+    # ---- Sorted by AIC
+    assert comparison["AIC"].is_monotonic_increasing
+    # ---- Metrics and parameters
+    assert {"model", "n_parameters", "MAD", "AIC", "BIC", "sill", "nugget"}.issubset(comparison)
+    assert set(comparison["n_parameters"]) == {3}
+    # ---- BIC penalty exceeds the AIC penalty for the same number of parameters
+    assert np.allclose(
+        comparison["BIC"] - comparison["AIC"], 3 * (np.log(lags.size) - 2), atol=1e-8
+    )
+
+    # -------------------------
+    # Evaluate [ DATAFRAME ] AND ASSERT
+    comparison_mad = compare_variogram_models(
+        lag_counts,
+        lags,
+        gamma_h,
+        {},
+        default_variogram_parameters,
+        initialize_variogram,
+        initialize_optimization_config({}),
+        models=models,
+        rank_by="MAD",
+    )
+    assert comparison_mad["MAD"].is_monotonic_increasing
+
+    # -------------------------
+    # ASSERT [ ValueError, LookupError ]
+    with pytest.raises(ValueError, match="must either be 'AIC', 'BIC', or 'MAD'"):
+        compare_variogram_models(
+            lag_counts, lags, gamma_h, {}, default_variogram_parameters, [], {}, rank_by="R2"
+        )
+    with pytest.raises(LookupError, match="could not be matched"):
+        compare_variogram_models(
+            lag_counts, lags, gamma_h, {}, default_variogram_parameters, [], {}, models=["invalid"]
+        )
+
+
 @pytest.fixture
 def semivariance_data():
 
@@ -953,3 +1208,98 @@ def test_semivariance(test_name, semivariance_data, expected_semivariance):
 
         # Assert value equality
         assert [np.array_equal(e, o, equal_nan=True) for (e, o) in zip(expected_tuple, output_tpl)]
+
+
+def test_semivariance_head_moments(semivariance_data):
+
+    # -------------------------
+    # Get the input parameters
+    _, lag_estimates, lag_estimates_squared, lag_counts, lag_deviations, head_index = (
+        semivariance_data["standard_inputs"]
+    )
+    # ---- Mock variable estimates
+    estimates = np.random.default_rng(99).uniform(0.0, 10.0, size=head_index.shape[0])
+    # ---- Compute the head moments
+    head_counts = head_index.sum(axis=0)
+    head_sums = estimates @ head_index
+    head_moments = np.stack(
+        [
+            head_counts,
+            head_sums,
+            ((estimates[:, np.newaxis] - head_sums / head_counts) ** 2 * head_index).sum(axis=0),
+        ]
+    )
+
+    # -------------------------
+    # Compute the expected head statistics from the dense head indices
+    head_weights = head_index / lag_counts
+    mean_head = (estimates[:, np.newaxis] * head_weights).sum(axis=0)
+    sigma_head = np.sqrt(((estimates[:, np.newaxis] - mean_head) ** 2 * head_weights).sum(axis=0))
+    # ---- Tail statistics
+    lag_means = lag_estimates / lag_counts
+    sigma_tail = np.sqrt(np.abs(lag_estimates_squared / lag_counts - lag_means**2))
+    # ---- Semivariance
+    expected_gamma_h = 0.5 * lag_deviations / (lag_counts * sigma_tail * sigma_head)
+
+    # -------------------------
+    # Evaluate [ TUPLE ]
+    gamma_h_index, _ = semivariance(
+        estimates, lag_estimates, lag_estimates_squared, lag_counts, lag_deviations, head_index
+    )
+    gamma_h_moments, _ = semivariance(
+        estimates,
+        lag_estimates,
+        lag_estimates_squared,
+        lag_counts,
+        lag_deviations,
+        head_moments=head_moments,
+    )
+
+    # -------------------------
+    # ASSERT
+    assert np.allclose(gamma_h_index, expected_gamma_h)
+    assert np.allclose(gamma_h_moments, expected_gamma_h)
+    # ---- Missing head inputs
+    with pytest.raises(ValueError, match="Either 'head_index' or 'head_moments'"):
+        semivariance(estimates, lag_estimates, lag_estimates_squared, lag_counts, lag_deviations)
+
+
+def test_bin_head_moments():
+
+    # -------------------------
+    # Mock pairs with a large mean relative to their spread
+    rng = np.random.default_rng(7)
+    pair_lags = rng.integers(0, 5, size=2000)
+    head_estimates = 1e6 + rng.normal(0.0, 1e-2, size=2000)
+
+    # -------------------------
+    # Compute the expected moments per lag bin
+    expected_moments = np.stack(
+        [
+            [(pair_lags == lag).sum() for lag in range(5)],
+            [head_estimates[pair_lags == lag].sum() for lag in range(5)],
+            [
+                (
+                    (head_estimates[pair_lags == lag] - head_estimates[pair_lags == lag].mean())
+                    ** 2
+                ).sum()
+                for lag in range(5)
+            ],
+        ]
+    )
+
+    # -------------------------
+    # Evaluate [ ARRAY ]
+    head_moments = bin_head_moments(head_estimates, pair_lags, 5)
+    # ---- Merge the moments of two disjoint halves
+    merged_moments = merge_head_moments(
+        bin_head_moments(head_estimates[:700], pair_lags[:700], 5),
+        bin_head_moments(head_estimates[700:], pair_lags[700:], 5),
+    )
+
+    # -------------------------
+    # ASSERT
+    assert np.allclose(head_moments, expected_moments, rtol=1e-6)
+    assert np.allclose(merged_moments, expected_moments, rtol=1e-6)
+    # ---- Centered sums of squares are non-negative
+    assert np.all(head_moments[2] >= 0.0)
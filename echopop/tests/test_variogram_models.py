@@ -1,9 +1,11 @@
 import numpy as np
 
 from echopop.spatial.variogram import (
+    VARIOGRAM_MODEL_REGISTRY,
     VARIOGRAM_MODELS,
     bessel_exponential,
     bessel_gaussian,
+    compile_variogram,
     cosine_exponential,
     cosine_gaussian,
     exponential,
@@ -900,3 +902,50 @@ def test_variogram():
         indirect_function = variogram(MOCK_LAGS, model=model, variogram_parameters=SUB_PARAMETERS)
         # ---- ASSERT
         assert np.allclose(direct_function, indirect_function)
+
+
+def test_compile_variogram():
+
+    # -------------------------
+    # Mock values
+    # ---- Distance lags
+    MOCK_LAGS = np.linspace(0.00, 1.00, 6)
+    # ---- PARAMETER dictionary
+    PARAMETERS = {
+        "model": ["Exponential", "Bessel"],
+        "sill": 1.00,
+        "nugget": 0.10,
+        "correlation_range": 0.20,
+        "hole_effect_range": 0.10,
+        "decay_power": 1.5,
+        "enhance_semivariance": False,
+    }
+
+    # -------------------------
+    # Evaluate
+    # ---- Compile the model
+    variogram_model = compile_variogram(PARAMETERS)
+    # ---- Compile the model from keyword arguments
+    variogram_model_kwargs = compile_variogram(
+        model="exponential", sill=1.00, nugget=0.10, correlation_range=0.20
+    )
+
+    # -------------------------
+    # Assert
+    # ---- The model is resolved to a registered entry
+    assert ("bessel", "exponential") in VARIOGRAM_MODEL_REGISTRY
+    # ---- Only the model parameters are bound
+    assert variogram_model.func is bessel_exponential
+    assert set(variogram_model.keywords) == {
+        "sill",
+        "nugget",
+        "correlation_range",
+        "hole_effect_range",
+        "decay_power",
+    }
+    # ---- Equivalence with the `variogram` wrapper
+    assert np.allclose(variogram_model(MOCK_LAGS), variogram(MOCK_LAGS, PARAMETERS))
+    assert np.allclose(
+        variogram_model_kwargs(MOCK_LAGS),
+        exponential(MOCK_LAGS, sill=1.00, nugget=0.10, correlation_range=0.20),
+    )
@@ -236,6 +236,39 @@ def variogram_results_msg(variogram_dict: dict) -> None:
     )
 
 
+def variogram_comparison_msg(comparison: pd.DataFrame, rank_by: str) -> None:
+
+    # Format the model names
+    model_names = [
+        "-".join(model) if isinstance(model, (list, tuple)) else model
+        for model in comparison["model"]
+    ]
+
+    # Create a list of strings that will be joined in an output message
+    message_lst = [
+        f"{rank}. {name}: MAD = {'{:.3}'.format(mad)}, AIC = {'{:.4}'.format(aic)}, "
+        f"BIC = {'{:.4}'.format(bic)}"
+        for rank, name, mad, aic, bic in zip(
+            comparison["rank"], model_names, comparison["MAD"], comparison["AIC"], comparison["BIC"]
+        )
+    ]
+    # ---- Expand the list to be joined across multiple lines
+    message_joined = "\n".join(value for value in message_lst)
+
+    # Print output message
+    print(
+        f"-----------------------------\n"
+        f"VARIOGRAM MODEL COMPARISON\n"
+        f"-----------------------------\n"
+        f"| Models ranked by: {rank_by}\n"
+        f"-----------------------------\n"
+        f"{message_joined}\n"
+        f"-----------------------------\n"
+        f"| Results stored in `self.results['variogram_comparison']\n"
+        f"-----------------------------"
+    )
+
+
 def kriging_results_msg(kriging_results_dict: pd.DataFrame, settings_dict: dict) -> None:
 
     # Extract dictionary results
@@ -278,3 +311,31 @@ def kriging_results_msg(kriging_results_dict: pd.DataFrame, settings_dict: dict)
         f"{np.round(kriging_mesh_results['mesh_results_df']['area'].sum(), 1)} nmi^2\n"
         f"--------------------------------"
     )
+
+
+def kriging_cross_validation_msg(cross_validation_dict: dict, settings_dict: dict) -> None:
+
+    # Extract the kriging parameters
+    kriging_parameters = settings_dict["kriging_parameters"]
+
+    # Generate message output
+    return print(
+        f"--------------------------------\n"
+        f"KRIGING CROSS-VALIDATION (LEAVE-ONE-OUT)\n"
+        f"--------------------------------\n"
+        f"| Cross-validated variable: "
+        f"{settings_dict['variable'].replace('_', ' ').capitalize()}\n"
+        f"| Variogram model: {settings_dict['variogram_parameters'].get('model')}\n"
+        f"| Neighbors (kmin, kmax): ({kriging_parameters['kmin']}, {kriging_parameters['kmax']})\n"
+        f"| Search radius: {kriging_parameters['search_radius']}\n"
+        f"--------------------------------\n"
+        f"GENERAL RESULTS\n"
+        f"--------------------------------\n"
+        f"| Transect intervals: {len(cross_validation_dict['cross_validation_df'])}\n"
+        f"| RMSE: {np.round(cross_validation_dict['rmse'], 4)}\n"
+        f"| Mean error: {np.round(cross_validation_dict['mean_error'], 4)}\n"
+        f"| Mean standardized error: "
+        f"{np.round(cross_validation_dict['mean_standardized_error'], 4)}\n"
+        f"| Standardized RMSE: {np.round(cross_validation_dict['standardized_rmse'], 4)}\n"
+        f"--------------------------------"
+    )